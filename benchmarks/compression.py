@@ -0,0 +1,65 @@
+"""
+Compares packets per second and compression ratio of outbound packets just above the compression threshold with
+zlib.compress at the default level and with the client compression settings.
+
+Run from the repository root:
+    python -m benchmarks.compression
+"""
+
+import time
+import zlib
+
+from minemind.client import FAST_COMPRESSION, NO_COMPRESSION, Client, CompressionSettings
+from minemind.mc_types import Long, String, VarInt
+from minemind.protocols.v765.outbound.play import ChatMessageRequest
+
+PACKETS = 20_000
+THRESHOLD = 256
+
+
+def build_packets() -> list[tuple[ChatMessageRequest, bytes]]:
+    packets = []
+    for i in range(16):
+        message = f'Bot {i} is at {i * 17 % 1000} 64 {i * 31 % 1000}, heading to the base near the river'
+        event = ChatMessageRequest(message=String(message * (5 + i % 3)), timestamp=Long(0), message_count=VarInt(0))
+        data = bytes(VarInt(event.packet_id)) + event.payload
+        assert len(data) >= THRESHOLD
+        packets.append((event, data))
+    return packets
+
+
+def bench_zlib(packets: list[tuple[ChatMessageRequest, bytes]]) -> tuple[float, float]:
+    raw_bytes = compressed_bytes = 0
+    start = time.perf_counter()
+    for i in range(PACKETS):
+        _, data = packets[i % len(packets)]
+        raw_bytes += len(data)
+        compressed_bytes += len(zlib.compress(data))
+    return PACKETS / (time.perf_counter() - start), compressed_bytes / raw_bytes
+
+
+def bench_client(packets: list[tuple[ChatMessageRequest, bytes]], settings: CompressionSettings) -> tuple[float, float]:
+    client = Client(compression=settings)
+    start = time.perf_counter()
+    for i in range(PACKETS):
+        event, data = packets[i % len(packets)]
+        client.compress(event, data)
+    stats = client.compression_stats[ChatMessageRequest]
+    return PACKETS / (time.perf_counter() - start), stats.ratio
+
+
+def main():
+    packets = build_packets()
+    baseline, baseline_ratio = bench_zlib(packets)
+    print(f'zlib.compress: {baseline:,.0f} packets/s, ratio {baseline_ratio:.3f}')
+    for name, settings in (
+        ('default', CompressionSettings()),
+        ('fast', FAST_COMPRESSION),
+        ('none', NO_COMPRESSION),
+    ):
+        rate, ratio = bench_client(packets, settings)
+        print(f'client {name}: {rate:,.0f} packets/s (x{rate / baseline:.1f}), ratio {ratio:.3f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+"""
+Compares events per second with 1, 4 and 16 listeners on the same packet id when the packet is decoded once per
+listener, once per packet, and lazily. Decoding is measured on its own and end-to-end through
+EventDispatcher.submit_event.
+
+Run from the repository root:
+    python -m benchmarks.dispatch
+"""
+
+import asyncio
+import time
+
+from minemind.client import Client
+from minemind.dispatcher import EventDispatcher, Listener
+from minemind.mc_types import Boolean, Short, VarInt
+from minemind.protocols.enums import ConnectionState
+from minemind.protocols.v765.inbound.play import RelEntityMoveResponse
+
+PACKETS = 20_000
+LISTENERS = (1, 4, 16)
+PACKET_ID = VarInt(RelEntityMoveResponse.packet_id)
+RAW_DATA = memoryview(bytes(VarInt(1234)) + bytes(Short(1)) * 3 + bytes(Boolean(True)))
+
+
+async def listener(event: RelEntityMoveResponse):
+    # Bots usually look up the entity first and skip packets of unknown entities
+    event.entity_id
+
+
+def decode_per_listener(listeners: list[Listener]) -> None:
+    for listener in listeners:
+        listener.event.decode(RAW_DATA)[0].entity_id
+
+
+def decode_shared(listeners: list[Listener]) -> None:
+    decoded: dict = {}
+    for listener in listeners:
+        EventDispatcher.get_event(listener, RAW_DATA, decoded).entity_id
+
+
+async def per_listener_submit(dispatcher: EventDispatcher, packet_id: VarInt, raw_data: memoryview) -> None:
+    listeners = dispatcher._listeners[dispatcher.client.state].get(packet_id.int, [])
+    if len(listeners) == 1:
+        await dispatcher.invoke_callback(listeners[0].callback, listeners[0].event.decode(raw_data)[0])
+        return
+    await asyncio.gather(
+        *[
+            dispatcher.invoke_callback(listener.callback, listener.event.decode(raw_data)[0])
+            for listener in listeners
+        ],
+    )
+
+
+def subscribe(listeners: int, lazy: bool) -> list[Listener]:
+    EventDispatcher._listeners.clear()
+    for _ in range(listeners):
+        EventDispatcher.subscribe(RelEntityMoveResponse, lazy=lazy)(listener)
+    return EventDispatcher._listeners[ConnectionState.PLAY][RelEntityMoveResponse.packet_id]
+
+
+def bench_decode(decode, listeners: int, lazy: bool) -> float:
+    subscribed = subscribe(listeners, lazy)
+    start = time.perf_counter()
+    for _ in range(PACKETS):
+        decode(subscribed)
+    return PACKETS / (time.perf_counter() - start)
+
+
+async def bench_submit(submit, listeners: int, lazy: bool) -> float:
+    subscribe(listeners, lazy)
+    client = Client()
+    client.state = ConnectionState.PLAY
+    dispatcher = EventDispatcher(client)
+    start = time.perf_counter()
+    for _ in range(PACKETS):
+        await submit(dispatcher, PACKET_ID, RAW_DATA)
+    return PACKETS / (time.perf_counter() - start)
+
+
+def report(name: str, listeners: int, per_listener: float, shared: float, lazy: float) -> None:
+    print(
+        f'{name} listeners={listeners}: per-listener decode {per_listener:,.0f} events/s '
+        f'| shared decode {shared:,.0f} events/s (x{shared / per_listener:.1f}) '
+        f'| lazy decode {lazy:,.0f} events/s (x{lazy / per_listener:.1f})',
+    )
+
+
+async def main():
+    for listeners in LISTENERS:
+        report(
+            'decode',
+            listeners,
+            bench_decode(decode_per_listener, listeners, lazy=False),
+            bench_decode(decode_shared, listeners, lazy=False),
+            bench_decode(decode_shared, listeners, lazy=True),
+        )
+    for listeners in LISTENERS:
+        report(
+            'submit_event',
+            listeners,
+            await bench_submit(per_listener_submit, listeners, lazy=False),
+            await bench_submit(EventDispatcher.submit_event, listeners, lazy=False),
+            await bench_submit(EventDispatcher.submit_event, listeners, lazy=True),
+        )
+    EventDispatcher._listeners.clear()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
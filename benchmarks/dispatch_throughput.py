@@ -0,0 +1,120 @@
+"""
+Measures packets per second through EventDispatcher.submit_event for synthetic play state traffic: entity movement
+packets handled by modules of several bots sharing the process, mixed with packets nobody listens to. The precompiled
+dispatch table is compared against merging the listener lists of every packet, and against also inspecting the
+signature of every callback to find out whether it needs `self`.
+
+Run from the repository root:
+    python -m benchmarks.dispatch_throughput
+"""
+
+import asyncio
+import inspect
+import random
+import time
+
+from minemind.client import Client
+from minemind.dispatcher import EventDispatcher, Listener, ListenerCallback
+from minemind.mc_types import Boolean, Byte, Long, Short, VarInt
+from minemind.mc_types.base import SocketReader
+from minemind.protocols.base import InteractionModule
+from minemind.protocols.enums import ConnectionState
+from minemind.protocols.protocol_events import InboundEvent, LazyEvent
+from minemind.protocols.v765.inbound.play import (
+    EntityHeadRotationResponse,
+    EntityLookResponse,
+    EntityVelocityResponse,
+    RelEntityMoveResponse,
+    UpdateTimeResponse,
+)
+
+PACKETS = 50_000
+BOTS = 8
+
+
+class EntityTracker(InteractionModule):
+    def __init__(self, client: Client):
+        self.client = client
+        self.moved = 0
+
+    @EventDispatcher.subscribe(RelEntityMoveResponse, lazy=True)
+    async def on_move(self, event: RelEntityMoveResponse):
+        self.moved += event.entity_id.int == 1
+
+    @EventDispatcher.subscribe(EntityLookResponse, EntityHeadRotationResponse)
+    async def on_look(self, event: EntityLookResponse | EntityHeadRotationResponse):
+        self.moved += event.entity_id.int == 1
+
+    @EventDispatcher.subscribe(EntityVelocityResponse)
+    async def on_velocity(self, event: EntityVelocityResponse):
+        self.moved += event.entity_id.int == 1
+
+
+class TimeTracker(InteractionModule):
+    def __init__(self, client: Client):
+        self.client = client
+        self.time = 0
+
+    @EventDispatcher.subscribe(UpdateTimeResponse)
+    async def on_time(self, event: UpdateTimeResponse):
+        self.time = event.time.int
+
+
+class MergingDispatcher(EventDispatcher):
+    """Resolves listeners of every packet again, like the dispatcher did before the dispatch table."""
+
+    def get_listeners(self, state: str, packet_id: int) -> tuple[Listener, ...]:
+        return self.resolve_listeners(state, packet_id)
+
+
+class IntrospectingDispatcher(MergingDispatcher):
+    """Also inspects the callback signature on every call, like the dispatcher did before binding methods."""
+
+    async def invoke_callback(self, callback: ListenerCallback, event: InboundEvent | LazyEvent | SocketReader):
+        inspect.signature(callback).parameters
+        await super().invoke_callback(callback, event)
+
+
+def build_traffic(packets: int) -> list[tuple[VarInt, memoryview]]:
+    entity_id = bytes(VarInt(1234))
+    templates = [
+        (RelEntityMoveResponse, entity_id + bytes(Short(1)) * 3 + bytes(Boolean(True)), 40),
+        (EntityLookResponse, entity_id + bytes(Byte(1)) * 2 + bytes(Boolean(True)), 15),
+        (EntityHeadRotationResponse, entity_id + bytes(Byte(1)), 15),
+        (EntityVelocityResponse, entity_id + bytes(Short(1)) * 3, 10),
+        (UpdateTimeResponse, bytes(Long(1)) * 2, 1),
+    ]
+    unhandled = [(VarInt(packet_id), memoryview(bytes(16))) for packet_id in (0x0B, 0x1F, 0x32, 0x53, 0x65)]
+    population = [(VarInt(event.packet_id), memoryview(raw)) for event, raw, _ in templates] + unhandled
+    weights = [weight for _, _, weight in templates] + [4] * len(unhandled)
+    return random.Random(0).choices(population, weights=weights, k=packets)
+
+
+async def bench(dispatcher_class: type[EventDispatcher], traffic: list[tuple[VarInt, memoryview]]) -> float:
+    dispatchers = []
+    for _ in range(BOTS):
+        client = Client()
+        client.state = ConnectionState.PLAY
+        client.modules = [EntityTracker(client), TimeTracker(client)]  # type: ignore[attr-defined]
+        dispatchers.append(dispatcher_class(client))
+    start = time.perf_counter()
+    for dispatcher in dispatchers:
+        for packet_id, raw_data in traffic:
+            await dispatcher.submit_event(packet_id, raw_data)
+    return len(traffic) * len(dispatchers) / (time.perf_counter() - start)
+
+
+async def main():
+    traffic = build_traffic(PACKETS)
+    introspecting = await bench(IntrospectingDispatcher, traffic)
+    merging = await bench(MergingDispatcher, traffic)
+    compiled = await bench(EventDispatcher, traffic)
+    print(
+        f'submit_event bots={BOTS}: introspected callbacks {introspecting:,.0f} packets/s '
+        f'| merged listener lists {merging:,.0f} packets/s (x{merging / introspecting:.2f}) '
+        f'| dispatch table {compiled:,.0f} packets/s (x{compiled / introspecting:.2f})',
+    )
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
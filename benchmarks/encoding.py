@@ -0,0 +1,62 @@
+"""
+Compares packets per second of encoding outbound position and keep alive packets into the client write buffer against
+joining the bytes of the packet id, payload and length prefixes, like the client did before in-place encoding.
+
+Run from the repository root:
+    python -m benchmarks.encoding
+"""
+
+import time
+
+from minemind.client import Client
+from minemind.mc_types import Boolean, Double, Float, Long, VarInt
+from minemind.protocols.protocol_events import OutboundEvent
+from minemind.protocols.v765.outbound.play import KeepAliveRequest, PositionLookRequest, PositionRequest
+
+PACKETS = 100_000
+THRESHOLD = 256
+
+
+class ConcatenatingClient(Client):
+    def write_packet(self, event: OutboundEvent) -> None:
+        buffer = bytes(VarInt(event.packet_id)) + event.payload
+        if self.threshold is None:
+            self.write_buffer += VarInt(len(buffer)).bytes + buffer
+        else:
+            self.write_buffer += VarInt(len(buffer) + 1).bytes + b'\x00' + buffer
+
+
+def build_packets() -> list[OutboundEvent]:
+    packets: list[OutboundEvent] = []
+    for i in range(64):
+        x, y, z = Double(i * 0.1), Double(64.0), Double(-i * 0.1)
+        packets.append(PositionRequest(x, y, z, Boolean(True)))
+        packets.append(PositionLookRequest(x, y, z, Float(90.0), Float(0.0), Boolean(False)))
+        packets.append(KeepAliveRequest(Long(i)))
+    return packets
+
+
+def bench(client_class: type[Client], packets: list[OutboundEvent], threshold: int | None) -> float:
+    client = client_class()
+    client.threshold = threshold
+    start = time.perf_counter()
+    for i in range(PACKETS):
+        client.write_packet(packets[i % len(packets)])
+        if len(client.write_buffer) >= Client.FLUSH_THRESHOLD:
+            client.write_buffer = bytearray()
+    return PACKETS / (time.perf_counter() - start)
+
+
+def main():
+    packets = build_packets()
+    for threshold in (None, THRESHOLD):
+        concatenating = bench(ConcatenatingClient, packets, threshold)
+        in_place = bench(Client, packets, threshold)
+        print(
+            f'write_packet threshold={threshold}: concatenated {concatenating:,.0f} packets/s '
+            f'| encoded in place {in_place:,.0f} packets/s (x{in_place / concatenating:.2f})',
+        )
+
+
+if __name__ == '__main__':
+    main()
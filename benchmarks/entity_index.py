@@ -0,0 +1,80 @@
+"""
+Compares the per tick targeting queries of a bot, the nearest hostile mob and all players within 16 blocks, answered
+by the `EntityIndex` grid against scanning every tracked entity, with thousands of entities around a busy server.
+
+Run from the repository root:
+    python -m benchmarks.entity_index
+"""
+
+import math
+import random
+import time
+from types import SimpleNamespace
+
+from minemind.mc_types.base import Vector3
+from minemind.protocols.v765.entity import Entity, EntityIndex
+
+ENTITIES = 5_000
+SPREAD = 512  # Entities are spread over a square with this half-size around the bot
+QUERIES = 2_000
+RADIUS = 16
+
+
+def build_entities(rng: random.Random) -> list[SimpleNamespace]:
+    kinds = ['Hostile mobs', 'Passive mobs', 'Drops', 'player']
+    return [
+        SimpleNamespace(
+            entity_id=entity_id,
+            position=Vector3(rng.uniform(-SPREAD, SPREAD), rng.uniform(40, 90), rng.uniform(-SPREAD, SPREAD)),
+            kind=rng.choices(kinds, weights=[20, 40, 35, 5])[0],
+        )
+        for entity_id in range(ENTITIES)
+    ]
+
+
+def distance(entity: Entity, position: Vector3) -> float:
+    other = entity.position
+    return math.sqrt((other.x - position.x) ** 2 + (other.y - position.y) ** 2 + (other.z - position.z) ** 2)
+
+
+def scan_queries(entities: dict[int, Entity], position: Vector3) -> tuple[list[Entity], list[Entity]]:
+    hostile = [entity for entity in entities.values() if entity.kind == 'Hostile mobs']
+    nearest = [min(hostile, key=lambda entity: distance(entity, position))] if hostile else []
+    players = [entity for entity in entities.values() if entity.kind == 'player' and distance(entity, position) <= RADIUS]
+    return nearest, players
+
+
+def index_queries(index: EntityIndex, position: Vector3) -> tuple[list[Entity], list[Entity]]:
+    nearest = index.nearest(position, 1, lambda entity: entity.kind == 'Hostile mobs')
+    players = index.within_radius(position, RADIUS, lambda entity: entity.kind == 'player')
+    return nearest, players
+
+
+def main():
+    rng = random.Random(0)
+    entities = build_entities(rng)
+    by_id: dict[int, Entity] = {entity.entity_id: entity for entity in entities}  # type: ignore[misc]
+    index = EntityIndex()
+    start = time.perf_counter()
+    for entity in entities:
+        index.update(entity)  # type: ignore[arg-type]
+    updates = len(entities) / (time.perf_counter() - start)
+
+    positions = [Vector3(rng.uniform(-SPREAD, SPREAD), 64, rng.uniform(-SPREAD, SPREAD)) for _ in range(QUERIES)]
+    start = time.perf_counter()
+    scanned = [scan_queries(by_id, position) for position in positions[: QUERIES // 10]]
+    scan = QUERIES // 10 / (time.perf_counter() - start)
+    start = time.perf_counter()
+    indexed = [index_queries(index, position) for position in positions]
+    grid = QUERIES / (time.perf_counter() - start)
+
+    for (nearest, players), (indexed_nearest, indexed_players) in zip(scanned, indexed):
+        assert nearest == indexed_nearest and sorted(map(id, players)) == sorted(map(id, indexed_players))
+    print(
+        f'{ENTITIES} entities: scan {scan:,.0f} ticks/s | grid index {grid:,.0f} ticks/s (x{grid / scan:.0f}) '
+        f'| index updates {updates:,.0f}/s',
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""
+Compares packets per second of the buffered frame reader against byte-at-a-time VarInt framing.
+
+Run from the repository root:
+    python -m benchmarks.framing
+"""
+
+import asyncio
+import time
+import zlib
+from asyncio import StreamReader
+
+from minemind.client import Client
+from minemind.framing import FrameReader
+from minemind.mc_types import Boolean, Short, VarInt
+from minemind.mc_types.base import AsyncBytesIO
+
+PACKETS = 100_000
+THRESHOLD = 256
+
+
+def build_stream(packets: int, threshold: int | None) -> bytes:
+    # RelEntityMoveResponse-like packets with an occasional chunk-sized compressed one
+    small = bytes(VarInt(0x2C)) + bytes(VarInt(1234)) + bytes(Short(1)) * 3 + bytes(Boolean(True))
+    large = bytes(VarInt(0x25)) + bytes(range(256)) * 64
+    frames = []
+    for i in range(packets):
+        body = large if i % 100 == 0 else small
+        if threshold is None:
+            frame = body
+        elif len(body) >= threshold:
+            frame = bytes(VarInt(len(body))) + zlib.compress(body)
+        else:
+            frame = bytes(VarInt(0)) + body
+        frames.append(bytes(VarInt(len(frame))) + frame)
+    return b''.join(frames)
+
+
+def make_reader(data: bytes) -> StreamReader:
+    reader = StreamReader(limit=len(data) + 1)
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
+async def legacy_unpack_packet(reader: StreamReader, threshold: int | None) -> tuple[VarInt, AsyncBytesIO]:
+    total_packet_length = await VarInt.from_stream(reader)
+    if threshold is None:
+        packet_id = await VarInt.from_stream(reader)
+        data = await reader.read(total_packet_length.int - len(packet_id.bytes))
+        return packet_id, AsyncBytesIO(data)
+
+    data_length = await VarInt.from_stream(reader)
+    if data_length.int != 0 and data_length.int >= threshold:
+        packet_length = total_packet_length.int - len(data_length.bytes)
+        compressed_data = await reader.read(packet_length)
+        while len(compressed_data) < packet_length:
+            compressed_data += await reader.read(packet_length - len(compressed_data))
+        buffer = AsyncBytesIO(zlib.decompress(compressed_data))
+        packet_id = await VarInt.from_stream(buffer)
+        return packet_id, buffer
+    packet_id = await VarInt.from_stream(reader)
+    data = await reader.read(total_packet_length.int - len(packet_id.bytes) - len(data_length.bytes))
+    return packet_id, AsyncBytesIO(data)
+
+
+async def bench_legacy(data: bytes, threshold: int | None) -> float:
+    reader = make_reader(data)
+    start = time.perf_counter()
+    for _ in range(PACKETS):
+        await legacy_unpack_packet(reader, threshold)
+    return PACKETS / (time.perf_counter() - start)
+
+
+async def bench_buffered(data: bytes, threshold: int | None) -> float:
+    client = Client()
+    client.threshold = threshold
+    client.frame_reader = FrameReader(make_reader(data))
+    start = time.perf_counter()
+    for _ in range(PACKETS):
+        await client.unpack_packet()
+    return PACKETS / (time.perf_counter() - start)
+
+
+async def main():
+    for threshold in (None, THRESHOLD):
+        data = build_stream(PACKETS, threshold)
+        legacy = await bench_legacy(data, threshold)
+        buffered = await bench_buffered(data, threshold)
+        print(
+            f'threshold={threshold}: legacy {legacy:,.0f} packets/s | buffered {buffered:,.0f} packets/s '
+            f'| x{buffered / legacy:.1f}',
+        )
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,86 @@
+"""
+Compares finding the surface of columns by calling `World.get_block_at` down every column against reading the chunk
+heightmaps with `World.get_surface_y`, and against `World.get_heightmap_region` for a whole area.
+
+Run from the repository root:
+    python -m benchmarks.heightmap
+"""
+
+import time
+from array import array
+from types import SimpleNamespace
+
+from minemind.mc_types import Array
+from minemind.mc_types.base import Vector3
+from minemind.protocols.v765.world import Chunk, ChunkSection, PalettedContainer, World
+
+MIN_Y = -64
+HEIGHT = 384
+SURFACE_Y = 64  # Stone up to here, air above
+AREA = 64
+STONE = 1
+
+
+def build_world() -> World:
+    world = World(None)  # type: ignore[arg-type]
+    world.min_y, world.height = MIN_Y, HEIGHT
+    bits_per_entry = HEIGHT.bit_length()
+    per_long = 64 // bits_per_entry
+    height = SURFACE_Y - MIN_Y
+    longs = array('q', [sum(height << (i * bits_per_entry) for i in range(per_long))] * -(-256 // per_long))
+    event = SimpleNamespace(heightmaps={'MOTION_BLOCKING': longs, 'WORLD_SURFACE': longs})
+    for chunk_x in range(AREA // 16):
+        for chunk_z in range(AREA // 16):
+            chunk = Chunk(MIN_Y, HEIGHT, chunk_x, chunk_z)
+            sections = []
+            for section_y in range(HEIGHT // 16):
+                state_id = STONE if MIN_Y + section_y * 16 < SURFACE_Y else 0
+                block_states = PalettedContainer(
+                    PalettedContainer.PaletteType.SINGLE_VALUED,
+                    PalettedContainer.PaletteCategory.BLOCK,
+                    0,
+                    array('q', [state_id]),
+                )
+                sections.append(ChunkSection(4096 if state_id else 0, block_states, None))  # type: ignore[arg-type]
+            chunk.chunk_sections = Array(sections)
+            chunk.set_heightmaps(event)  # type: ignore[arg-type]
+            world.chunks[(chunk_x, chunk_z)] = chunk
+    return world
+
+
+def scan_surface(world: World, x: int, z: int) -> int | None:
+    for y in range(MIN_Y + HEIGHT - 1, MIN_Y - 1, -1):
+        block = world.get_block_at(Vector3(x, y, z))
+        if block is not None and block.state_id != 0:
+            return y + 1
+    return None
+
+
+def main():
+    world = build_world()
+    columns = [(x, z) for z in range(AREA) for x in range(AREA)]
+
+    start = time.perf_counter()
+    scanned = [scan_surface(world, x, z) for x, z in columns]
+    scan = len(columns) / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(10):
+        surface = [world.get_surface_y(x, z) for x, z in columns]
+    lookup = 10 * len(columns) / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(100):
+        region = world.get_heightmap_region(0, 0, AREA - 1, AREA - 1)
+    bulk = 100 * len(columns) / (time.perf_counter() - start)
+
+    assert scanned == surface == region.tolist()
+    print(
+        f'{AREA}x{AREA} columns: get_block_at scan {scan:,.0f} columns/s '
+        f'| get_surface_y {lookup:,.0f} columns/s (x{lookup / scan:.0f}) '
+        f'| get_heightmap_region {bulk:,.0f} columns/s (x{bulk / scan:.0f})',
+    )
+
+
+if __name__ == '__main__':
+    main()
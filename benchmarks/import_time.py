@@ -0,0 +1,62 @@
+"""
+Measures cold start of a fresh interpreter: importing the bot, and loading the block tables physics and world lookups
+need on first use, with an empty game data cache and with the cache written by a previous process.
+
+Run from the repository root:
+    python -m benchmarks.import_time
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+
+RUNS = 5
+IMPORT_TARGET_MS = 150  # Importing the bot must not load game data
+CACHED_SHAPES_TARGET_MS = 5
+
+CHILD = '''
+import time
+start = time.perf_counter()
+import minemind.protocols.v765.bot
+imported = time.perf_counter()
+from minemind.protocols.v765.world import get_block_states, get_collision_shapes
+get_collision_shapes()
+shapes = time.perf_counter()
+get_block_states()
+states = time.perf_counter()
+print(imported - start, shapes - imported, states - shapes)
+'''
+
+
+def run(cache_dir: str) -> tuple[float, ...]:
+    env = dict(os.environ, MINEMIND_CACHE_DIR=cache_dir, PYTHONPATH=os.getcwd())
+    # Run outside of the repository, game data must be found relative to the package
+    output = subprocess.run([sys.executable, '-c', CHILD], env=env, cwd=tempfile.gettempdir(), capture_output=True)
+    output.check_returncode()
+    return tuple(float(value) * 1000 for value in output.stdout.split())
+
+
+def main():
+    cold, warm = [], []
+    for _ in range(RUNS):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cold.append(run(cache_dir))
+            warm.append(run(cache_dir))
+    for name, runs in (('empty cache', cold), ('warm cache', warm)):
+        import_ms, shapes_ms, states_ms = (min(values) for values in zip(*runs))
+        print(
+            f'{name}: import bot {import_ms:.1f}ms | collision shapes {shapes_ms:.1f}ms '
+            f'| block states {states_ms:.1f}ms (best of {RUNS})',
+        )
+    import_ms = min(run[0] for run in warm)
+    shapes_ms = min(run[1] for run in warm)
+    print(
+        f'targets: import bot < {IMPORT_TARGET_MS}ms {"ok" if import_ms < IMPORT_TARGET_MS else "MISSED"} '
+        f'| cached collision shapes < {CACHED_SHAPES_TARGET_MS}ms '
+        f'{"ok" if shapes_ms < CACHED_SHAPES_TARGET_MS else "MISSED"}',
+    )
+
+
+if __name__ == '__main__':
+    main()
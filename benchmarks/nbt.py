@@ -0,0 +1,106 @@
+"""
+Compares decoding chunk heightmaps and a registry codec into plain values with `NBT.decode_value` against the tree of
+tags built by `NBT.decode`, and skipping block entity NBT with `NBT.skip` against decoding it.
+
+Run from the repository root:
+    python -m benchmarks.nbt
+"""
+
+import random
+import time
+from struct import pack
+from typing import Callable
+
+from minemind.mc_types import nbt
+
+RUNS = 2_000
+
+
+def named(tag_type: int, name: str, payload: bytes) -> bytes:
+    return bytes([tag_type]) + pack('>H', len(name)) + name.encode() + payload
+
+
+def compound(*tags: bytes) -> bytes:
+    return b''.join(tags) + b'\x00'
+
+
+def build_heightmaps(rng: random.Random) -> bytes:
+    longs = [rng.getrandbits(63) for _ in range(37)]  # 256 heights of 9 bits
+    data = pack('>i37q', 37, *longs)
+    return b'\x0a' + compound(
+        named(nbt.TAG_LONG_ARRAY, 'MOTION_BLOCKING', data),
+        named(nbt.TAG_LONG_ARRAY, 'WORLD_SURFACE', data),
+    )
+
+
+def build_registry_codec(rng: random.Random) -> bytes:
+    biomes = []
+    for biome_id in range(64):
+        effects = compound(
+            named(nbt.TAG_INT, 'sky_color', pack('>i', rng.getrandbits(24))),
+            named(nbt.TAG_INT, 'water_color', pack('>i', rng.getrandbits(24))),
+            named(nbt.TAG_INT, 'fog_color', pack('>i', rng.getrandbits(24))),
+            named(nbt.TAG_STRING, 'grass_color_modifier', pack('>H', 4) + b'none'),
+        )
+        element = compound(
+            named(nbt.TAG_BYTE, 'has_precipitation', b'\x01'),
+            named(nbt.TAG_FLOAT, 'temperature', pack('>f', rng.random())),
+            named(nbt.TAG_FLOAT, 'downfall', pack('>f', rng.random())),
+            named(nbt.TAG_COMPOUND, 'effects', effects),
+        )
+        name = f'minecraft:biome_{biome_id}'
+        biomes.append(
+            compound(
+                named(nbt.TAG_STRING, 'name', pack('>H', len(name)) + name.encode()),
+                named(nbt.TAG_INT, 'id', pack('>i', biome_id)),
+                named(nbt.TAG_COMPOUND, 'element', element),
+            ),
+        )
+    biome_list = bytes([nbt.TAG_COMPOUND]) + pack('>i', len(biomes)) + b''.join(biomes)
+    registry = compound(
+        named(nbt.TAG_STRING, 'type', pack('>H', 24) + b'minecraft:worldgen/biome'),
+        named(nbt.TAG_LIST, 'value', biome_list),
+    )
+    return b'\x0a' + compound(named(nbt.TAG_COMPOUND, 'minecraft:worldgen/biome', registry))
+
+
+def build_block_entity() -> bytes:
+    # Sign text, one of the most common block entities
+    lines = [b'{"text":"Welcome to the server"}'] * 4
+    messages = bytes([nbt.TAG_STRING]) + pack('>i', 4) + b''.join(pack('>H', len(line)) + line for line in lines)
+    text = compound(
+        named(nbt.TAG_LIST, 'messages', messages),
+        named(nbt.TAG_STRING, 'color', pack('>H', 5) + b'black'),
+        named(nbt.TAG_BYTE, 'has_glowing_text', b'\x00'),
+    )
+    return b'\x0a' + compound(
+        named(nbt.TAG_COMPOUND, 'front_text', text),
+        named(nbt.TAG_COMPOUND, 'back_text', text),
+        named(nbt.TAG_BYTE, 'is_waxed', b'\x00'),
+    )
+
+
+def bench(decode: Callable[[memoryview], object], data: bytes) -> float:
+    view = memoryview(data)
+    start = time.perf_counter()
+    for _ in range(RUNS):
+        decode(view)
+    return RUNS / (time.perf_counter() - start)
+
+
+def main():
+    rng = random.Random(0)
+    for name, data in (('heightmaps', build_heightmaps(rng)), ('registry codec', build_registry_codec(rng))):
+        tags = bench(nbt.NBT.decode, data)
+        values = bench(nbt.NBT.decode_value, data)
+        print(
+            f'{name} ({len(data)} bytes): tags {tags:,.0f} decodes/s '
+            f'| plain values {values:,.0f} decodes/s (x{values / tags:.2f})',
+        )
+    data = build_block_entity()
+    tags, skipped = bench(nbt.NBT.decode, data), bench(nbt.NBT.skip, data)
+    print(f'block entity ({len(data)} bytes): tags {tags:,.0f} decodes/s | skip {skipped:,.0f} skips/s (x{skipped / tags:.2f})')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+"""
+Compares a physics tick of many bots sharing their chunks through a ChunkStore, with every simulation looking up its
+collision boxes and blocks in the world against the simulations of the tick sharing a `WorldCache`.
+
+Run from the repository root:
+    python -m benchmarks.physics
+"""
+
+import random
+import time
+from array import array
+
+from minemind.mc_types import Array
+from minemind.mc_types.base import Vector3
+from minemind.protocols.v765.physics import PlayerPhysicsSimulation, WorldCache
+from minemind.protocols.v765.world import Chunk, ChunkSection, PalettedContainer, World
+
+MIN_Y = -64
+HEIGHT = 384
+GROUND_Y = 64
+AREA = 32  # Bots spawn around the origin of a square of this size
+BOTS = 50
+TICKS = 100
+# Air, stone, oak slab (bottom) and oak fence
+PALETTE = array('q', [0, 1, 11165, 5848])
+
+
+def build_chunk(rng: random.Random, chunk_x: int, chunk_z: int) -> Chunk:
+    chunk = Chunk(MIN_Y, HEIGHT, chunk_x, chunk_z)
+    sections = []
+    for section_y in range(HEIGHT // 16):
+        bottom = MIN_Y + section_y * 16
+        data = array('H', bytes(2 * 4096))
+        for index in range(4096):
+            y = bottom + (index >> 8)
+            if y < GROUND_Y:
+                data[index] = 1
+            elif y == GROUND_Y and rng.random() < 0.1:  # Obstacles to collide with and step up on
+                data[index] = rng.choice([1, 2, 3])
+        block_states = PalettedContainer(
+            PalettedContainer.PaletteType.INDIRECT,
+            PalettedContainer.PaletteCategory.BLOCK,
+            2,
+            PALETTE,
+            data,
+        )
+        sections.append(ChunkSection(4096, block_states, None))  # type: ignore[arg-type]
+    chunk.chunk_sections = Array(sections)
+    return chunk
+
+
+def build_worlds(rng: random.Random) -> list[World]:
+    chunks = {
+        (chunk_x, chunk_z): build_chunk(rng, chunk_x, chunk_z)
+        for chunk_x in range(-AREA // 16, AREA // 16)
+        for chunk_z in range(-AREA // 16, AREA // 16)
+    }
+    worlds = []
+    for _ in range(BOTS):  # Every bot has its own world, chunks are shared like with a ChunkStore
+        world = World(None)  # type: ignore[arg-type]
+        world.min_y, world.height = MIN_Y, HEIGHT
+        world.chunks = dict(chunks)
+        worlds.append(world)
+    return worlds
+
+
+def run(worlds: list[World], states: list[tuple[Vector3, Vector3, bool]], shared: bool) -> tuple[float, list]:
+    start = time.perf_counter()
+    for _ in range(TICKS):
+        world_cache = WorldCache() if shared else None
+        for index, (world, (position, velocity, on_ground)) in enumerate(zip(worlds, states)):
+            simulation = PlayerPhysicsSimulation(
+                world=world,
+                position=position,
+                velocity=velocity,
+                yaw=0,
+                pitch=0,
+                on_ground=on_ground,
+                jump_ticks=0,
+                is_in_web=False,
+                is_elytra_flying=False,
+                is_collided_horizontally=False,
+                is_collided_vertically=False,
+                world_cache=world_cache,
+            )
+            simulation.simulate()
+            states[index] = (simulation.position, simulation.velocity, simulation.on_ground)
+    return BOTS * TICKS / (time.perf_counter() - start), states
+
+
+def main():
+    rng = random.Random(0)
+    worlds = build_worlds(rng)
+    states = [
+        (
+            Vector3(rng.uniform(-8, 8), GROUND_Y + 2, rng.uniform(-8, 8)),
+            Vector3(rng.uniform(-0.3, 0.3), 0, rng.uniform(-0.3, 0.3)),
+            False,
+        )
+        for _ in range(BOTS)
+    ]
+    own, own_states = run(worlds, [(p.copy(), v.copy(), g) for p, v, g in states], shared=False)
+    shared, shared_states = run(worlds, [(p.copy(), v.copy(), g) for p, v, g in states], shared=True)
+    assert [(p.x, p.y, p.z, g) for p, _, g in own_states] == [(p.x, p.y, p.z, g) for p, _, g in shared_states]
+    print(
+        f'{BOTS} bots: own lookups {own:,.0f} bot ticks/s | shared world cache {shared:,.0f} bot ticks/s '
+        f'(x{shared / own:.2f})',
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""
+Measures the memory of a bot process after looking up blocks, collision shapes, items and entities, with the game data
+loaded into the process and with the shared memory-mapped registry. Private memory is what every additional bot
+process costs, pages of the mapped registry are shared between processes.
+
+Linux only, memory is read from /proc. Run from the repository root:
+    python -m benchmarks.registry_memory
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+
+STATES = 2_000  # Distinct block states a bot comes across
+
+CHILD = '''
+import random, sys
+from minemind.protocols.v765 import registry
+from minemind.protocols.v765.world import Block, get_collision_shapes
+if sys.argv[1] == 'shared':
+    registry.use_shared_registry()
+for state_id in random.Random(0).sample(range(27_000), {states}):
+    Block.from_state_id(state_id)
+get_collision_shapes()
+for item_id in range(1_000):
+    registry.get_item(item_id)
+for entity_type_id in range(100):
+    registry.get_entity(entity_type_id)
+status = dict(line.split(':', 1) for line in open('/proc/self/status'))
+print(int(status['RssAnon'].split()[0]), int(status['RssFile'].split()[0]))
+'''.format(states=STATES)
+
+
+def run(mode: str, cache_dir: str) -> tuple[int, int]:
+    env = dict(os.environ, MINEMIND_CACHE_DIR=cache_dir, PYTHONPATH=os.getcwd())
+    output = subprocess.run([sys.executable, '-c', CHILD, mode], env=env, capture_output=True)
+    output.check_returncode()
+    private, mapped = (int(value) for value in output.stdout.split())
+    return private, mapped
+
+
+def main():
+    with tempfile.TemporaryDirectory() as cache_dir:
+        # First runs write the game data cache and compile the registry
+        run('local', cache_dir)
+        run('shared', cache_dir)
+        local_private, local_mapped = run('local', cache_dir)
+        shared_private, shared_mapped = run('shared', cache_dir)
+    print(
+        f'{STATES} block states: game data per process {local_private / 1024:.1f}MB private '
+        f'| shared registry {shared_private / 1024:.1f}MB private '
+        f'(x{local_private / shared_private:.2f} less per bot process), '
+        f'{shared_mapped / 1024:.1f}MB file backed and shared',
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+"""
+Compares VarInt decoding and encoding against the byte loop the codec used for every value before the one and two
+byte fast paths, and decoding a block palette with `VarInt.decode_many` against an Array of VarInt objects.
+
+Run from the repository root:
+    python -m benchmarks.varint
+"""
+
+import random
+import time
+
+from minemind.mc_types import Array, VarInt
+from minemind.mc_types.base import Buffer
+
+VALUES = 100_000
+PALETTES = 2_000
+PALETTE_LENGTH = 64
+
+
+class LoopVarInt(VarInt):
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0, **kwargs):
+        num_read = 0
+        result = 0
+        while True:
+            if offset >= len(buffer):
+                raise IndexError('Not enough data to read VarInt')
+            value = buffer[offset]
+            result |= (value & 0x7F) << (7 * num_read)
+            offset += 1
+            num_read += 1
+            if num_read > cls.max_size:
+                raise IOError('VarInt is too big')
+            if (value & 0x80) == 0:
+                break
+        return cls(result), offset
+
+    @classmethod
+    def _write_varint(cls, value: int) -> bytes:
+        result = bytearray()
+        while True:
+            temp = value & 0x7F
+            value >>= 7
+            if value != 0:
+                result.append(temp | 0x80)
+            else:
+                result.append(temp)
+                break
+        return bytes(result)
+
+
+def bench_decode(varint: type[VarInt], data: bytes) -> float:
+    view = memoryview(data)
+    start = time.perf_counter()
+    offset = 0
+    for _ in range(VALUES):
+        _, offset = varint.decode(view, offset)
+    return VALUES / (time.perf_counter() - start)
+
+
+def bench_encode(varint: type[VarInt], values: list[int]) -> float:
+    start = time.perf_counter()
+    for value in values:
+        varint._write_varint(value)
+    return len(values) / (time.perf_counter() - start)
+
+
+def bench_palettes(data: bytes, bulk: bool) -> float:
+    view = memoryview(data)
+    start = time.perf_counter()
+    for _ in range(PALETTES):
+        if bulk:
+            VarInt.decode_many(view, PALETTE_LENGTH)
+        else:
+            Array[VarInt].decode(view, length=PALETTE_LENGTH, mc_type=VarInt)
+    return PALETTES / (time.perf_counter() - start)
+
+
+def main():
+    rng = random.Random(0)
+    # Mostly packet ids, lengths and entity ids, which take one or two bytes
+    values = [rng.choice((rng.randrange(0x80), rng.randrange(0x4000), rng.randrange(1 << 28))) for _ in range(VALUES)]
+    data = b''.join(VarInt._write_varint(value) for value in values)
+    loop, fast = bench_decode(LoopVarInt, data), bench_decode(VarInt, data)
+    print(f'decode: byte loop {loop:,.0f} values/s | fast path {fast:,.0f} values/s (x{fast / loop:.2f})')
+    loop, fast = bench_encode(LoopVarInt, values), bench_encode(VarInt, values)
+    print(f'encode: byte loop {loop:,.0f} values/s | fast path {fast:,.0f} values/s (x{fast / loop:.2f})')
+
+    palette = b''.join(VarInt._write_varint(rng.randrange(27_000)) for _ in range(PALETTE_LENGTH))
+    objects, bulk = bench_palettes(palette, bulk=False), bench_palettes(palette, bulk=True)
+    print(
+        f'palette of {PALETTE_LENGTH}: Array[VarInt] {objects:,.0f} palettes/s '
+        f'| decode_many {bulk:,.0f} palettes/s (x{bulk / objects:.2f})',
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -1,35 +1,112 @@
 import asyncio
+import time
 import zlib
 from asyncio import StreamReader, StreamWriter
+from collections import defaultdict
+from typing import TYPE_CHECKING, Iterable, NamedTuple
 
 from minemind import DEBUG_TRACE
+from minemind.framing import FrameReader
 from minemind.mc_types import VarInt
-from minemind.mc_types.base import AsyncBytesIO
 from minemind.protocols.enums import ConnectionState
 from minemind.protocols.protocol_events import OutboundEvent
 from minemind.protocols.utils import get_logger
 
+if TYPE_CHECKING:
+    from minemind.dispatcher import ListenerTable
+
+
+class CompressionSettings(NamedTuple):
+    level: int = zlib.Z_DEFAULT_COMPRESSION
+    strategy: int = zlib.Z_DEFAULT_STRATEGY
+    mem_level: int = zlib.DEF_MEM_LEVEL
+    # Packet types compressing worse than this (compressed / raw size) are sent stored, i.e. without compression
+    store_ratio: float = 0.9
+    # Packets of a type compressed before the store heuristic is applied
+    sample_packets: int = 16
+    # Packets of a type stored before it is sampled again, in case its packets started to compress better
+    resample_packets: int = 256
+
+
+# E.g. for bots on localhost, where bandwidth is free but CPU time isn't
+FAST_COMPRESSION = CompressionSettings(level=1)
+NO_COMPRESSION = CompressionSettings(level=zlib.Z_NO_COMPRESSION)
+
+
+class CompressionStats:
+    """
+    Compression of the sampled packets of a type. Packets stored by the store heuristic are only counted in `stored`.
+    """
+
+    __slots__ = ('packets', 'raw_bytes', 'compressed_bytes', 'seconds', 'stored')
+
+    def __init__(self):
+        self.packets = 0
+        self.raw_bytes = 0
+        self.compressed_bytes = 0
+        self.seconds = 0.0
+        self.stored = 0
+
+    def __repr__(self):
+        return (
+            f'<CompressionStats packets={self.packets} ratio={self.ratio:.3f} '
+            f'time per packet={self.time_per_packet * 1e6:.1f}us stored={self.stored}>'
+        )
+
+    @property
+    def ratio(self) -> float:
+        return self.compressed_bytes / self.raw_bytes if self.raw_bytes else 1.0
+
+    @property
+    def time_per_packet(self) -> float:
+        return self.seconds / self.packets if self.packets else 0.0
+
 
 class Client:
     logger = get_logger('Client')
+    FLUSH_THRESHOLD = 64 * 1024
+    MAX_PACKET_SIZE = 1 << 23  # Largest uncompressed packet accepted by the vanilla client
 
-    def __init__(self, host: str = 'localhost', port: int = 25565, protocol_version: int = 765):
+    def __init__(
+        self,
+        host: str = 'localhost',
+        port: int = 25565,
+        protocol_version: int = 765,
+        compression: CompressionSettings = CompressionSettings(),
+    ):
         self.host = host
         self.port = port
         self.protocol_version = protocol_version
+        self.compression = compression
+        self.compression_stats: dict[type[OutboundEvent], CompressionStats] = {}
 
         # TODO: Incompatible types in assignment (expression has type "None", variable has type "StreamWriter")
         self.reader: StreamReader = None  # type: ignore[assignment]
         self.writer: StreamWriter = None  # type: ignore[assignment]
+        self.frame_reader: FrameReader = None  # type: ignore[assignment]
 
         self.threshold: int | None = None
         self.state = ConnectionState.HANDSHAKING
 
+        self.write_buffer = bytearray()
+        self._flush_task: asyncio.Task | None = None
+
+        # Listeners of the modules bound to this connection, see EventDispatcher.add_callback_instance
+        self.listeners: ListenerTable = defaultdict(lambda: defaultdict(list))
+        self.listeners_version = 0
+
     async def connect(self) -> None:
         self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        self.frame_reader = FrameReader(self.reader)
         self.logger.log(DEBUG_TRACE, f'Connected to {self.host}:{self.port}')
 
     async def disconnect(self) -> None:
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        if self.write_buffer:
+            self.writer.write(self.write_buffer)
+            self.write_buffer = bytearray()
         self.writer.close()
         await self.writer.wait_closed()
         self.logger.log(DEBUG_TRACE, f'Disconnected from {self.host}:{self.port}')
@@ -41,58 +118,162 @@ class Client:
     async def __aexit__(self, exc_type, exc, tb):
         await self.disconnect()
 
-    async def send_packet(self, event: OutboundEvent) -> None:
+    def write_packet(self, event: OutboundEvent) -> None:
+        """
+        Appends the packet frame to the write buffer, it's sent by the next flush.
+
+        The packet is encoded straight into the write buffer after a one byte placeholder for the frame length, which
+        is backfilled once the packet size is known. Only frames of 128 bytes or more need a longer length prefix,
+        the frame is moved by one or two bytes then. Packets above the compression threshold are cut out of the
+        buffer again and replaced by the compressed frame.
+        """
         # https://wiki.vg/Protocol#Packet_format
-        buffer = bytes(VarInt(event.packet_id)) + event.payload
-        buffer_len = len(buffer)
-        if self.threshold is None:
-            packet = VarInt(buffer_len).bytes + buffer
-        elif buffer_len >= self.threshold:
+        write_buffer = self.write_buffer
+        frame_start = len(write_buffer)
+        write_buffer += b'\x00' if self.threshold is None else b'\x00\x00'  # Frame length [and data length]
+        packet_start = len(write_buffer)
+        VarInt.write(write_buffer, event.packet_id)
+        event.encode(write_buffer)
+        buffer_len = len(write_buffer) - packet_start
+
+        if self.threshold is not None and buffer_len >= self.threshold:
+            buffer = bytes(write_buffer[packet_start:])
+            del write_buffer[frame_start:]
             data_length = VarInt(buffer_len).bytes
-            compressed_data = zlib.compress(buffer)
-            packet = data_length + compressed_data
-            packet = VarInt(len(packet)).bytes + packet
-        elif buffer_len < self.threshold:
-            data_length = VarInt(0).bytes
-            buffer = data_length + buffer
-            packet = VarInt(len(buffer)).bytes + buffer
+            compressed_data = self.compress(event, buffer)
+            write_buffer += VarInt(len(data_length) + len(compressed_data)).bytes
+            write_buffer += data_length
+            write_buffer += compressed_data
         else:
-            raise ValueError('Invalid packet length')
+            # The data length placeholder of uncompressed packets is already 0
+            frame_length = len(write_buffer) - frame_start - 1
+            if frame_length < 0x80:
+                write_buffer[frame_start] = frame_length
+            else:
+                write_buffer[frame_start : frame_start + 1] = VarInt(frame_length).bytes
 
-        self.writer.write(packet)
-        await self.writer.drain()
-        self.logger.log(
-            DEBUG_TRACE,
-            f'Sent packet {hex(event.packet_id)} ({event.__class__.__name__}) with {buffer_len} bytes',
+        if self.logger.isEnabledFor(DEBUG_TRACE):
+            self.logger.log(
+                DEBUG_TRACE,
+                f'Sent packet {hex(event.packet_id)} ({event.__class__.__name__}) with {buffer_len} bytes',
+            )
+
+    def compress(self, event: OutboundEvent, data: bytes) -> bytes:
+        """
+        Compresses packet data with the client compression settings and updates the stats of the packet type.
+
+        The window and hash table of the compressor are sized to the packet, because allocating the default 32KB
+        window costs more than compressing a packet just above the threshold. Packet types which don't compress well
+        are stored once enough of them were sampled, and sampled again after `resample_packets` stored packets.
+        """
+        settings = self.compression
+        stats = self.compression_stats.get(type(event))
+        if stats is None:
+            stats = self.compression_stats[type(event)] = CompressionStats()
+        if stats.packets >= settings.sample_packets and stats.ratio > settings.store_ratio:
+            if stats.stored < settings.resample_packets:
+                stats.stored += 1
+                return self.deflate(data, zlib.Z_NO_COMPRESSION)
+            self.compression_stats[type(event)] = stats = CompressionStats()
+
+        start = time.perf_counter()
+        compressed_data = self.deflate(data, settings.level)
+        stats.seconds += time.perf_counter() - start
+        stats.packets += 1
+        stats.raw_bytes += len(data)
+        stats.compressed_bytes += len(compressed_data)
+        return compressed_data
+
+    def deflate(self, data: bytes, level: int) -> bytes:
+        settings = self.compression
+        window_bits = max(10, min(zlib.MAX_WBITS, len(data).bit_length()))
+        compressor = zlib.compressobj(
+            level,
+            zlib.DEFLATED,
+            window_bits,
+            min(settings.mem_level, window_bits - 6),
+            settings.strategy,
         )
+        return compressor.compress(data) + compressor.flush()
+
+    async def send_packet(self, event: OutboundEvent) -> None:
+        """
+        Queues the packet for sending.
+
+        Packets sent during one event loop iteration are written to the socket together by a single flush, the
+        buffer is flushed right away once it reaches FLUSH_THRESHOLD bytes.
+        """
+        self.write_packet(event)
+        if len(self.write_buffer) >= self.FLUSH_THRESHOLD:
+            await self.flush()
+        elif self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._scheduled_flush())
+
+    async def send_many(self, events: Iterable[OutboundEvent]) -> None:
+        """
+        Sends the packets in one write.
+        """
+        for event in events:
+            self.write_packet(event)
+        await self.flush()
 
-    async def unpack_packet(self, reader: StreamReader) -> tuple[VarInt, AsyncBytesIO]:
-        total_packet_length = await VarInt.from_stream(reader)
+    async def flush(self) -> None:
+        """
+        Writes all queued packets to the socket and waits until the socket buffer is drained.
+        """
+        if self.write_buffer:
+            # The transport may keep a reference to unsent data, so the buffer isn't reused
+            write_buffer, self.write_buffer = self.write_buffer, bytearray()
+            self.writer.write(write_buffer)
+        await self.writer.drain()
+
+    async def _scheduled_flush(self) -> None:
+        try:
+            # Packets queued while a write was draining didn't schedule a flush of their own
+            while self.write_buffer:
+                await self.flush()
+        except Exception as e:
+            self.logger.error(f'Error while flushing packets to {self.host}:{self.port}: {e}')
+        finally:
+            self._flush_task = None
+
+    def decompress(self, compressed_data: memoryview, data_length: int) -> bytes:
+        """
+        Inflates packet data, stopping as soon as the declared length is produced.
+
+        The output is allocated for the declared length, and data inflating to more than declared is rejected without
+        inflating the rest of it.
+        """
+        if data_length < self.threshold:  # type: ignore[operator]
+            raise zlib.error(f'Badly compressed packet: size {data_length} is below threshold {self.threshold}')
+        if data_length > self.MAX_PACKET_SIZE:
+            raise zlib.error(f'Badly compressed packet: size {data_length} is larger than {self.MAX_PACKET_SIZE}')
+        decompressor = zlib.decompressobj()
+        decompressed_data = decompressor.decompress(compressed_data, data_length)
+        # Only the end of the stream (e.g. the checksum) may be left once the declared length is reached
+        if not decompressor.eof and decompressor.decompress(decompressor.unconsumed_tail, 1):
+            raise zlib.error('Incorrect uncompressed data length')
+        if len(decompressed_data) != data_length or not decompressor.eof:
+            raise zlib.error('Incorrect uncompressed data length')
+        return decompressed_data
+
+    async def unpack_packet(self) -> tuple[VarInt, memoryview]:
+        """
+        Reads the next packet and returns its id and body.
+
+        The body is a zero-copy slice of the received (or decompressed) data.
+        """
+        frame = await self.frame_reader.read_frame()
         if self.threshold is None:
-            packet_id = await VarInt.from_stream(reader)
-            data = await reader.read(total_packet_length.int - len(packet_id.bytes))
-            return packet_id, AsyncBytesIO(data)
-
-        data_length = await VarInt.from_stream(reader)
-        if data_length.int != 0 and data_length.int >= self.threshold:
-            packet_length = total_packet_length.int - len(data_length.bytes)
-
-            compressed_data = await reader.read(packet_length)
-
-            self.logger.log(DEBUG_TRACE, f'Received compressed packet {len(compressed_data)} bytes')
-            while len(compressed_data) < packet_length:  # sometimes the rest of the data hasn't been transmited yet
-                self.logger.log(DEBUG_TRACE, f'Waiting for {packet_length - len(compressed_data)} more bytes')
-                compressed_data += await reader.read(
-                    packet_length - len(compressed_data),
-                )  # so we try to read what is missing
-            decompressed_data = zlib.decompress(compressed_data)
-            if data_length.int != len(decompressed_data):
-                raise zlib.error('Incorrect uncompressed data length')
-            buffer = AsyncBytesIO(decompressed_data)
-            packet_id = await VarInt.from_stream(buffer)
-            return packet_id, buffer
-        else:
-            packet_id = await VarInt.from_stream(reader)
-            packet_content_length = total_packet_length.int - len(packet_id.bytes) - len(data_length.bytes)
-            data = await reader.read(packet_content_length)
-            return packet_id, AsyncBytesIO(data)
+            packet_id, packet_id_size = VarInt._read_varint(frame)
+            return VarInt(packet_id), frame[packet_id_size:]
+
+        data_length, data_length_size = VarInt._read_varint(frame)
+        if data_length != 0:
+            self.logger.log(DEBUG_TRACE, f'Received compressed packet {len(frame) - data_length_size} bytes')
+            decompressed_data = self.decompress(frame[data_length_size:], data_length)
+            packet_id, packet_id_size = VarInt._read_varint(decompressed_data)
+            return VarInt(packet_id), memoryview(decompressed_data)[packet_id_size:]
+
+        packet_id, packet_id_size = VarInt._read_varint(frame, data_length_size)
+        return VarInt(packet_id), frame[data_length_size + packet_id_size :]
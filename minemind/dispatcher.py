@@ -1,15 +1,16 @@
 import asyncio
 import inspect
 import os
-from collections import defaultdict
-from typing import TYPE_CHECKING, Callable, Coroutine, Literal, NamedTuple, Type, Union
+from collections import defaultdict, deque
+from enum import Enum
+from typing import TYPE_CHECKING, Callable, Coroutine, Hashable, Literal, Mapping, NamedTuple, Type, Union
 
 from minemind import DEBUG_TRACE
 from minemind.client import Client
 from minemind.mc_types import VarInt
 from minemind.mc_types.base import AsyncBytesIO, SocketReader
 from minemind.protocols.enums import ConnectionState
-from minemind.protocols.protocol_events import InboundEvent
+from minemind.protocols.protocol_events import InboundEvent, LazyEvent
 from minemind.protocols.utils import ConnectionClosed, get_logger
 
 if TYPE_CHECKING:
@@ -17,51 +18,136 @@ if TYPE_CHECKING:
 
 ListenerCallback = Union[
     Callable[
-        [InboundEvent | SocketReader],
+        [InboundEvent | LazyEvent | SocketReader],
         Coroutine[None, None, None],
     ],
     Callable[
-        ['InteractionModule', InboundEvent | SocketReader],
+        ['InteractionModule', InboundEvent | LazyEvent | SocketReader],
         Coroutine[None, None, None],
     ],
 ]
 
-Listener = NamedTuple('Listener', [('event', Type[InboundEvent] | None), ('callback', ListenerCallback)])
+Listener = NamedTuple(
+    'Listener',
+    [('event', Type[InboundEvent] | None), ('callback', ListenerCallback), ('lazy', bool)],
+)
+
+
+ListenerTable = dict[str, dict[int | Literal['*'], list[Listener]]]
+Subscription = tuple[str, int | Literal['*'], Listener]
+
+
+class OverflowPolicy(str, Enum):
+    BLOCK = 'block'  # Wait for a free slot, the socket isn't read meanwhile so the server is slowed down by TCP
+    DROP = 'drop'  # Make room for coalesced packets by dropping a stale queued packet, wait if there is none
+
+
+class WorkerSettings(NamedTuple):
+    """
+    Settings of the concurrent dispatch mode, see EventDispatcher.run_workers.
+    """
+
+    workers: int = 4
+    queue_size: int = 1024
+    overflow: OverflowPolicy = OverflowPolicy.BLOCK
+    # Packet id -> ordering key of the raw packet, packets with the same key are handled in order by the same worker
+    ordering_keys: Mapping[int, Callable[[memoryview], Hashable]] = {}
+    # Packets which make a queued packet with the same id and ordering key stale, e.g. absolute entity positions
+    coalesced: frozenset[int] = frozenset()
+    # Packets handled by the reader right away, e.g. keep alive
+    immediate: frozenset[int] = frozenset()
+    # Packets handled by the reader once all queued packets are handled, e.g. dimension changes
+    barriers: frozenset[int] = frozenset()
+
+
+class QueuedPacket:
+    __slots__ = ('packet_id', 'raw_data', 'coalesced_key', 'stale')
+
+    def __init__(self, packet_id: VarInt, raw_data: memoryview, coalesced_key: tuple[int, Hashable] | None):
+        self.packet_id = packet_id
+        self.raw_data = raw_data
+        self.coalesced_key = coalesced_key
+        self.stale = False
+
+
+class PacketQueue(asyncio.Queue):
+    """
+    Queue of a dispatch worker, which can drop a stale packet to make room for a newer one.
+    """
+
+    _queue: deque[QueuedPacket]
+
+    def evict_stale(self) -> bool:
+        """
+        Removes a queued packet made stale by a newer one, packets which are still needed are never dropped.
+
+        :return: Whether a packet was removed.
+        """
+        packets = self._queue
+        packet = next((packet for packet in packets if packet.stale), None)
+        if packet is None:
+            return False
+        packets.remove(packet)
+        self.task_done()
+        return True
 
 
 class EventDispatcher:
     logger = get_logger('EventDispatcher')
-    _callback_instances: dict[str, 'InteractionModule'] = {}
-    _listeners: dict[str, dict[int | Literal['*'], list[Listener]]] = defaultdict(lambda: defaultdict(list))
+    # Listeners of plain functions are shared by all connections, methods are bound per connection
+    _listeners: ListenerTable = defaultdict(lambda: defaultdict(list))
+    _listeners_version = 0  # Bumped on every change of `_listeners` to rebuild dispatch tables
+    _class_subscriptions: dict[type, list[tuple[str, Subscription]]] = {}
 
-    def __init__(self, client: Client):
+    def __init__(self, client: Client, workers: WorkerSettings | None = None):
         self.client = client
         self.bundle_packet = True
         self.bundle: list[Coroutine[None, None, None]] = []
+        self._dispatch_table: dict[tuple[str, int], tuple[Listener, ...]] = {}
+        self._dispatch_table_version = (-1, -1)
+
+        self.workers = workers
+        self.queues: list[PacketQueue] = []
+        self.pending: dict[tuple[int, Hashable], QueuedPacket] = {}  # Queued packets which can be coalesced
+        self.dropped = 0
+
+    @classmethod
+    def get_class_subscriptions(cls, module_class: type) -> list[tuple[str, Subscription]]:
+        subscriptions = cls._class_subscriptions.get(module_class)
+        if subscriptions is None:
+            subscriptions = [
+                (name, subscription)
+                for name in dir(module_class)
+                for subscription in getattr(getattr(module_class, name, None), '__subscriptions__', ())
+            ]
+            cls._class_subscriptions[module_class] = subscriptions
+        return subscriptions
 
     @classmethod
     def add_callback_instance(cls, instance: 'InteractionModule'):
         """
-        We need this function to make it works:
+        Subscribes the methods of the instance to the events of its client:
         >>> @EventDispatcher.subscribe(KeepAliveResponse)
         >>> async def _keep_alive(self, reader: SocketReader):
         >>>     ...
 
-        Because we need to pass `self` to the callback function.
+        Methods are bound to the instance, so every connection calls its own modules.
         """
-        cls._callback_instances[instance.__class__.__name__] = instance
+        for name, (state, packet_id, listener) in cls.get_class_subscriptions(type(instance)):
+            instance.client.listeners[state][packet_id].append(listener._replace(callback=getattr(instance, name)))
+        instance.client.listeners_version += 1
 
     @classmethod
     def remove_callback_instance(cls, instance: 'InteractionModule'):
-        cls._callback_instances.pop(instance.__class__.__name__, None)
-
-    @classmethod
-    def get_method_instance(cls, func: ListenerCallback) -> 'InteractionModule':
-        class_name = func.__qualname__.split('.')[0]
-        instance = cls._callback_instances.get(class_name)
-        if instance is None:
-            raise ValueError(f'Trying to get instance of {class_name} but it is not registered')
-        return instance
+        client = instance.__dict__.get('_client')
+        if client is None:
+            return
+        for listeners_by_id in client.listeners.values():
+            for listeners in listeners_by_id.values():
+                listeners[:] = [
+                    listener for listener in listeners if getattr(listener.callback, '__self__', None) is not instance
+                ]
+        client.listeners_version += 1
 
     @classmethod
     def subscribe(
@@ -69,42 +155,96 @@ class EventDispatcher:
         *events: Type[InboundEvent],
         state: ConnectionState | None = None,
         all_events: bool = False,
+        lazy: bool = False,
     ):
+        """
+        Registers the decorated function as a listener of the given events.
+
+        Functions listen to all connections. Methods of `InteractionModule` are only marked here and subscribed for
+        the connection of each instance when its client is set.
+
+        :param lazy: Pass a `LazyEvent` that decodes fields on access instead of a fully decoded event.
+        """
+
         def decorator(func):
-            for event in events:
-                cls._listeners[event.state][event.packet_id].append(Listener(event, func))
-            if all_events and state is None:
-                cls._listeners['*']['*'].append(Listener(None, func))
-            elif all_events and state is not None:
-                cls._listeners[state]['*'].append(Listener(None, func))
+            subscriptions: list[Subscription] = [
+                (event.state, event.packet_id, Listener(event, func, lazy)) for event in events
+            ]
+            if all_events:
+                subscriptions.append(('*' if state is None else state, '*', Listener(None, func, False)))
+
+            if 'self' in inspect.signature(func).parameters:
+                func.__subscriptions__ = getattr(func, '__subscriptions__', []) + subscriptions
+            else:
+                for subscription_state, packet_id, listener in subscriptions:
+                    cls._listeners[subscription_state][packet_id].append(listener)
+                EventDispatcher._listeners_version += 1
 
             return func
 
         return decorator
 
-    async def invoke_callback(self, callback: ListenerCallback, event: InboundEvent | SocketReader):
+    async def invoke_callback(self, callback: ListenerCallback, event: InboundEvent | LazyEvent | SocketReader):
         try:
-            if 'self' in inspect.signature(callback).parameters:
-                await callback(self.get_method_instance(callback), event)  # type: ignore[call-arg, arg-type]
-            else:
-                await callback(event)  # type: ignore[call-arg, arg-type]
+            await callback(event)  # type: ignore[call-arg, arg-type]
         except Exception as e:
             packet_id = getattr(event, 'packet_id', None)
             self.logger.error(f'Error while invoking callback {callback} for event {packet_id}: {e}')
             if int(os.getenv('DEBUG', -1)):
                 raise e
 
-    async def submit_event(self, packet_id: VarInt, raw_data: AsyncBytesIO) -> None:
-        listeners = (
-            self._listeners[self.client.state].get(packet_id.int, [])
-            + self._listeners['*'].get('*', [])
-            + self._listeners[self.client.state].get('*', [])
-        )
+    @staticmethod
+    def get_event(
+        listener: Listener,
+        raw_data: memoryview,
+        decoded: dict[tuple[Type[InboundEvent], bool], InboundEvent | LazyEvent],
+    ) -> InboundEvent | LazyEvent | SocketReader:
+        """
+        Returns the event for the listener, decoding the packet only once per event type.
+
+        :param decoded: Events already decoded from this packet.
+        """
+        if listener.event is None:  # Raw listeners read the packet themselves, so each one needs its own stream
+            return AsyncBytesIO(raw_data)
+        key = (listener.event, listener.lazy)
+        event = decoded.get(key)
+        if event is None:
+            event = listener.event.lazy(raw_data) if listener.lazy else listener.event.decode(raw_data)[0]
+            decoded[key] = event
+        return event
+
+    def resolve_listeners(self, state: str, packet_id: int) -> tuple[Listener, ...]:
+        listeners: list[Listener] = []
+        for table in (self.client.listeners, self._listeners):
+            listeners += table[state].get(packet_id, [])
+            listeners += table['*'].get('*', [])
+            listeners += table[state].get('*', [])
+        return tuple(listeners)
+
+    def get_listeners(self, state: str, packet_id: int) -> tuple[Listener, ...]:
+        """
+        Returns the listeners of the packet from the dispatch table.
+
+        Listeners are resolved once per state and packet id, the table is rebuilt only after subscriptions change.
+        """
+        version = (EventDispatcher._listeners_version, self.client.listeners_version)
+        if version != self._dispatch_table_version:
+            self._dispatch_table = {}
+            self._dispatch_table_version = version
+        listeners = self._dispatch_table.get((state, packet_id))
+        if listeners is None:
+            listeners = self._dispatch_table[(state, packet_id)] = self.resolve_listeners(state, packet_id)
+        return listeners
+
+    async def submit_event(self, packet_id: VarInt, raw_data: memoryview) -> None:
+        listeners = self.get_listeners(self.client.state, packet_id.int)
         if not listeners:
-            packet_len = len(raw_data.getvalue())
+            if not self.logger.isEnabledFor(DEBUG_TRACE):
+                return
+            packet_len = len(raw_data)
             raw_value = ''
             if packet_len < 100:
-                raw_value = f' Raw value: {raw_data.getvalue()!r}'
+                raw_value = f' Raw value: {bytes(raw_data)!r}'
             self.logger.log(
                 DEBUG_TRACE,
                 f'[State={self.client.state}] Received packet {packet_id.hex} but no listeners are registered. '
@@ -112,41 +252,102 @@ class EventDispatcher:
             )
             return
 
-        self.logger.log(
-            DEBUG_TRACE,
-            f'[State={self.client.state}] Received packet {packet_id.hex} for {len(listeners)} listeners. '
-            f'Length: {len(raw_data.getvalue())} bytes',
-        )
+        if self.logger.isEnabledFor(DEBUG_TRACE):
+            self.logger.log(
+                DEBUG_TRACE,
+                f'[State={self.client.state}] Received packet {packet_id.hex} for {len(listeners)} listeners. '
+                f'Length: {len(raw_data)} bytes',
+            )
 
+        decoded: dict[tuple[Type[InboundEvent], bool], InboundEvent | LazyEvent] = {}
         if len(listeners) == 1:  # Optimize for the common case
             listener = listeners[0]
-            await self.invoke_callback(
-                listener.callback,
-                await listener.event.from_stream(raw_data) if listener.event else raw_data,
-            )
+            await self.invoke_callback(listener.callback, self.get_event(listener, raw_data, decoded))
             return
 
-        data_value = raw_data.getvalue()
         await asyncio.gather(
             *[
-                self.invoke_callback(
-                    listener.callback,
-                    (
-                        await listener.event.from_stream(AsyncBytesIO(data_value))
-                        if listener.event
-                        else AsyncBytesIO(
-                            data_value,
-                        )
-                    ),
-                )
+                self.invoke_callback(listener.callback, self.get_event(listener, raw_data, decoded))
                 for listener in listeners
             ],
         )
 
+    async def enqueue(self, packet_id: VarInt, raw_data: memoryview) -> None:
+        settings: WorkerSettings = self.workers  # type: ignore[assignment]
+        get_ordering_key = settings.ordering_keys.get(packet_id.int)
+        key = None if get_ordering_key is None else get_ordering_key(raw_data)
+        queue = self.queues[hash(key) % len(self.queues)]
+
+        coalesced_key = (packet_id.int, key) if packet_id.int in settings.coalesced else None
+        previous = None if coalesced_key is None else self.pending.get(coalesced_key)
+        if previous is not None:
+            previous.stale = True
+
+        packet = QueuedPacket(packet_id, raw_data, coalesced_key)
+        if coalesced_key is not None:
+            self.pending[coalesced_key] = packet
+            # The newer packet still goes to the tail, so it's never handled before the packets received earlier
+            if queue.full() and settings.overflow == OverflowPolicy.DROP and queue.evict_stale():
+                self.dropped += 1
+                queue.put_nowait(packet)
+                return
+        await queue.put(packet)
+
+    async def worker(self, queue: PacketQueue) -> None:
+        while True:
+            packet = await queue.get()
+            try:
+                if packet.coalesced_key is not None and self.pending.get(packet.coalesced_key) is packet:
+                    del self.pending[packet.coalesced_key]
+                if not packet.stale:
+                    await self.submit_event(packet.packet_id, packet.raw_data)
+            except Exception as e:
+                self.logger.error(f'Error while handling packet {packet.packet_id.hex}: {e}')
+            finally:
+                queue.task_done()
+
+    async def drain(self) -> None:
+        for queue in self.queues:
+            await queue.join()
+
+    async def run_workers(self) -> None:
+        """
+        Reads packets and hands play state packets over to worker tasks, so slow listeners don't stall the socket.
+
+        Packets with the same ordering key are handled by the same worker in the order they were received, packets
+        with different keys can be handled in any order. Immediate packets are handled by the reader right away and
+        barriers after all queued packets. Packets of other states are handled by the reader, bundles aren't delayed.
+        """
+        settings: WorkerSettings = self.workers  # type: ignore[assignment]
+        self.queues = [PacketQueue(settings.queue_size) for _ in range(settings.workers)]
+        tasks = [asyncio.create_task(self.worker(queue)) for queue in self.queues]
+        try:
+            while True:
+                try:
+                    packet_id, raw_data = await self.client.unpack_packet()
+                except ConnectionClosed:
+                    self.logger.log(DEBUG_TRACE, 'Connection closed')
+                    break
+                state = self.client.state
+                if state != ConnectionState.PLAY or packet_id.int in settings.barriers:
+                    await self.drain()
+                    await self.submit_event(packet_id, raw_data)
+                elif packet_id.int in settings.immediate or not self.get_listeners(state, packet_id.int):
+                    await self.submit_event(packet_id, raw_data)
+                else:
+                    await self.enqueue(packet_id, raw_data)
+            await self.drain()
+        finally:
+            for task in tasks:
+                task.cancel()
+
     async def run_forever(self):
+        if self.workers is not None:
+            await self.run_workers()
+            return
         while True:
             try:
-                packet_id, raw_data = await self.client.unpack_packet(self.client.reader)
+                packet_id, raw_data = await self.client.unpack_packet()
             except ConnectionClosed:
                 self.logger.log(DEBUG_TRACE, 'Connection closed')
                 break
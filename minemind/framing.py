@@ -0,0 +1,71 @@
+from asyncio import StreamReader
+
+from minemind.mc_types import VarInt
+from minemind.protocols.utils import ConnectionClosed
+
+
+class FrameReader:
+    """
+    Cuts length-prefixed packet frames out of a socket stream.
+
+    Data is read from the socket in large chunks, and frames are sliced out of the received chunk without awaiting
+    each byte of the length prefix. Frames are returned as memoryview slices of immutable chunks, so a frame stays
+    valid after the next read and can be handed to listeners without copying.
+    """
+
+    RECEIVE_SIZE = 64 * 1024
+    MAX_FRAME_SIZE = (1 << 21) - 1  # Frame length is at most a 3 byte VarInt
+
+    def __init__(self, reader: StreamReader, receive_size: int = RECEIVE_SIZE, max_frame_size: int = MAX_FRAME_SIZE):
+        self.reader = reader
+        self.receive_size = receive_size
+        self.max_frame_size = max_frame_size
+        self._buffer = b''
+        self._view = memoryview(self._buffer)
+        self._offset = 0
+
+    @property
+    def buffered(self) -> int:
+        return len(self._buffer) - self._offset
+
+    async def _fill(self, size: int) -> None:
+        """
+        Makes sure at least `size` unread bytes are buffered.
+
+        The unread tail and all new chunks are joined once, so a large frame arriving in many fragments is copied
+        only once instead of being concatenated after every read.
+        """
+        available = self.buffered
+        if available >= size:
+            return
+        chunks = [self._view[self._offset :]] if available else []
+        missing = size - available
+        while missing > 0:
+            chunk = await self.reader.read(max(missing, self.receive_size))
+            if not chunk:
+                raise ConnectionClosed('Connection closed')
+            chunks.append(chunk)  # type: ignore[arg-type]
+            missing -= len(chunk)
+        self._buffer = chunks[0] if len(chunks) == 1 else b''.join(chunks)  # type: ignore[assignment]
+        self._view = memoryview(self._buffer)
+        self._offset = 0
+
+    async def read_frame(self) -> memoryview:
+        while True:
+            try:
+                frame_length, prefix_size = VarInt._read_varint(self._view, self._offset)
+                break
+            except IndexError:
+                if self.buffered >= VarInt.max_size:
+                    raise IOError('VarInt is too big')
+                await self._fill(self.buffered + 1)
+        if prefix_size > VarInt.max_size:
+            raise IOError('VarInt is too big')
+        if frame_length > self.max_frame_size:
+            raise IOError(f'Frame of {frame_length} bytes is larger than {self.max_frame_size} bytes')
+
+        self._offset += prefix_size
+        await self._fill(frame_length)
+        start = self._offset
+        self._offset += frame_length
+        return self._view[start : self._offset]
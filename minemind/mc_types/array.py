@@ -1,6 +1,6 @@
 from typing import Any, TypeVar
 
-from minemind.mc_types.base import MCType, SocketReader
+from minemind.mc_types.base import Buffer, MCType, SocketReader
 from minemind.mc_types.int import Long
 from minemind.mc_types.varnum import VarInt
 
@@ -18,6 +18,26 @@ class Array(list[T], MCType):
             instance.append(await mc_type.from_stream(reader, **type_params))
         return instance
 
+    @classmethod
+    def decode(  # type: ignore[override]
+        cls,
+        buffer: Buffer,
+        offset: int = 0,
+        length: int | None = None,
+        mc_type: type[T] | None = None,
+        **kwargs,
+    ):
+        type_params = kwargs.get('type_params', {})
+        instance: Array[T] = cls()
+        if length is None:
+            varint_length, offset = VarInt.decode(buffer, offset)
+            length = varint_length.int
+        decode = mc_type.decode  # type: ignore[union-attr]
+        for _ in range(length):
+            value, offset = decode(buffer, offset, **type_params)
+            instance.append(value)
+        return instance, offset
+
     def get(self, index: int, default: Any = None) -> T | None:
         try:
             return self[index]
@@ -31,3 +51,12 @@ class BitSet(Array[Long]):
     async def from_stream(cls, reader: SocketReader, **kwargs) -> 'BitSet':  # type: ignore[override]
         length = await VarInt.from_stream(reader)
         return await super().from_stream(reader, length.int, Long, **kwargs)  # type: ignore[return-value]
+
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0, **kwargs) -> tuple['BitSet', int]:  # type: ignore[override]
+        length, offset = VarInt.decode(buffer, offset)
+        return super().decode(buffer, offset, length.int, Long, **kwargs)
+
+    def is_set(self, index: int) -> bool:
+        word = index >> 6
+        return word < len(self) and bool((self[word].int >> (index & 63)) & 1)
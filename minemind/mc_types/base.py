@@ -2,6 +2,8 @@ import abc
 import io
 import math
 from asyncio import StreamReader
+from struct import Struct
+from typing import Any
 
 
 class AsyncBytesIO(io.BytesIO):
@@ -10,6 +12,24 @@ class AsyncBytesIO(io.BytesIO):
 
 
 SocketReader = StreamReader | AsyncBytesIO
+Buffer = bytes | bytearray | memoryview
+
+_padding: dict[int, bytes] = {}
+
+
+def pack_into(buffer: bytearray, packer: Struct, *values: Any) -> None:
+    """
+    Appends values packed with `packer` to the end of the buffer.
+
+    The buffer is grown by the packed size and the values are written in place, so no intermediate bytes object is
+    created for the packed values.
+    """
+    offset = len(buffer)
+    padding = _padding.get(packer.size)
+    if padding is None:
+        padding = _padding[packer.size] = bytes(packer.size)
+    buffer += padding
+    packer.pack_into(buffer, offset, *values)
 
 
 class MCType(abc.ABC):
@@ -18,6 +38,17 @@ class MCType(abc.ABC):
     async def from_stream(cls, reader: SocketReader, **kwargs):
         raise NotImplementedError
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0, **kwargs) -> tuple[Any, int]:
+        """
+        Decodes a value from an in-memory buffer without awaiting.
+
+        :param buffer: The buffer to read the value from.
+        :param offset: The position in the buffer to start reading at.
+        :return: A tuple containing the value and the offset right after it.
+        """
+        raise NotImplementedError
+
 
 class Vector3:
 
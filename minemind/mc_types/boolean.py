@@ -1,4 +1,4 @@
-from minemind.mc_types.base import MCType, SocketReader
+from minemind.mc_types.base import Buffer, MCType, SocketReader
 
 
 class Boolean(MCType):
@@ -41,3 +41,7 @@ class Boolean(MCType):
                 (await reader.read(1))[0],
             ),
         )
+
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0, **kwargs) -> tuple['Boolean', int]:
+        return cls(bool(buffer[offset])), offset + 1
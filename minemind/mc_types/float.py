@@ -1,10 +1,12 @@
 import struct
 from decimal import Decimal
 
-from minemind.mc_types.base import MCType, SocketReader
+from minemind.mc_types.base import Buffer, MCType, SocketReader
 
 
 class Float(MCType):
+    struct = struct.Struct('>f')
+
     def __init__(self, value: int | float | bytes):
         self.float_value = None
         self.bytes_value = None
@@ -35,6 +37,10 @@ class Float(MCType):
     async def from_stream(cls, reader: SocketReader, **kwargs) -> 'Float':
         return cls(await reader.read(4))
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0, **kwargs) -> tuple['Float', int]:
+        return cls(cls.struct.unpack_from(buffer, offset)[0]), offset + 4
+
     @property
     def float(self) -> float:
         return float(self)
@@ -45,6 +51,8 @@ class Float(MCType):
 
 
 class Double(MCType):
+    struct = struct.Struct('>d')
+
     def __init__(self, value: Decimal | float | bytes):
         self.float_value = None
         self.bytes_value = None
@@ -75,6 +83,10 @@ class Double(MCType):
     async def from_stream(cls, reader: SocketReader, **kwargs) -> 'Double':
         return cls(await reader.read(8))
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0, **kwargs) -> tuple['Double', int]:
+        return cls(cls.struct.unpack_from(buffer, offset)[0]), offset + 8
+
     @property
     def float(self) -> float:
         return float(self)
@@ -1,9 +1,12 @@
-from minemind.mc_types.base import MCType, SocketReader
+from struct import Struct
+
+from minemind.mc_types.base import Buffer, MCType, SocketReader
 
 
 class Int(MCType):
     size = 4  # size of the number type in bytes
     signed = True
+    struct = Struct('>i')
 
     def __init__(self, value: int | bytes):
         self.int_value = None
@@ -33,6 +36,10 @@ class Int(MCType):
     async def from_stream(cls, reader: SocketReader, **kwargs):
         return cls(await reader.read(cls.size))
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0, **kwargs):
+        return cls(cls.struct.unpack_from(buffer, offset)[0]), offset + cls.size
+
     @property
     def int(self) -> int:
         return int(self)
@@ -44,27 +51,34 @@ class Int(MCType):
 
 class UInt(Int):
     signed = False
+    struct = Struct('>I')
 
 
 class Byte(Int):
     size = 1
+    struct = Struct('>b')
 
 
 class UByte(Byte):
     signed = False
+    struct = Struct('>B')
 
 
 class Short(Int):
     size = 2
+    struct = Struct('>h')
 
 
 class UShort(Short):
     signed = False
+    struct = Struct('>H')
 
 
 class Long(Int):
     size = 8
+    struct = Struct('>q')
 
 
 class ULong(Long):
     signed = False
+    struct = Struct('>Q')
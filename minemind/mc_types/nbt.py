@@ -4,11 +4,13 @@ Named Binary Tag (NBT) data types.
 TODO: Make these types more usable by implementing dunder methods.
 """
 
-from struct import Struct
-from typing import TypeVar
+import sys
+from array import array
+from struct import Struct, unpack_from
+from typing import Any, TypeVar
 
 from minemind import mc_types
-from minemind.mc_types.base import MCType, SocketReader
+from minemind.mc_types.base import Buffer, MCType, SocketReader
 
 TAG_END = 0
 TAG_BYTE = 1
@@ -27,6 +29,14 @@ TAG_LONG_ARRAY = 12
 
 T = TypeVar('T')
 
+# Payload size of fixed size tags
+_SIZES = {TAG_BYTE: 1, TAG_SHORT: 2, TAG_INT: 4, TAG_LONG: 8, TAG_FLOAT: 4, TAG_DOUBLE: 8}
+_FORMATS = {TAG_BYTE: 'b', TAG_SHORT: 'h', TAG_INT: 'i', TAG_LONG: 'q', TAG_FLOAT: 'f', TAG_DOUBLE: 'd'}
+_STRUCTS = {tag_type: Struct('>' + format) for tag_type, format in _FORMATS.items()}
+_ARRAY_ITEM_SIZES = {TAG_BYTE_ARRAY: 1, TAG_INT_ARRAY: 4, TAG_LONG_ARRAY: 8}
+_USHORT = Struct('>H')
+_INT = Struct('>i')
+
 
 class Tag:
     mc_type: type[MCType]
@@ -52,6 +62,18 @@ class Tag:
             value=await cls.mc_type.from_stream(reader),
         )
 
+    @classmethod
+    def decode_name(cls, buffer: Buffer, offset: int) -> tuple[mc_types.String, int]:
+        return mc_types.String.decode(buffer, offset, len_type=mc_types.UShort)
+
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0, has_name: bool = True):
+        name = None
+        if has_name:
+            name, offset = cls.decode_name(buffer, offset)
+        value, offset = cls.mc_type.decode(buffer, offset)
+        return cls(name=name, value=value), offset
+
 
 class Byte(Tag):
     mc_type: type[MCType] = mc_types.Byte
@@ -86,6 +108,14 @@ class String(Tag):
         value = await cls.mc_type.from_stream(reader, len_type=mc_types.UShort)
         return cls(name=name, value=value)
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0, has_name: bool = True):
+        name = None
+        if has_name:
+            name, offset = cls.decode_name(buffer, offset)
+        value, offset = cls.mc_type.decode(buffer, offset, len_type=mc_types.UShort)
+        return cls(name=name, value=value), offset
+
 
 class ByteArray(Tag):
     @classmethod
@@ -97,6 +127,15 @@ class ByteArray(Tag):
             value=await reader.read(length.int),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0, has_name: bool = True):
+        name = None
+        if has_name:
+            name, offset = cls.decode_name(buffer, offset)
+        length, offset = mc_types.Int.decode(buffer, offset)
+        end = offset + length.int
+        return cls(name=name, value=bytes(buffer[offset:end])), end
+
 
 class IntArray(Tag):
     @classmethod
@@ -109,6 +148,15 @@ class IntArray(Tag):
             value=list(fmt.unpack(await reader.read(fmt.size))),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0, has_name: bool = True):
+        name = None
+        if has_name:
+            name, offset = cls.decode_name(buffer, offset)
+        length, offset = mc_types.Int.decode(buffer, offset)
+        fmt = Struct(">" + str(length.int) + "i")
+        return cls(name=name, value=list(fmt.unpack_from(buffer, offset))), offset + fmt.size
+
 
 class LongArray(Tag):
     @classmethod
@@ -121,6 +169,15 @@ class LongArray(Tag):
             value=list(fmt.unpack(await reader.read(fmt.size))),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0, has_name: bool = True):
+        name = None
+        if has_name:
+            name, offset = cls.decode_name(buffer, offset)
+        length, offset = mc_types.Int.decode(buffer, offset)
+        fmt = Struct(">" + str(length.int) + "q")
+        return cls(name=name, value=list(fmt.unpack_from(buffer, offset))), offset + fmt.size
+
 
 class List(Tag):
     def __init__(self, name: mc_types.String | None = None, value: list | None = None, tag_type_id: int | None = None):
@@ -144,6 +201,22 @@ class List(Tag):
             tag_type_id=tag_type_id.int,
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0, has_name: bool = True):
+        name = None
+        if has_name:
+            name, offset = cls.decode_name(buffer, offset)
+        tag_type_id, offset = mc_types.Byte.decode(buffer, offset)
+        length, offset = mc_types.Int.decode(buffer, offset)
+        tags = []
+        tag_type = TAG_REGISTRY.get(tag_type_id.int)
+        if tag_type is None:
+            raise ValueError('Unknown tag byte:', tag_type_id.int)
+        for _ in range(length.int):
+            tag, offset = tag_type.decode(buffer, offset, has_name=False)
+            tags.append(tag)
+        return cls(name=name, value=tags, tag_type_id=tag_type_id.int), offset
+
 
 class Compound(Tag):
     @classmethod
@@ -167,6 +240,26 @@ class Compound(Tag):
             value=tags,
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0, has_name: bool = True):
+        tags = {}
+        name = None
+        if has_name:
+            name, offset = cls.decode_name(buffer, offset)
+        while True:
+            tag_byte, offset = mc_types.Byte.decode(buffer, offset)
+            if tag_byte.int == TAG_END:
+                break
+
+            tag_type = TAG_REGISTRY.get(tag_byte.int)
+            if tag_type is None:
+                raise ValueError('Unknown tag byte:', tag_byte.int)
+
+            tag, offset = tag_type.decode(buffer, offset)
+            tags[tag.name] = tag
+
+        return cls(name=name, value=tags), offset
+
 
 class NBT:
     """
@@ -186,6 +279,274 @@ class NBT:
             return None
         return await tag_type.from_stream(reader, not is_anonymous)
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0, is_anonymous: bool = True) -> tuple[T | None, int]:
+        first_tag_id, offset = mc_types.Byte.decode(buffer, offset)
+        if first_tag_id.int == TAG_COMPOUND:
+            return Compound.decode(buffer, offset, has_name=not is_anonymous)
+        tag_type = TAG_REGISTRY.get(first_tag_id.int)
+        if tag_type is None:
+            return None, offset
+        return tag_type.decode(buffer, offset, not is_anonymous)
+
+    @classmethod
+    def decode_value(cls, buffer: Buffer, offset: int = 0, is_anonymous: bool = True) -> tuple[Any, int]:
+        """
+        Decodes NBT into plain values without a tree of tags.
+
+        Compounds become dicts, lists become lists, strings become str, byte arrays become bytes and int and long
+        arrays become `array('i')` and `array('q')`. Nested tags are decoded with an explicit stack, so deep NBT
+        doesn't recurse.
+        :return: A tuple containing the value, None for an empty NBT, and the offset right after it.
+        """
+        tag_type = buffer[offset]
+        offset += 1
+        if tag_type == TAG_END:
+            return None, offset
+        if not is_anonymous:
+            offset += 2 + _USHORT.unpack_from(buffer, offset)[0]
+        value, offset = _decode_payload(buffer, offset, tag_type)
+        if offset > len(buffer):
+            raise IndexError('NBT is out of buffer bounds')
+        return value, offset
+
+    @classmethod
+    def skip(cls, buffer: Buffer, offset: int = 0, is_anonymous: bool = True) -> int:
+        """
+        Finds the end of NBT without decoding it, for NBT that is ignored.
+
+        :return: The offset right after the NBT.
+        """
+        tag_type = buffer[offset]
+        offset += 1
+        if tag_type == TAG_END:
+            return offset
+        if not is_anonymous:
+            offset += 2 + _USHORT.unpack_from(buffer, offset)[0]
+        offset = _skip_payload(buffer, offset, tag_type)
+        if offset > len(buffer):
+            raise IndexError('NBT is out of buffer bounds')
+        return offset
+
+    @classmethod
+    def read_raw(cls, buffer: Buffer, offset: int = 0, is_anonymous: bool = True) -> tuple[bytes | None, int]:
+        """
+        Copies NBT out of the buffer undecoded, it can be decoded with `decode_value` when it is needed.
+
+        :return: A tuple containing the NBT bytes, None for an empty NBT, and the offset right after it.
+        """
+        end = cls.skip(buffer, offset, is_anonymous)
+        if end == offset + 1:
+            return None, end
+        return bytes(buffer[offset:end]), end
+
+    @classmethod
+    async def read_raw_from_stream(cls, reader: SocketReader, is_anonymous: bool = True) -> bytes | None:
+        """
+        Reads NBT from the stream undecoded, the same bytes `read_raw` copies out of a buffer.
+
+        :return: The NBT bytes, None for an empty NBT.
+        """
+        data = bytearray(await reader.read(1))
+        tag_type = data[0]
+        if tag_type == TAG_END:
+            return None
+        if not is_anonymous:
+            await _read_string(reader, data)
+        await _read_stream_payload(reader, data, tag_type)
+        return bytes(data)
+
+    @classmethod
+    async def value_from_stream(cls, reader: SocketReader, is_anonymous: bool = True) -> Any:
+        """
+        Reads NBT from the stream into the same plain values `decode_value` returns.
+        """
+        data = await cls.read_raw_from_stream(reader, is_anonymous)
+        if data is None:
+            return None
+        return cls.decode_value(data, 0, is_anonymous)[0]
+
+
+def _read_length(buffer: Buffer, offset: int) -> int:
+    # A negative length would move the offset backwards, so malformed NBT could be read forever
+    length = _INT.unpack_from(buffer, offset)[0]
+    if length < 0:
+        raise ValueError('Negative NBT length:', length)
+    return length
+
+
+def _read_array(buffer: Buffer, offset: int, typecode: str) -> tuple[array, int]:
+    length = _read_length(buffer, offset)
+    values = array(typecode)
+    end = offset + 4 + length * values.itemsize
+    if end > len(buffer):
+        raise IndexError('NBT array is out of buffer bounds')
+    values.frombytes(buffer[offset + 4 : end])
+    if sys.byteorder == 'little':
+        values.byteswap()
+    return values, end
+
+
+def _decode_payload(buffer: Buffer, offset: int, tag_type: int) -> tuple[Any, int]:
+    root: list[Any] = []
+    # Open containers: compounds as [dict, None, 0] and lists as [list, element tag type, elements left]
+    stack: list[list[Any]] = [[root, tag_type, 1]]
+    while stack:
+        frame = stack[-1]
+        container, element_type, remaining = frame
+        if element_type is None:
+            tag_type = buffer[offset]
+            if tag_type == TAG_END:
+                offset += 1
+                stack.pop()
+                continue
+            name_length = _USHORT.unpack_from(buffer, offset + 1)[0]
+            offset += 3
+            name = str(buffer[offset : offset + name_length], 'utf-8')
+            offset += name_length
+        elif remaining:
+            frame[2] = remaining - 1
+            tag_type = element_type
+            name = None
+        else:
+            stack.pop()
+            continue
+
+        value: Any
+        if tag_type in _STRUCTS:
+            value = _STRUCTS[tag_type].unpack_from(buffer, offset)[0]
+            offset += _SIZES[tag_type]
+        elif tag_type == TAG_STRING:
+            length = _USHORT.unpack_from(buffer, offset)[0]
+            offset += 2
+            value = str(buffer[offset : offset + length], 'utf-8')
+            offset += length
+        elif tag_type == TAG_COMPOUND:
+            value = {}
+            stack.append([value, None, 0])
+        elif tag_type == TAG_LIST:
+            list_type = buffer[offset]
+            length = _read_length(buffer, offset + 1)
+            offset += 5
+            if list_type in _FORMATS:
+                # Lists of numbers, e.g. positions and motion, are unpacked at once
+                value = list(unpack_from(f'>{length}{_FORMATS[list_type]}', buffer, offset))
+                offset += length * _SIZES[list_type]
+            else:
+                value = []
+                if length > 0:
+                    stack.append([value, list_type, length])
+        elif tag_type == TAG_BYTE_ARRAY:
+            length = _read_length(buffer, offset)
+            offset += 4
+            value = bytes(buffer[offset : offset + length])
+            offset += length
+        elif tag_type == TAG_INT_ARRAY:
+            value, offset = _read_array(buffer, offset, 'i')
+        elif tag_type == TAG_LONG_ARRAY:
+            value, offset = _read_array(buffer, offset, 'q')
+        else:
+            raise ValueError('Unknown tag byte:', tag_type)
+
+        if name is None:
+            container.append(value)
+        else:
+            container[name] = value
+    return root[0], offset
+
+
+def _skip_payload(buffer: Buffer, offset: int, tag_type: int) -> int:
+    # Open containers: None for compounds, elements left and their tag type for lists
+    stack: list[list[int] | None] = [[1, tag_type]]
+    while stack:
+        frame = stack[-1]
+        if frame is None:
+            tag_type = buffer[offset]
+            if tag_type == TAG_END:
+                offset += 1
+                stack.pop()
+                continue
+            offset += 3 + _USHORT.unpack_from(buffer, offset + 1)[0]
+        elif frame[0]:
+            frame[0] -= 1
+            tag_type = frame[1]
+        else:
+            stack.pop()
+            continue
+
+        size = _SIZES.get(tag_type)
+        if size is not None:
+            offset += size
+        elif tag_type == TAG_STRING:
+            offset += 2 + _USHORT.unpack_from(buffer, offset)[0]
+        elif tag_type == TAG_COMPOUND:
+            stack.append(None)
+        elif tag_type == TAG_LIST:
+            list_type = buffer[offset]
+            length = _read_length(buffer, offset + 1)
+            offset += 5
+            size = _SIZES.get(list_type)
+            if size is not None:
+                offset += length * size
+            elif length > 0:
+                stack.append([length, list_type])
+        elif tag_type == TAG_BYTE_ARRAY:
+            offset += 4 + _read_length(buffer, offset)
+        elif tag_type == TAG_INT_ARRAY:
+            offset += 4 + 4 * _read_length(buffer, offset)
+        elif tag_type == TAG_LONG_ARRAY:
+            offset += 4 + 8 * _read_length(buffer, offset)
+        else:
+            raise ValueError('Unknown tag byte:', tag_type)
+    return offset
+
+
+async def _read_string(reader: SocketReader, data: bytearray) -> None:
+    data += await reader.read(2)
+    data += await reader.read(_USHORT.unpack_from(data, len(data) - 2)[0])
+
+
+async def _read_stream_payload(reader: SocketReader, data: bytearray, tag_type: int) -> None:
+    # Walks the NBT like _skip_payload, appending every part read from the stream to data
+    stack: list[list[int] | None] = [[1, tag_type]]
+    while stack:
+        frame = stack[-1]
+        if frame is None:
+            data += await reader.read(1)
+            tag_type = data[-1]
+            if tag_type == TAG_END:
+                stack.pop()
+                continue
+            await _read_string(reader, data)
+        elif frame[0]:
+            frame[0] -= 1
+            tag_type = frame[1]
+        else:
+            stack.pop()
+            continue
+
+        size = _SIZES.get(tag_type)
+        if size is not None:
+            data += await reader.read(size)
+        elif tag_type == TAG_STRING:
+            await _read_string(reader, data)
+        elif tag_type == TAG_COMPOUND:
+            stack.append(None)
+        elif tag_type == TAG_LIST:
+            data += await reader.read(5)
+            list_type = data[-5]
+            length = _read_length(data, len(data) - 4)
+            size = _SIZES.get(list_type)
+            if size is not None:
+                data += await reader.read(length * size)
+            elif length > 0:
+                stack.append([length, list_type])
+        elif tag_type in _ARRAY_ITEM_SIZES:
+            data += await reader.read(4)
+            data += await reader.read(_ARRAY_ITEM_SIZES[tag_type] * _read_length(data, len(data) - 4))
+        else:
+            raise ValueError('Unknown tag byte:', tag_type)
+
 
 TAG_REGISTRY = {
     TAG_END: None,
@@ -1,8 +1,11 @@
-from minemind.mc_types.base import MCType, SocketReader
+from struct import Struct
+
+from minemind.mc_types.base import Buffer, MCType, SocketReader
 
 
 class Position(MCType):
     # Might have bugs, because it returns Position(60, 16767550193740, 4093640184) for the death position
+    struct = Struct('>q')
 
     def __init__(self, x: int, y: int, z: int):
         self.x = x
@@ -12,7 +15,14 @@ class Position(MCType):
     @classmethod
     async def from_stream(cls, reader: SocketReader, **kwargs) -> 'Position':
         bytes_struct = await reader.read(8)
-        val = int.from_bytes(bytes_struct, 'big', signed=True)
+        return cls.from_long(int.from_bytes(bytes_struct, 'big', signed=True))
+
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0, **kwargs) -> tuple['Position', int]:
+        return cls.from_long(cls.struct.unpack_from(buffer, offset)[0]), offset + 8
+
+    @classmethod
+    def from_long(cls, val: int) -> 'Position':
         x = (val >> 38) & 0x3FFFFFF  # Mask 26 bits for x
         y = val & 0xFFF  # Mask 12 bits for y
         z = (val >> 12) & 0x3FFFFFF  # Mask 26 bits for z
@@ -1,6 +1,6 @@
 from typing import Type
 
-from minemind.mc_types.base import MCType, SocketReader
+from minemind.mc_types.base import Buffer, MCType, SocketReader
 from minemind.mc_types.int import Int
 from minemind.mc_types.varnum import VarInt
 
@@ -24,6 +24,18 @@ class String(MCType):
         length = await len_type.from_stream(reader)
         return cls((await reader.read(length.int)).decode('utf-8'))
 
+    @classmethod
+    def decode(
+        cls,
+        buffer: Buffer,
+        offset: int = 0,
+        len_type: Type[VarInt] | Type[Int] = VarInt,
+        **kwargs,
+    ) -> tuple['String', int]:
+        length, offset = len_type.decode(buffer, offset)
+        end = offset + length.int
+        return cls(str(buffer[offset:end], 'utf-8')), end
+
     def __str__(self):
         if self.str_value is None:
             length, offset = VarInt._read_varint(self.bytes_value)
@@ -1,6 +1,6 @@
 import uuid
 
-from minemind.mc_types.base import MCType, SocketReader
+from minemind.mc_types.base import Buffer, MCType, SocketReader
 
 
 class UUID(MCType):
@@ -23,6 +23,10 @@ class UUID(MCType):
     async def from_stream(cls, reader: SocketReader, **kwargs) -> 'UUID':
         return cls(uuid.UUID(bytes=await reader.read(16)))
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0, **kwargs) -> tuple['UUID', int]:
+        return cls(uuid.UUID(bytes=bytes(buffer[offset : offset + 16]))), offset + 16
+
     @property
     def uuid(self) -> uuid.UUID:
         if self.uuid_value is None:
@@ -1,11 +1,16 @@
+from array import array
 from typing import Tuple
 
-from minemind.mc_types.base import MCType, SocketReader
+from minemind.mc_types.base import Buffer, MCType, SocketReader
 from minemind.protocols.utils import ConnectionClosed
 
+# Encoded values of small ints, like packet ids and lengths of short strings and arrays
+_encoded = tuple(bytes((value,)) if value < 0x80 else bytes((value & 0x7F | 0x80, value >> 7)) for value in range(256))
+
 
 class VarNum(MCType):
     max_size: int
+    bits: int  # Size of the signed integer the value is stored in
 
     def __init__(self, value: int | bytes) -> None:
         self.int_value = None
@@ -37,6 +42,65 @@ class VarNum(MCType):
                 break
         return cls(result)
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0, **kwargs):
+        # Most VarInts fit in one or two bytes
+        byte = buffer[offset]
+        if byte < 0x80:
+            return cls(byte), offset + 1
+        second = buffer[offset + 1]
+        if second < 0x80:
+            return cls((byte & 0x7F) | (second << 7)), offset + 2
+        result, size = cls._read_varint(buffer, offset)  # type: ignore[arg-type]
+        if size > cls.max_size:
+            raise IOError("VarInt is too big")
+        return cls(result), offset + size
+
+    @classmethod
+    def decode_many(cls, buffer: Buffer, count: int, offset: int = 0) -> tuple[array, int]:
+        """
+        Decodes `count` consecutive values from the buffer in one call.
+
+        Unlike `decode`, values are returned as signed integers of `bits` bits, like the server wrote them.
+
+        :param buffer: The buffer to read the values from.
+        :param count: The number of values to read.
+        :param offset: The position in the buffer to start reading at.
+        :return: A tuple containing an array('q') of the values and the offset right after them.
+        :raises IndexError: If there is not enough data to read all values.
+        """
+        end = offset + count
+        if end > len(buffer):
+            raise IndexError("Not enough data to read VarInt")
+        if not count or max(buffer[offset:end]) < 0x80:
+            # Every value fits in a single byte, iter() keeps bytes from being read as raw machine values
+            return array('q', iter(buffer[offset:end])), end
+
+        values = array('q', bytes(8 * count))
+        max_shift = 7 * cls.max_size
+        mask = (1 << cls.bits) - 1
+        sign = 1 << (cls.bits - 1)
+        for index in range(count):
+            byte = buffer[offset]
+            offset += 1
+            if byte < 0x80:
+                values[index] = byte
+                continue
+            result = byte & 0x7F
+            shift = 7
+            while True:
+                byte = buffer[offset]
+                offset += 1
+                result |= (byte & 0x7F) << shift
+                if byte < 0x80:
+                    break
+                shift += 7
+                if shift >= max_shift:
+                    raise IOError("VarInt is too big")
+            result &= mask
+            values[index] = result - (result & sign) * 2
+        return values, offset
+
     @classmethod
     def _read_varint(cls, data: bytes, offset: int = 0) -> Tuple[int, int]:
         """
@@ -47,6 +111,13 @@ class VarNum(MCType):
         :return: A tuple containing the VarInt and the number of bytes read.
         :raises IndexError: If there is not enough data to read a VarInt.
         """
+        # Most VarInts fit in one or two bytes
+        byte = data[offset]
+        if byte < 0x80:
+            return byte, 1
+        if offset + 1 < len(data) and data[offset + 1] < 0x80:
+            return (byte & 0x7F) | (data[offset + 1] << 7), 2
+
         num_read = 0
         result = 0
         while True:
@@ -68,6 +139,10 @@ class VarNum(MCType):
         :param value: The integer value to encode as a VarInt.
         :return: A bytes object containing the VarInt representation.
         """
+        if 0 <= value < 256:
+            return _encoded[value]
+        if value < 0:
+            value += 1 << cls.bits
         result = bytearray()
         while True:
             temp = value & 0x7F  # Get the last 7 bits
@@ -79,6 +154,24 @@ class VarNum(MCType):
                 break
         return bytes(result)
 
+    @classmethod
+    def write(cls, buffer: bytearray, value: int) -> None:
+        """
+        Appends the VarInt representation of the value to the end of the buffer.
+
+        :param buffer: The buffer to write to.
+        :param value: The integer value to encode as a VarInt.
+        """
+        if 0 <= value < 0x80:
+            buffer.append(value)
+            return
+        if value < 0:
+            value += 1 << cls.bits
+        while value & ~0x7F:
+            buffer.append(value & 0x7F | 0x80)
+            value >>= 7
+        buffer.append(value)
+
     def __int__(self):
         if self.int_value is None:
             self.int_value, _ = self._read_varint(self.bytes_value)
@@ -107,7 +200,9 @@ class VarNum(MCType):
 
 class VarInt(VarNum):
     max_size = 5
+    bits = 32
 
 
 class VarLong(VarNum):
     max_size = 10
+    bits = 64
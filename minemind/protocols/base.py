@@ -1,12 +1,28 @@
+from minemind.client import Client
 from minemind.dispatcher import EventDispatcher
 
 
 class InteractionModule:
+    """
+    Base class of modules which subscribe to events with their methods.
 
-    def __new__(cls, *args, **kwargs):
-        instance = super().__new__(cls)
-        EventDispatcher.add_callback_instance(instance)
-        return instance
+    Subscribed methods are bound when the client of the module is set, so each connection dispatches events to its
+    own modules and many bots can share one process.
+    """
+
+    # TODO: Incompatible types in assignment (expression has type "None", variable has type "Client")
+    _client: Client = None  # type: ignore[assignment]
+
+    @property
+    def client(self) -> Client:
+        return self._client
+
+    @client.setter
+    def client(self, client: Client) -> None:
+        EventDispatcher.remove_callback_instance(self)
+        self._client = client
+        if client is not None:
+            EventDispatcher.add_callback_instance(self)
 
     def __del__(self):
         EventDispatcher.remove_callback_instance(self)
@@ -1,7 +1,7 @@
-# TODO: Made these classes immutable to improve performance and not to parse the same data in dispatcher multiple times
 import abc
+from typing import Any
 
-from minemind.mc_types.base import SocketReader
+from minemind.mc_types.base import Buffer, MCType, SocketReader
 from minemind.protocols.enums import ConnectionState
 
 
@@ -14,12 +14,107 @@ class Event(abc.ABC):
 
 
 class InboundEvent(Event, abc.ABC):
+    """
+    Packet received from the server.
+
+    An event is decoded once per packet and the same instance is passed to every listener, so listeners must treat
+    it as read-only.
+    """
+
+    # Wire layout of flat packets as (attribute name, MCType) pairs, required for lazy decoding
+    fields: tuple[tuple[str, type[MCType]], ...] = ()
+
     @classmethod
     async def from_stream(cls, reader: SocketReader):
         return cls()
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0):
+        """
+        Synchronous counterpart of `from_stream` for packets that are already in memory.
+
+        :return: A tuple containing the event and the offset right after it.
+        """
+        return cls(), offset
+
+    @classmethod
+    def lazy(cls, buffer: Buffer) -> 'InboundEvent | LazyEvent':
+        """
+        Wraps the packet into an event that decodes fields only when they are accessed.
+
+        Falls back to a regular decode for events that don't describe their `fields`.
+        """
+        if not cls.fields:
+            return cls.decode(buffer)[0]
+        return LazyEvent(cls, buffer)
+
+
+class LazyEvent:
+    """
+    Read-only view of an inbound packet that decodes its fields on first access.
+
+    Fields are decoded in wire order up to the requested one, so a listener that only reads `entity_id` never pays
+    for the rest of the packet. Decoded fields are cached in the instance dict, so repeated access is a plain
+    attribute lookup. The view keeps a reference to the packet buffer until it is garbage collected.
+    """
+
+    def __init__(self, event: type[InboundEvent], buffer: Buffer):
+        state = self.__dict__
+        state['event'] = event
+        state['_buffer'] = buffer
+        state['_offset'] = 0
+        state['_decoded'] = 0
+
+    @property
+    def packet_id(self) -> int:
+        return self.event.packet_id
+
+    @property
+    def state(self) -> ConnectionState:
+        return self.event.state
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for fields that are not decoded yet
+        if name.startswith('_'):
+            raise AttributeError(name)
+        state = self.__dict__
+        fields = self.event.fields
+        decoded, offset = self._decoded, self._offset
+        while decoded < len(fields):
+            field_name, mc_type = fields[decoded]
+            state[field_name], offset = mc_type.decode(self._buffer, offset)
+            decoded += 1
+            if field_name == name:
+                break
+        state['_decoded'], state['_offset'] = decoded, offset
+        if name not in state:
+            raise AttributeError(f'{self.event.__name__} has no field {name!r}')
+        return state[name]
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f'{self.event.__name__} is read-only')
+
+    def materialize(self) -> InboundEvent:
+        """
+        Decodes the whole packet into a regular event.
+        """
+        return self.event.decode(self._buffer)[0]
+
+    def __repr__(self):
+        values = {name: value for name, value in self.__dict__.items() if name != 'event' and name[0] != '_'}
+        return f'Lazy{self.event.__name__}({values})'
+
 
 class OutboundEvent(Event, abc.ABC):
     @property
     def payload(self) -> bytes:
         return b''
+
+    def encode(self, buffer: bytearray) -> None:
+        """
+        Appends the payload to the end of the buffer.
+
+        Packets sent often override it to write their fields into the buffer in place, instead of joining the bytes
+        of every field into a new payload.
+        """
+        buffer += self.payload
@@ -1,11 +1,12 @@
 import asyncio
 import uuid
+from concurrent.futures import Executor
 from contextlib import asynccontextmanager
 from datetime import UTC, datetime
 
 from minemind import DEBUG_GAME_EVENTS, DEBUG_PROTOCOL
-from minemind.client import Client
-from minemind.dispatcher import EventDispatcher
+from minemind.client import Client, CompressionSettings
+from minemind.dispatcher import EventDispatcher, WorkerSettings
 from minemind.mc_types import UUID, Boolean, Double, Float, Long, Short, String, VarInt
 from minemind.protocols.base import InteractionModule
 from minemind.protocols.enums import ConnectionState, HandshakingNextState
@@ -37,7 +38,8 @@ from minemind.protocols.v765.outbound.play import (
     TeleportConfirmRequest,
 )
 from minemind.protocols.v765.physics import Physics
-from minemind.protocols.v765.world import World
+from minemind.protocols.v765.registry import use_shared_registry
+from minemind.protocols.v765.world import ChunkStore, World
 
 
 class OfflinePlayerNamespace:
@@ -47,8 +49,21 @@ class OfflinePlayerNamespace:
 class Bot(InteractionModule):
     logger = get_logger('Bot')
 
-    def __init__(self, username: str = 'Bot', host: str = 'localhost', port: int = 25565, protocol_version: int = 765):
-        self.client = Client(host, port, protocol_version)
+    def __init__(
+        self,
+        username: str = 'Bot',
+        host: str = 'localhost',
+        port: int = 25565,
+        protocol_version: int = 765,
+        chunk_store: ChunkStore | None = None,
+        workers: WorkerSettings | None = None,
+        chunk_executor: Executor | None = None,
+        compression: CompressionSettings = CompressionSettings(),
+        shared_registry: bool = False,
+    ):
+        if shared_registry:
+            use_shared_registry()
+        self.client = Client(host, port, protocol_version, compression)
         self.configuration = Configuration(self.client)
 
         self.username: str = username
@@ -57,9 +72,9 @@ class Bot(InteractionModule):
         self.uuid: uuid.UUID = uuid.uuid3(OfflinePlayerNamespace, username)  # type: ignore[arg-type]
         self.entity_id: int | None = None
 
-        self.dispatcher = EventDispatcher(self.client)
+        self.dispatcher = EventDispatcher(self.client, workers)
 
-        self.world = World(self.client)
+        self.world = World(self.client, chunk_store, chunk_executor)
         self.entities = Entities(self.client)
         self.physics = Physics(self.client, self)
         self.game = Game(self.client)
@@ -81,6 +96,8 @@ class Bot(InteractionModule):
             return self
 
     async def __aexit__(self, exc_type, exc, tb):
+        self.physics.stop()
+        self.world.release_chunks()
         await self.client.disconnect()
         await self._dispatcher_task
 
@@ -192,6 +209,7 @@ class Bot(InteractionModule):
         else:
             entity.velocity = new_velocity
             entity.position = new_position
+            self.entities.index.update(entity)
             entity.on_ground = False
 
             # TODO: Not sure why we use from_notchian_yaw/pitch instead of from_notchian_yaw/pitch_byte
@@ -276,8 +294,7 @@ class Bot(InteractionModule):
             interact_type=InteractRequest.InteractType.ATTACK,
             sneaking=Boolean(False),
         )
-        await self.client.send_packet(request)
-        await self.client.send_packet(ArmAnimationRequest(ArmAnimationRequest.Hand.MAIN_HAND))
+        await self.client.send_many([request, ArmAnimationRequest(ArmAnimationRequest.Hand.MAIN_HAND)])
         self.logger.log(DEBUG_GAME_EVENTS, f'Attacking entity {self.entities.get_by_id(entity_id.int)}')
 
     async def chat_message(self, message: str):
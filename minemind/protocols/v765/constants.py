@@ -1,14 +1,100 @@
+import functools
+import hashlib
 import json
-
-# get working dir
 import os
+import pickle
+import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
+
+if TYPE_CHECKING:
+    from minemind.protocols.v765.registry import Registry
+
+T = TypeVar('T')
+
+DATA_DIR = Path(__file__).parent / 'minecraft-data'
+CACHE_DIR = Path(os.environ.get('MINEMIND_CACHE_DIR', DATA_DIR / '__cache__'))
+CACHE_VERSION = 1  # Bump when the layout of cached values changes
+
+# Game data loaded on first access, see __getattr__
+GAME_DATA_FILES = {
+    'BLOCKS': 'blocks.json',
+    'BLOCK_COLLISION_SHAPES': 'blockCollisionShapes.json',
+    'BIOMES': 'biomes.json',
+    'ITEMS': 'items.json',
+}
+
+# Memory-mapped game data shared between processes, set by registry.use_shared_registry
+shared_registry: 'Registry | None' = None
+
+
+def get_cache_key(sources: tuple[str, ...]) -> tuple[int, list[tuple[str, int, int]]]:
+    stats = [(DATA_DIR / source).stat() for source in sources]
+    return CACHE_VERSION, [(source, stat.st_mtime_ns, stat.st_size) for source, stat in zip(sources, stats)]
+
+
+@functools.cache
+def get_source_hash(module_name: str) -> str | None:
+    """
+    Hash of the source file of a module, so values cached by a builder are rebuilt after its code changes.
+    """
+    path = getattr(sys.modules.get(module_name), '__file__', None)
+    if path is None:
+        return None
+    try:
+        with open(path, 'rb') as file:
+            return hashlib.sha1(file.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def load_cached(name: str, sources: tuple[str, ...], build: Callable[[], T]) -> T:
+    """
+    Load a value built from game data files from the binary cache, building and caching it if the files changed.
+
+    Unpickling is several times faster than parsing the JSON files and building derived tables again. The cache is
+    skipped if it can't be written, e.g. when the package is installed read-only.
+    :param name: Cache file name
+    :param sources: Game data files the value is built from, the cache is invalidated when any of them changes
+    :param build: Builds the value if it isn't cached, the cache is also invalidated when its module changes
+    """
+    key = (*get_cache_key(sources), get_source_hash(build.__module__))
+    cache_path = CACHE_DIR / f'{name}.pickle'
+    try:
+        with open(cache_path, 'rb') as file:
+            if pickle.load(file) == key:
+                return pickle.load(file)
+    except Exception:  # Truncated or corrupted cache, or values of classes which changed since, are built again
+        pass
+
+    value = build()
+    temporary_path = cache_path.with_name(f'{cache_path.name}.{os.getpid()}')
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(temporary_path, 'wb') as file:
+            pickle.dump(key, file, pickle.HIGHEST_PROTOCOL)
+            pickle.dump(value, file, pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_path, cache_path)  # Processes starting at once never read a partially written cache
+    except OSError:
+        temporary_path.unlink(missing_ok=True)
+    return value
+
+
+def load_game_data(file_name: str) -> Any:
+    def build() -> Any:
+        with open(DATA_DIR / file_name) as file:
+            return json.load(file)
+
+    return load_cached(Path(file_name).stem, (file_name,), build)
+
+
+def __getattr__(name: str) -> Any:
+    file_name = GAME_DATA_FILES.get(name)
+    if file_name is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = globals()[name] = load_game_data(file_name)
+    return value
 
-working_dir = Path(os.getcwd())
-BLOCKS = json.load(open(os.path.join(working_dir, 'protocols/v765/minecraft-data/blocks.json')))
-BLOCK_COLLISION_SHAPES = json.load(
-    open(os.path.join(working_dir, 'protocols/v765/minecraft-data/blockCollisionShapes.json')),
-)
 
 # TODO: Make it parse dynamically
 WATER_BLOCK_ID = 32
@@ -18,9 +104,7 @@ SLIME_BLOCK_ID = 463
 COB_WEB_ID = 122
 BUBBLE_COLUMN_ID = 731
 AIR_BLOCK_ID = 0
-
-BIOMES = json.load(open(os.path.join(working_dir, 'protocols/v765/minecraft-data/biomes.json')))
-ITEMS = json.load(open(os.path.join(working_dir, 'protocols/v765/minecraft-data/items.json')))
+AIR_LIKE_BLOCK_IDS = {AIR_BLOCK_ID, 729, 730}  # air, void_air, cave_air
 
 ENTITIES = {
     0: {
@@ -0,0 +1,104 @@
+"""
+Concurrent dispatch settings of the play state packets, see EventDispatcher.run_workers.
+
+Entity packets are ordered by entity id and chunk packets by chunk position. Packets which change the dimension or
+remove several entities at once are barriers, so they are never handled before the packets received earlier. Chunk
+batch packets are barriers too, so the rate sent back to the server includes handling all chunks of the batch.
+"""
+
+from struct import Struct
+
+from minemind.dispatcher import WorkerSettings
+from minemind.mc_types import Position, VarInt
+from minemind.protocols.v765.inbound.play import (
+    ChunkBatchFinishedResponse,
+    ChunkBatchStartResponse,
+    ChunkDataAndLightResponse,
+    EntityHeadRotationResponse,
+    EntityLookResponse,
+    EntityMoveLookResponse,
+    EntityTeleportResponse,
+    EntityVelocityResponse,
+    KeepAliveResponse,
+    LoginResponse,
+    PingResponse,
+    RelEntityMoveResponse,
+    RemoveEntityResponse,
+    RespawnResponse,
+    SpawnEntityResponse,
+    StartConfigurationResponse,
+    UnloadChunkResponse,
+    UpdateBlockResponse,
+    UpdateSectionBlocksResponse,
+)
+
+CHUNK_COORDINATES = Struct('>ii')
+
+
+def entity_key(raw_data: memoryview) -> tuple[str, int]:
+    return 'entity', VarInt._read_varint(raw_data)[0]
+
+
+def chunk_key(raw_data: memoryview) -> tuple[str, int, int]:
+    chunk_x, chunk_z = CHUNK_COORDINATES.unpack_from(raw_data)
+    return 'chunk', chunk_x, chunk_z
+
+
+def unload_chunk_key(raw_data: memoryview) -> tuple[str, int, int]:
+    chunk_z, chunk_x = CHUNK_COORDINATES.unpack_from(raw_data)
+    return 'chunk', chunk_x, chunk_z
+
+
+def block_chunk_key(raw_data: memoryview) -> tuple[str, int, int]:
+    position, _ = Position.decode(raw_data)
+    return 'chunk', position.x >> 4, position.z >> 4
+
+
+def section_chunk_key(raw_data: memoryview) -> tuple[str, int, int]:
+    position, _ = UpdateSectionBlocksResponse.ChunkPosition.decode(raw_data)
+    return 'chunk', int(position.x), int(position.z)
+
+
+ORDERING_KEYS = {
+    SpawnEntityResponse.packet_id: entity_key,
+    EntityTeleportResponse.packet_id: entity_key,
+    RelEntityMoveResponse.packet_id: entity_key,
+    EntityMoveLookResponse.packet_id: entity_key,
+    EntityLookResponse.packet_id: entity_key,
+    EntityHeadRotationResponse.packet_id: entity_key,
+    EntityVelocityResponse.packet_id: entity_key,
+    ChunkDataAndLightResponse.packet_id: chunk_key,
+    UnloadChunkResponse.packet_id: unload_chunk_key,
+    UpdateBlockResponse.packet_id: block_chunk_key,
+    UpdateSectionBlocksResponse.packet_id: section_chunk_key,
+}
+
+# Packets carrying the absolute state of an entity, a newer one makes the queued one stale
+COALESCED_PACKET_IDS = frozenset(
+    {
+        EntityTeleportResponse.packet_id,
+        EntityLookResponse.packet_id,
+        EntityHeadRotationResponse.packet_id,
+        EntityVelocityResponse.packet_id,
+    },
+)
+
+IMMEDIATE_PACKET_IDS = frozenset({KeepAliveResponse.packet_id, PingResponse.packet_id})
+
+BARRIER_PACKET_IDS = frozenset(
+    {
+        LoginResponse.packet_id,
+        RespawnResponse.packet_id,
+        StartConfigurationResponse.packet_id,
+        RemoveEntityResponse.packet_id,
+        ChunkBatchStartResponse.packet_id,
+        ChunkBatchFinishedResponse.packet_id,
+    },
+)
+
+WORKER_SETTINGS = WorkerSettings(
+    ordering_keys=ORDERING_KEYS,
+    coalesced=COALESCED_PACKET_IDS,
+    immediate=IMMEDIATE_PACKET_IDS,
+    barriers=BARRIER_PACKET_IDS,
+)
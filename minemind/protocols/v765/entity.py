@@ -1,7 +1,8 @@
 import enum
+import heapq
 import math
 import uuid
-from typing import Any
+from typing import Any, Callable
 
 from minemind import DEBUG_PROTOCOL
 from minemind.client import Client
@@ -9,7 +10,6 @@ from minemind.dispatcher import EventDispatcher
 from minemind.mc_types.base import Vector3
 from minemind.protocols.base import InteractionModule
 from minemind.protocols.utils import get_logger
-from minemind.protocols.v765.constants import ENTITIES
 from minemind.protocols.v765.inbound.play import (
     EntityLookResponse,
     EntityMoveLookResponse,
@@ -22,6 +22,7 @@ from minemind.protocols.v765.inbound.play import (
     RemoveEntityResponse,
     SpawnEntityResponse,
 )
+from minemind.protocols.v765.registry import get_entity
 
 
 class HitBox(float, enum.Enum):
@@ -131,7 +132,7 @@ class Entity:
 
     @classmethod
     def get_entity_type_by_id(cls, entity_type_id: int) -> dict[str, Any]:
-        entity_data = ENTITIES.get(entity_type_id)
+        entity_data = get_entity(entity_type_id)
         if not entity_data:
             raise ValueError(f'Unknown entity type {entity_type_id}')
         return entity_data
@@ -149,7 +150,7 @@ class Entity:
         on_ground: bool = False,
         **kwargs,
     ) -> 'Entity':
-        entity_data = ENTITIES.get(entity_type_id)
+        entity_data = get_entity(entity_type_id)
         if not entity_data:
             raise ValueError(f'Unknown entity type {entity_type_id}')
         return cls(
@@ -237,6 +238,164 @@ class Player(Entity):
         return f'<Player {self.username} {self.entity_id=}>'
 
 
+EntityFilter = Callable[[Entity], bool]
+
+
+class EntityIndex:
+    """
+    Uniform grid of entities keyed by the chunk column they are in.
+
+    Queries only look at the cells overlapping the searched area instead of every tracked entity. Positions are read
+    from the entities, so an entity has to be updated in the index after its position changes.
+    """
+
+    CELL_SHIFT = 4  # 16 block cells, like chunk columns
+
+    def __init__(self):
+        self.cells: dict[tuple[int, int], dict[int, Entity]] = {}
+        self.entity_cells: dict[int, tuple[int, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.entity_cells)
+
+    def update(self, entity: Entity) -> None:
+        """
+        Add the entity or move it to the cell of its current position.
+        """
+        position = entity.position
+        cell = (math.floor(position.x) >> self.CELL_SHIFT, math.floor(position.z) >> self.CELL_SHIFT)
+        old_cell = self.entity_cells.get(entity.entity_id)
+        if old_cell != cell:
+            if old_cell is not None:
+                self._remove_from_cell(old_cell, entity.entity_id)
+            self.entity_cells[entity.entity_id] = cell
+        self.cells.setdefault(cell, {})[entity.entity_id] = entity
+
+    def remove(self, entity_id: int) -> None:
+        cell = self.entity_cells.pop(entity_id, None)
+        if cell is not None:
+            self._remove_from_cell(cell, entity_id)
+
+    def _remove_from_cell(self, cell: tuple[int, int], entity_id: int) -> None:
+        entities = self.cells[cell]
+        del entities[entity_id]
+        if not entities:
+            del self.cells[cell]
+
+    def within_aabb(
+        self,
+        min_corner: Vector3,
+        max_corner: Vector3,
+        filter: EntityFilter | None = None,
+    ) -> list[Entity]:
+        """
+        Get entities with their position inside the box, both corners included.
+        """
+        shift = self.CELL_SHIFT
+        found = []
+        for cell_x in range(math.floor(min_corner.x) >> shift, (math.floor(max_corner.x) >> shift) + 1):
+            for cell_z in range(math.floor(min_corner.z) >> shift, (math.floor(max_corner.z) >> shift) + 1):
+                entities = self.cells.get((cell_x, cell_z))
+                if entities is None:
+                    continue
+                for entity in entities.values():
+                    position = entity.position
+                    if (
+                        min_corner.x <= position.x <= max_corner.x
+                        and min_corner.y <= position.y <= max_corner.y
+                        and min_corner.z <= position.z <= max_corner.z
+                        and (filter is None or filter(entity))
+                    ):
+                        found.append(entity)
+        return found
+
+    def within_radius(self, position: Vector3, radius: float, filter: EntityFilter | None = None) -> list[Entity]:
+        """
+        Get entities at most `radius` blocks away from the position.
+        """
+        radius_squared = radius * radius
+        found = []
+        for entity in self.within_aabb(
+            position.offset(-radius, -radius, -radius),
+            position.offset(radius, radius, radius),
+            filter,
+        ):
+            other = entity.position
+            dx, dy, dz = other.x - position.x, other.y - position.y, other.z - position.z
+            if dx * dx + dy * dy + dz * dz <= radius_squared:
+                found.append(entity)
+        return found
+
+    def nearest(
+        self,
+        position: Vector3,
+        k: int = 1,
+        filter: EntityFilter | None = None,
+        max_distance: float = math.inf,
+    ) -> list[Entity]:
+        """
+        Get the k entities nearest to the position, nearest first.
+
+        Cells are searched in rings around the cell of the position until no entity of the next ring can be nearer
+        than the k found ones. When the rings get larger than the number of occupied cells, the remaining occupied
+        cells are checked directly instead.
+        :param filter: Only entities for which it returns True are counted
+        :param max_distance: Ignore entities further away
+        """
+        if k <= 0:
+            return []
+        shift = self.CELL_SHIFT
+        x, y, z = position.x, position.y, position.z
+        center_x, center_z = math.floor(x) >> shift, math.floor(z) >> shift
+        # Max heap of the k nearest as (-distance squared, entity id, entity)
+        best: list[tuple[float, int, Entity]] = []
+        limit = max_distance * max_distance
+
+        def visit(entities: dict[int, Entity]) -> None:
+            for entity in entities.values():
+                other = entity.position
+                dx, dy, dz = other.x - x, other.y - y, other.z - z
+                distance = dx * dx + dy * dy + dz * dz
+                if distance > limit or (len(best) == k and distance >= -best[0][0]):
+                    continue
+                if filter is not None and not filter(entity):
+                    continue
+                item = (-distance, entity.entity_id, entity)
+                if len(best) < k:
+                    heapq.heappush(best, item)
+                else:
+                    heapq.heapreplace(best, item)
+
+        ring = 0
+        while True:
+            if ring:
+                # Horizontal distance to the nearest block of the ring
+                bound = min(
+                    x - ((center_x - ring + 1) << shift),
+                    ((center_x + ring) << shift) - x,
+                    z - ((center_z - ring + 1) << shift),
+                    ((center_z + ring) << shift) - z,
+                )
+                if bound * bound > (-best[0][0] if len(best) == k else limit):
+                    break
+            if 8 * ring > len(self.cells):
+                for (cell_x, cell_z), entities in self.cells.items():
+                    if max(abs(cell_x - center_x), abs(cell_z - center_z)) >= ring:
+                        visit(entities)
+                break
+            if ring == 0:
+                cells = [(center_x, center_z)]
+            else:
+                cells = [(center_x + dx, center_z + dz) for dx in (-ring, ring) for dz in range(-ring, ring + 1)]
+                cells += [(center_x + dx, center_z + dz) for dz in (-ring, ring) for dx in range(1 - ring, ring)]
+            for cell in cells:
+                entities = self.cells.get(cell)
+                if entities is not None:
+                    visit(entities)
+            ring += 1
+        return [entity for _, _, entity in sorted(best, reverse=True)]
+
+
 class Entities(InteractionModule):
     """
     Need to implement:
@@ -261,8 +420,29 @@ class Entities(InteractionModule):
     def __init__(self, client: Client):
         self.client = client
         self.entities: dict[int, Entity] = {}
+        self.index = EntityIndex()
         self._player_uuid_to_name: dict[uuid.UUID, str] = {}
 
+    def nearest(
+        self,
+        position: Vector3,
+        k: int = 1,
+        filter: EntityFilter | None = None,
+        max_distance: float = math.inf,
+    ) -> list[Entity]:
+        return self.index.nearest(position, k, filter, max_distance)
+
+    def within_radius(self, position: Vector3, radius: float, filter: EntityFilter | None = None) -> list[Entity]:
+        return self.index.within_radius(position, radius, filter)
+
+    def within_aabb(
+        self,
+        min_corner: Vector3,
+        max_corner: Vector3,
+        filter: EntityFilter | None = None,
+    ) -> list[Entity]:
+        return self.index.within_aabb(min_corner, max_corner, filter)
+
     def create_bot(
         self,
         player_uuid: uuid.UUID,
@@ -287,6 +467,7 @@ class Entities(InteractionModule):
             on_ground=on_ground,
         )
         self.entities[entity_id] = new_entity
+        self.index.update(new_entity)
         self.logger.log(DEBUG_PROTOCOL, f'Bot entity {new_entity} spawned')
 
     @EventDispatcher.subscribe(PlayerInfoUpdateResponse)
@@ -312,6 +493,7 @@ class Entities(InteractionModule):
             exist_entity.set_position(entity.x.float, entity.y.float, entity.z.float)
             exist_entity.set_rotation(entity.yaw.int, entity.pitch.int)
             exist_entity.set_velocity(Vector3(entity.velocityx.int, entity.velocityy.int, entity.velocityz.int))
+            self.index.update(exist_entity)
             self.logger.log(DEBUG_PROTOCOL, f'Entity {exist_entity} already exists. Updating it')
             return
 
@@ -331,15 +513,17 @@ class Entities(InteractionModule):
             **kwargs,
         )
         self.entities[entity.entity_id.int] = new_entity
+        self.index.update(new_entity)
         self.logger.log(DEBUG_PROTOCOL, f'Entity {new_entity} spawned')
 
     @EventDispatcher.subscribe(RemoveEntityResponse)
     async def _entities_removed(self, data: RemoveEntityResponse):
         for entity_id in data.entity_ids:
             self.entities.pop(entity_id.int, None)
+            self.index.remove(entity_id.int)
             self.logger.log(DEBUG_PROTOCOL, f'Entity {entity_id.int} removed')
 
-    @EventDispatcher.subscribe(EntityTeleportResponse)
+    @EventDispatcher.subscribe(EntityTeleportResponse, lazy=True)
     async def _entity_teleport(self, data: EntityTeleportResponse):
         entity = self.entities.get(data.entity_id.int)
         if not entity:
@@ -348,13 +532,14 @@ class Entities(InteractionModule):
         entity.set_position(data.x.float, data.y.float, data.z.float)
         entity.set_rotation(data.yaw.int, data.pitch.int)
         entity.on_ground = data.on_ground.bool
+        self.index.update(entity)
 
         self.logger.log(
             DEBUG_PROTOCOL,
             f'Entity {entity} teleported to {entity.position} {entity.yaw=} {entity.pitch=}',
         )
 
-    @EventDispatcher.subscribe(RelEntityMoveResponse)
+    @EventDispatcher.subscribe(RelEntityMoveResponse, lazy=True)
     async def _update_entity_position(self, data: RelEntityMoveResponse):
         entity = self.entities.get(data.entity_id.int)
         if not entity:
@@ -362,11 +547,12 @@ class Entities(InteractionModule):
             return
 
         entity.set_position_from_delta(data.dx.int, data.dy.int, data.dz.int)
+        self.index.update(entity)
         entity.on_ground = data.on_ground.bool
 
         self.logger.log(DEBUG_PROTOCOL, f'Entity {entity} moved to {entity.position}')
 
-    @EventDispatcher.subscribe(EntityMoveLookResponse)
+    @EventDispatcher.subscribe(EntityMoveLookResponse, lazy=True)
     async def _update_entity_position_and_rotation(self, data: EntityMoveLookResponse):
         entity = self.entities.get(data.entity_id.int)
         if not entity:
@@ -374,6 +560,7 @@ class Entities(InteractionModule):
             return
 
         entity.set_position_from_delta(data.dx.int, data.dy.int, data.dz.int)
+        self.index.update(entity)
         entity.set_rotation(data.yaw.int, data.pitch.int)
         entity.on_ground = data.on_ground.bool
 
@@ -382,7 +569,7 @@ class Entities(InteractionModule):
             f'Entity {entity} moved to {entity.position} and rotated to {entity.yaw=} {entity.pitch=}',
         )
 
-    @EventDispatcher.subscribe(EntityLookResponse)
+    @EventDispatcher.subscribe(EntityLookResponse, lazy=True)
     async def _update_entity_rotation(self, data: EntityLookResponse):
         entity = self.entities.get(data.entity_id.int)
         if not entity:
@@ -393,7 +580,7 @@ class Entities(InteractionModule):
 
         self.logger.log(DEBUG_PROTOCOL, f'Entity {entity} rotated to {entity.yaw=} {entity.pitch=}')
 
-    @EventDispatcher.subscribe(EntityVelocityResponse)
+    @EventDispatcher.subscribe(EntityVelocityResponse, lazy=True)
     async def _update_entity_velocity(self, data: EntityVelocityResponse):
         entity = self.entities.get(data.entity_id.int)
         if not entity:
@@ -1,5 +1,7 @@
+from typing import Any
+
 from minemind.mc_types import UUID, Int, Long, String, VarInt, nbt
-from minemind.mc_types.base import SocketReader
+from minemind.mc_types.base import Buffer, SocketReader
 from minemind.protocols.enums import ConnectionState
 from minemind.protocols.protocol_events import InboundEvent
 
@@ -24,6 +26,11 @@ class PluginMessageResponse(InboundEvent):
             data=await reader.read(-1),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['PluginMessageResponse', int]:
+        channel, offset = String.decode(buffer, offset)
+        return cls(channel=channel, data=bytes(buffer[offset:])), len(buffer)
+
 
 class FinishConfigurationResponse(InboundEvent):
     packet_id = 0x02
@@ -46,6 +53,16 @@ class KeepAliveResponse(InboundEvent):
             keep_alive_id=await Long.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['KeepAliveResponse', int]:
+        keep_alive_id, offset = Long.decode(buffer, offset)
+        return (
+            cls(
+                keep_alive_id=keep_alive_id,
+            ),
+            offset,
+        )
+
 
 class PingResponse(InboundEvent):
     packet_id = 0x04
@@ -63,6 +80,16 @@ class PingResponse(InboundEvent):
             id=await Int.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['PingResponse', int]:
+        id, offset = Int.decode(buffer, offset)
+        return (
+            cls(
+                id=id,
+            ),
+            offset,
+        )
+
 
 class RegistryDataResponse(InboundEvent):
     packet_id = 0x05
@@ -70,16 +97,21 @@ class RegistryDataResponse(InboundEvent):
 
     def __init__(
         self,
-        registry_codec: nbt.Compound,
+        registry_codec: dict[str, Any] | None,
     ) -> None:
         self.registry_codec = registry_codec
 
     @classmethod
     async def from_stream(cls, reader: SocketReader) -> 'RegistryDataResponse':
         return cls(
-            registry_codec=await nbt.NBT.from_stream(reader, is_anonymous=True),  # type: ignore[arg-type]
+            registry_codec=await nbt.NBT.value_from_stream(reader, is_anonymous=True),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['RegistryDataResponse', int]:
+        registry_codec, offset = nbt.NBT.decode_value(buffer, offset, is_anonymous=True)
+        return cls(registry_codec=registry_codec), offset
+
 
 class RemoveResourcePackResponse(InboundEvent):
     packet_id = 0x06
@@ -97,6 +129,16 @@ class RemoveResourcePackResponse(InboundEvent):
             uuid=await UUID.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['RemoveResourcePackResponse', int]:
+        uuid, offset = UUID.decode(buffer, offset)
+        return (
+            cls(
+                uuid=uuid,
+            ),
+            offset,
+        )
+
 
 class FeatureFlagResponse(InboundEvent):
     packet_id = 0x08
@@ -117,6 +159,11 @@ class FeatureFlagResponse(InboundEvent):
             feature_flags=await reader.read(-1),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['FeatureFlagResponse', int]:
+        total_features, offset = VarInt.decode(buffer, offset)
+        return cls(total_features=total_features, feature_flags=bytes(buffer[offset:])), len(buffer)
+
 
 class UpdateTagsResponse(InboundEvent):
     packet_id = 0x09
@@ -137,3 +184,8 @@ class UpdateTagsResponse(InboundEvent):
             length=await VarInt.from_stream(reader),
             tags=await reader.read(-1),
         )
+
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['UpdateTagsResponse', int]:
+        length, offset = VarInt.decode(buffer, offset)
+        return cls(length=length, tags=bytes(buffer[offset:])), len(buffer)
@@ -1,5 +1,5 @@
 from minemind.mc_types import UUID, String, VarInt
-from minemind.mc_types.base import SocketReader
+from minemind.mc_types.base import Buffer, SocketReader
 from minemind.protocols.enums import ConnectionState
 from minemind.protocols.protocol_events import InboundEvent
 
@@ -20,6 +20,16 @@ class DisconnectResponse(InboundEvent):
             reason=await String.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['DisconnectResponse', int]:
+        reason, offset = String.decode(buffer, offset)
+        return (
+            cls(
+                reason=reason,
+            ),
+            offset,
+        )
+
 
 class LoginSuccessResponse(InboundEvent):
     packet_id = 0x02
@@ -44,6 +54,20 @@ class LoginSuccessResponse(InboundEvent):
             number_of_properties=await VarInt.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['LoginSuccessResponse', int]:
+        uuid, offset = UUID.decode(buffer, offset)
+        username, offset = String.decode(buffer, offset)
+        number_of_properties, offset = VarInt.decode(buffer, offset)
+        return (
+            cls(
+                uuid=uuid,
+                username=username,
+                number_of_properties=number_of_properties,
+            ),
+            offset,
+        )
+
 
 class CompressResponse(InboundEvent):
     packet_id = 0x03
@@ -60,3 +84,13 @@ class CompressResponse(InboundEvent):
         return cls(
             threshold=await VarInt.from_stream(reader),
         )
+
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['CompressResponse', int]:
+        threshold, offset = VarInt.decode(buffer, offset)
+        return (
+            cls(
+                threshold=threshold,
+            ),
+            offset,
+        )
@@ -1,6 +1,7 @@
 from decimal import Decimal
 from enum import Enum
-from typing import Optional
+from struct import Struct
+from typing import Any, Optional
 
 from minemind.mc_types import (
     UUID,
@@ -20,7 +21,7 @@ from minemind.mc_types import (
     nbt,
 )
 from minemind.mc_types.array import BitSet
-from minemind.mc_types.base import MCType, SocketReader
+from minemind.mc_types.base import Buffer, MCType, SocketReader
 from minemind.protocols.enums import ConnectionState
 from minemind.protocols.protocol_events import InboundEvent
 
@@ -28,6 +29,8 @@ from minemind.protocols.protocol_events import InboundEvent
 class SpawnEntityResponse(InboundEvent):
     packet_id = 0x01
     state = ConnectionState.PLAY
+    _struct_1 = Struct('>dddbbb')
+    _struct_2 = Struct('>hhh')
 
     def __init__(
         self,
@@ -101,10 +104,40 @@ class SpawnEntityResponse(InboundEvent):
             velocityz=await Short.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['SpawnEntityResponse', int]:
+        entity_id, offset = VarInt.decode(buffer, offset)
+        object_uuid, offset = UUID.decode(buffer, offset)
+        type, offset = VarInt.decode(buffer, offset)
+        x, y, z, pitch, yaw, head_pitch = cls._struct_1.unpack_from(buffer, offset)
+        offset += cls._struct_1.size
+        object_data, offset = VarInt.decode(buffer, offset)
+        velocityx, velocityy, velocityz = cls._struct_2.unpack_from(buffer, offset)
+        offset += cls._struct_2.size
+        return (
+            cls(
+                entity_id=entity_id,
+                object_uuid=object_uuid,
+                type=type,
+                x=Double(x),
+                y=Double(y),
+                z=Double(z),
+                pitch=Byte(pitch),
+                yaw=Byte(yaw),
+                head_pitch=Byte(head_pitch),
+                object_data=object_data,
+                velocityx=Short(velocityx),
+                velocityy=Short(velocityy),
+                velocityz=Short(velocityz),
+            ),
+            offset,
+        )
+
 
 class SpawnEntityExperienceOrbResponse(InboundEvent):
     packet_id = 0x02
     state = ConnectionState.PLAY
+    _struct = Struct('>dddh')
 
     def __init__(
         self,
@@ -130,6 +163,22 @@ class SpawnEntityExperienceOrbResponse(InboundEvent):
             count=await Short.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['SpawnEntityExperienceOrbResponse', int]:
+        entity_id, offset = VarInt.decode(buffer, offset)
+        x, y, z, count = cls._struct.unpack_from(buffer, offset)
+        offset += cls._struct.size
+        return (
+            cls(
+                entity_id=entity_id,
+                x=Double(x),
+                y=Double(y),
+                z=Double(z),
+                count=Short(count),
+            ),
+            offset,
+        )
+
 
 class AnimationResponse(InboundEvent):
     packet_id = 0x03
@@ -150,6 +199,18 @@ class AnimationResponse(InboundEvent):
             animation=await UByte.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['AnimationResponse', int]:
+        entity_id, offset = VarInt.decode(buffer, offset)
+        animation, offset = UByte.decode(buffer, offset)
+        return (
+            cls(
+                entity_id=entity_id,
+                animation=animation,
+            ),
+            offset,
+        )
+
 
 class BlockEntityDataResponse(InboundEvent):
     packet_id = 0x07
@@ -159,7 +220,7 @@ class BlockEntityDataResponse(InboundEvent):
         self,
         location: Position,
         block_type: VarInt,
-        nbt_data: nbt.Compound | None,
+        nbt_data: bytes | None,  # Raw NBT, decode it with nbt.NBT.decode_value when needed
     ) -> None:
         self.location = location
         self.block_type = block_type
@@ -170,13 +231,21 @@ class BlockEntityDataResponse(InboundEvent):
         return cls(
             location=await Position.from_stream(reader),
             block_type=await VarInt.from_stream(reader),
-            nbt_data=await nbt.NBT.from_stream(reader, is_anonymous=True),
+            nbt_data=await nbt.NBT.read_raw_from_stream(reader, is_anonymous=True),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['BlockEntityDataResponse', int]:
+        location, offset = Position.decode(buffer, offset)
+        block_type, offset = VarInt.decode(buffer, offset)
+        nbt_data, offset = nbt.NBT.read_raw(buffer, offset, is_anonymous=True)
+        return cls(location=location, block_type=block_type, nbt_data=nbt_data), offset
+
 
 class DifficultyResponse(InboundEvent):
     packet_id = 0x0B
     state = ConnectionState.PLAY
+    _struct = Struct('>B?')
 
     def __init__(
         self,
@@ -193,6 +262,18 @@ class DifficultyResponse(InboundEvent):
             difficulty_locked=await Boolean.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['DifficultyResponse', int]:
+        difficulty, difficulty_locked = cls._struct.unpack_from(buffer, offset)
+        offset += cls._struct.size
+        return (
+            cls(
+                difficulty=UByte(difficulty),
+                difficulty_locked=Boolean(difficulty_locked),
+            ),
+            offset,
+        )
+
 
 class ChunkBatchFinishedResponse(InboundEvent):
     packet_id = 0x0C
@@ -210,6 +291,16 @@ class ChunkBatchFinishedResponse(InboundEvent):
             batch_size=await VarInt.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['ChunkBatchFinishedResponse', int]:
+        batch_size, offset = VarInt.decode(buffer, offset)
+        return (
+            cls(
+                batch_size=batch_size,
+            ),
+            offset,
+        )
+
 
 class ChunkBatchStartResponse(InboundEvent):
     packet_id = 0x0D
@@ -232,10 +323,21 @@ class CloseWindowResponse(InboundEvent):
             window_id=await UByte.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['CloseWindowResponse', int]:
+        window_id, offset = UByte.decode(buffer, offset)
+        return (
+            cls(
+                window_id=window_id,
+            ),
+            offset,
+        )
+
 
 class CraftProgressBarResponse(InboundEvent):
     packet_id = 0x14
     state = ConnectionState.PLAY
+    _struct = Struct('>Bhh')
 
     def __init__(
         self,
@@ -255,6 +357,19 @@ class CraftProgressBarResponse(InboundEvent):
             value=await Short.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['CraftProgressBarResponse', int]:
+        window_id, property, value = cls._struct.unpack_from(buffer, offset)
+        offset += cls._struct.size
+        return (
+            cls(
+                window_id=UByte(window_id),
+                property=Short(property),
+                value=Short(value),
+            ),
+            offset,
+        )
+
 
 class SetCooldownResponse(InboundEvent):
     packet_id = 0x16
@@ -275,10 +390,23 @@ class SetCooldownResponse(InboundEvent):
             cooldown_ticks=await VarInt.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['SetCooldownResponse', int]:
+        itemid, offset = VarInt.decode(buffer, offset)
+        cooldown_ticks, offset = VarInt.decode(buffer, offset)
+        return (
+            cls(
+                itemid=itemid,
+                cooldown_ticks=cooldown_ticks,
+            ),
+            offset,
+        )
+
 
 class EntityStatusResponse(InboundEvent):
     packet_id = 0x1D
     state = ConnectionState.PLAY
+    _struct = Struct('>ib')
 
     def __init__(
         self,
@@ -295,10 +423,23 @@ class EntityStatusResponse(InboundEvent):
             entity_status=await Byte.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['EntityStatusResponse', int]:
+        entity_id, entity_status = cls._struct.unpack_from(buffer, offset)
+        offset += cls._struct.size
+        return (
+            cls(
+                entity_id=Int(entity_id),
+                entity_status=Byte(entity_status),
+            ),
+            offset,
+        )
+
 
 class UnloadChunkResponse(InboundEvent):
     packet_id = 0x1F
     state = ConnectionState.PLAY
+    _struct = Struct('>ii')
 
     def __init__(
         self,
@@ -315,6 +456,18 @@ class UnloadChunkResponse(InboundEvent):
             chunk_x=await Int.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['UnloadChunkResponse', int]:
+        chunk_z, chunk_x = cls._struct.unpack_from(buffer, offset)
+        offset += cls._struct.size
+        return (
+            cls(
+                chunk_z=Int(chunk_z),
+                chunk_x=Int(chunk_x),
+            ),
+            offset,
+        )
+
 
 class DamageEventResponse(InboundEvent):
     packet_id = 0x19
@@ -362,10 +515,31 @@ class DamageEventResponse(InboundEvent):
             instance.source_position_z = await Double.from_stream(reader)
         return instance
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['DamageEventResponse', int]:
+        entity_id, offset = VarInt.decode(buffer, offset)
+        source_type_id, offset = VarInt.decode(buffer, offset)
+        source_cause_id, offset = VarInt.decode(buffer, offset)
+        source_direct_id, offset = VarInt.decode(buffer, offset)
+        has_source_position, offset = Boolean.decode(buffer, offset)
+        instance = cls(
+            entity_id=entity_id,
+            source_type_id=source_type_id,
+            source_cause_id=source_cause_id,
+            source_direct_id=source_direct_id,
+            has_source_position=has_source_position,
+        )
+        if instance.has_source_position:
+            instance.source_position_x, offset = Double.decode(buffer, offset)
+            instance.source_position_y, offset = Double.decode(buffer, offset)
+            instance.source_position_z, offset = Double.decode(buffer, offset)
+        return instance, offset
+
 
 class GameStateChangeResponse(InboundEvent):
     packet_id = 0x20
     state = ConnectionState.PLAY
+    _struct = Struct('>Bf')
 
     def __init__(
         self,
@@ -382,6 +556,18 @@ class GameStateChangeResponse(InboundEvent):
             game_mode=await Float.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['GameStateChangeResponse', int]:
+        reason, game_mode = cls._struct.unpack_from(buffer, offset)
+        offset += cls._struct.size
+        return (
+            cls(
+                reason=UByte(reason),
+                game_mode=Float(game_mode),
+            ),
+            offset,
+        )
+
 
 class OpenHorseWindowResponse(InboundEvent):
     packet_id = 0x21
@@ -405,6 +591,20 @@ class OpenHorseWindowResponse(InboundEvent):
             entity_id=await Int.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['OpenHorseWindowResponse', int]:
+        window_id, offset = UByte.decode(buffer, offset)
+        nb_slots, offset = VarInt.decode(buffer, offset)
+        entity_id, offset = Int.decode(buffer, offset)
+        return (
+            cls(
+                window_id=window_id,
+                nb_slots=nb_slots,
+                entity_id=entity_id,
+            ),
+            offset,
+        )
+
 
 class KeepAliveResponse(InboundEvent):
     packet_id = 0x24
@@ -422,10 +622,23 @@ class KeepAliveResponse(InboundEvent):
             keep_alive_id=await Long.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['KeepAliveResponse', int]:
+        keep_alive_id, offset = Long.decode(buffer, offset)
+        return (
+            cls(
+                keep_alive_id=keep_alive_id,
+            ),
+            offset,
+        )
+
 
 class LoginResponse(InboundEvent):
     packet_id = 0x29
     state = ConnectionState.PLAY
+    _struct_1 = Struct('>i?')
+    _struct_2 = Struct('>???')
+    _struct_3 = Struct('>qBb???')
 
     def __init__(
         self,
@@ -524,10 +737,67 @@ class LoginResponse(InboundEvent):
             death_location=death_location,
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['LoginResponse', int]:
+        entity_id, is_hardcore = cls._struct_1.unpack_from(buffer, offset)
+        offset += cls._struct_1.size
+        dimension_count, offset = VarInt.decode(buffer, offset)
+        dimension_names, offset = Array.decode(buffer, offset, dimension_count.int, String)
+        max_players, offset = VarInt.decode(buffer, offset)
+        view_distance, offset = VarInt.decode(buffer, offset)
+        simulation_distance, offset = VarInt.decode(buffer, offset)
+        reduced_debug_info, enable_respawn_screen, do_limited_crafting = cls._struct_2.unpack_from(buffer, offset)
+        offset += cls._struct_2.size
+        dimension_type, offset = String.decode(buffer, offset)
+        dimension_name, offset = String.decode(buffer, offset)
+        (
+            hashed_seed,
+            game_mode,
+            previous_game_mode,
+            is_debug,
+            is_flat,
+            has_death_location,
+        ) = cls._struct_3.unpack_from(buffer, offset)
+        offset += cls._struct_3.size
+        if has_death_location:
+            death_dimension_name, offset = String.decode(buffer, offset)
+            death_location, offset = Position.decode(buffer, offset)
+        else:
+            death_dimension_name = None
+            death_location = None
+        portal_cooldown, offset = VarInt.decode(buffer, offset)
+        return (
+            cls(
+                entity_id=Int(entity_id),
+                is_hardcore=Boolean(is_hardcore),
+                dimension_count=dimension_count,
+                dimension_names=dimension_names,
+                max_players=max_players,
+                view_distance=view_distance,
+                simulation_distance=simulation_distance,
+                reduced_debug_info=Boolean(reduced_debug_info),
+                enable_respawn_screen=Boolean(enable_respawn_screen),
+                do_limited_crafting=Boolean(do_limited_crafting),
+                dimension_type=dimension_type,
+                dimension_name=dimension_name,
+                hashed_seed=Long(hashed_seed),
+                game_mode=UByte(game_mode),
+                previous_game_mode=Byte(previous_game_mode),
+                is_debug=Boolean(is_debug),
+                is_flat=Boolean(is_flat),
+                has_death_location=Boolean(has_death_location),
+                portal_cooldown=portal_cooldown,
+                death_dimension_name=death_dimension_name,
+                death_location=death_location,
+            ),
+            offset,
+        )
+
 
 class RespawnResponse(InboundEvent):
     packet_id = 0x45
     state = ConnectionState.PLAY
+    _struct = Struct('>qBb???')
 
     def __init__(
         self,
@@ -590,10 +860,57 @@ class RespawnResponse(InboundEvent):
             death_location=death_location,
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['RespawnResponse', int]:
+        dimension_type, offset = String.decode(buffer, offset)
+        dimension_name, offset = String.decode(buffer, offset)
+        (
+            hashed_seed,
+            game_mode,
+            previous_game_mode,
+            is_debug,
+            is_flat,
+            has_death_location,
+        ) = cls._struct.unpack_from(buffer, offset)
+        offset += cls._struct.size
+        if has_death_location:
+            death_dimension_name, offset = String.decode(buffer, offset)
+            death_location, offset = Position.decode(buffer, offset)
+        else:
+            death_dimension_name = None
+            death_location = None
+        portal_cooldown, offset = VarInt.decode(buffer, offset)
+        data_kept, offset = Byte.decode(buffer, offset)
+        return (
+            cls(
+                dimension_type=dimension_type,
+                dimension_name=dimension_name,
+                hashed_seed=Long(hashed_seed),
+                game_mode=UByte(game_mode),
+                previous_game_mode=Byte(previous_game_mode),
+                is_debug=Boolean(is_debug),
+                is_flat=Boolean(is_flat),
+                has_death_location=Boolean(has_death_location),
+                portal_cooldown=portal_cooldown,
+                data_kept=data_kept,
+                death_dimension_name=death_dimension_name,
+                death_location=death_location,
+            ),
+            offset,
+        )
+
 
 class RelEntityMoveResponse(InboundEvent):
     packet_id = 0x2C
     state = ConnectionState.PLAY
+    _struct = Struct('>hhh?')
+    fields = (
+        ('entity_id', VarInt),
+        ('dx', Short),
+        ('dy', Short),
+        ('dz', Short),
+        ('on_ground', Boolean),
+    )
 
     def __init__(
         self,
@@ -619,10 +936,36 @@ class RelEntityMoveResponse(InboundEvent):
             on_ground=await Boolean.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['RelEntityMoveResponse', int]:
+        entity_id, offset = VarInt.decode(buffer, offset)
+        dx, dy, dz, on_ground = cls._struct.unpack_from(buffer, offset)
+        offset += cls._struct.size
+        return (
+            cls(
+                entity_id=entity_id,
+                dx=Short(dx),
+                dy=Short(dy),
+                dz=Short(dz),
+                on_ground=Boolean(on_ground),
+            ),
+            offset,
+        )
+
 
 class EntityMoveLookResponse(InboundEvent):
     packet_id = 0x2D
     state = ConnectionState.PLAY
+    _struct = Struct('>hhhbb?')
+    fields = (
+        ('entity_id', VarInt),
+        ('dx', Short),
+        ('dy', Short),
+        ('dz', Short),
+        ('yaw', Byte),
+        ('pitch', Byte),
+        ('on_ground', Boolean),
+    )
 
     def __init__(
         self,
@@ -654,10 +997,35 @@ class EntityMoveLookResponse(InboundEvent):
             on_ground=await Boolean.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['EntityMoveLookResponse', int]:
+        entity_id, offset = VarInt.decode(buffer, offset)
+        dx, dy, dz, yaw, pitch, on_ground = cls._struct.unpack_from(buffer, offset)
+        offset += cls._struct.size
+        return (
+            cls(
+                entity_id=entity_id,
+                dx=Short(dx),
+                dy=Short(dy),
+                dz=Short(dz),
+                yaw=Byte(yaw),
+                pitch=Byte(pitch),
+                on_ground=Boolean(on_ground),
+            ),
+            offset,
+        )
+
 
 class EntityLookResponse(InboundEvent):
     packet_id = 0x2E
     state = ConnectionState.PLAY
+    _struct = Struct('>bb?')
+    fields = (
+        ('entity_id', VarInt),
+        ('yaw', Byte),
+        ('pitch', Byte),
+        ('on_ground', Boolean),
+    )
 
     def __init__(
         self,
@@ -680,10 +1048,26 @@ class EntityLookResponse(InboundEvent):
             on_ground=await Boolean.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['EntityLookResponse', int]:
+        entity_id, offset = VarInt.decode(buffer, offset)
+        yaw, pitch, on_ground = cls._struct.unpack_from(buffer, offset)
+        offset += cls._struct.size
+        return (
+            cls(
+                entity_id=entity_id,
+                yaw=Byte(yaw),
+                pitch=Byte(pitch),
+                on_ground=Boolean(on_ground),
+            ),
+            offset,
+        )
+
 
 class VehicleMoveResponse(InboundEvent):
     packet_id = 0x2F
     state = ConnectionState.PLAY
+    _struct = Struct('>dddff')
 
     def __init__(
         self,
@@ -709,6 +1093,21 @@ class VehicleMoveResponse(InboundEvent):
             pitch=await Float.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['VehicleMoveResponse', int]:
+        x, y, z, yaw, pitch = cls._struct.unpack_from(buffer, offset)
+        offset += cls._struct.size
+        return (
+            cls(
+                x=Double(x),
+                y=Double(y),
+                z=Double(z),
+                yaw=Float(yaw),
+                pitch=Float(pitch),
+            ),
+            offset,
+        )
+
 
 class OpenBookResponse(InboundEvent):
     packet_id = 0x30
@@ -726,6 +1125,16 @@ class OpenBookResponse(InboundEvent):
             hand=await VarInt.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['OpenBookResponse', int]:
+        hand, offset = VarInt.decode(buffer, offset)
+        return (
+            cls(
+                hand=hand,
+            ),
+            offset,
+        )
+
 
 class CraftRecipeResponse(InboundEvent):
     packet_id = 0x35
@@ -746,10 +1155,23 @@ class CraftRecipeResponse(InboundEvent):
             recipe=await String.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['CraftRecipeResponse', int]:
+        window_id, offset = Byte.decode(buffer, offset)
+        recipe, offset = String.decode(buffer, offset)
+        return (
+            cls(
+                window_id=window_id,
+                recipe=recipe,
+            ),
+            offset,
+        )
+
 
 class AbilitiesResponse(InboundEvent):
     packet_id = 0x36
     state = ConnectionState.PLAY
+    _struct = Struct('>bff')
 
     def __init__(
         self,
@@ -769,6 +1191,19 @@ class AbilitiesResponse(InboundEvent):
             walking_speed=await Float.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['AbilitiesResponse', int]:
+        flags, flying_speed, walking_speed = cls._struct.unpack_from(buffer, offset)
+        offset += cls._struct.size
+        return (
+            cls(
+                flags=Byte(flags),
+                flying_speed=Float(flying_speed),
+                walking_speed=Float(walking_speed),
+            ),
+            offset,
+        )
+
 
 class EndCombatEventResponse(InboundEvent):
     packet_id = 0x38
@@ -786,6 +1221,16 @@ class EndCombatEventResponse(InboundEvent):
             duration=await VarInt.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['EndCombatEventResponse', int]:
+        duration, offset = VarInt.decode(buffer, offset)
+        return (
+            cls(
+                duration=duration,
+            ),
+            offset,
+        )
+
 
 class EnterCombatEventResponse(InboundEvent):
     packet_id = 0x39
@@ -811,10 +1256,23 @@ class CombatDeathResponse(InboundEvent):
             message=await String.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['CombatDeathResponse', int]:
+        player_id, offset = VarInt.decode(buffer, offset)
+        message, offset = String.decode(buffer, offset)
+        return (
+            cls(
+                player_id=player_id,
+                message=message,
+            ),
+            offset,
+        )
+
 
 class PositionResponse(InboundEvent):
     packet_id = 0x3E
     state = ConnectionState.PLAY
+    _struct = Struct('>dddffb')
 
     class Flag(int, Enum):
         X = 0x01
@@ -855,6 +1313,24 @@ class PositionResponse(InboundEvent):
             teleport_id=await VarInt.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['PositionResponse', int]:
+        x, y, z, yaw, pitch, flags = cls._struct.unpack_from(buffer, offset)
+        offset += cls._struct.size
+        teleport_id, offset = VarInt.decode(buffer, offset)
+        return (
+            cls(
+                x=Double(x),
+                y=Double(y),
+                z=Double(z),
+                yaw=Float(yaw),
+                pitch=Float(pitch),
+                flags=Byte(flags),
+                teleport_id=teleport_id,
+            ),
+            offset,
+        )
+
 
 class RemoveEntityEffectResponse(InboundEvent):
     packet_id = 0x41
@@ -875,6 +1351,18 @@ class RemoveEntityEffectResponse(InboundEvent):
             effect_id=await VarInt.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['RemoveEntityEffectResponse', int]:
+        entity_id, offset = VarInt.decode(buffer, offset)
+        effect_id, offset = VarInt.decode(buffer, offset)
+        return (
+            cls(
+                entity_id=entity_id,
+                effect_id=effect_id,
+            ),
+            offset,
+        )
+
 
 class ResetScoreResponse(InboundEvent):
     packet_id = 0x42
@@ -895,6 +1383,18 @@ class ResetScoreResponse(InboundEvent):
             objective_name=await String.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['ResetScoreResponse', int]:
+        entity_name, offset = String.decode(buffer, offset)
+        objective_name, offset = String.decode(buffer, offset)
+        return (
+            cls(
+                entity_name=entity_name,
+                objective_name=objective_name,
+            ),
+            offset,
+        )
+
 
 class RemoveResourcePackResponse(InboundEvent):
     packet_id = 0x43
@@ -912,10 +1412,24 @@ class RemoveResourcePackResponse(InboundEvent):
             uuid=await UUID.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['RemoveResourcePackResponse', int]:
+        uuid, offset = UUID.decode(buffer, offset)
+        return (
+            cls(
+                uuid=uuid,
+            ),
+            offset,
+        )
+
 
 class EntityHeadRotationResponse(InboundEvent):
     packet_id = 0x46
     state = ConnectionState.PLAY
+    fields = (
+        ('entity_id', VarInt),
+        ('head_yaw', Byte),
+    )
 
     def __init__(
         self,
@@ -932,6 +1446,18 @@ class EntityHeadRotationResponse(InboundEvent):
             head_yaw=await Byte.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['EntityHeadRotationResponse', int]:
+        entity_id, offset = VarInt.decode(buffer, offset)
+        head_yaw, offset = Byte.decode(buffer, offset)
+        return (
+            cls(
+                entity_id=entity_id,
+                head_yaw=head_yaw,
+            ),
+            offset,
+        )
+
 
 class CameraResponse(InboundEvent):
     packet_id = 0x50
@@ -949,6 +1475,16 @@ class CameraResponse(InboundEvent):
             camera_id=await VarInt.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['CameraResponse', int]:
+        camera_id, offset = VarInt.decode(buffer, offset)
+        return (
+            cls(
+                camera_id=camera_id,
+            ),
+            offset,
+        )
+
 
 class HeldItemSlotResponse(InboundEvent):
     packet_id = 0x51
@@ -966,6 +1502,16 @@ class HeldItemSlotResponse(InboundEvent):
             slot=await Byte.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['HeldItemSlotResponse', int]:
+        slot, offset = Byte.decode(buffer, offset)
+        return (
+            cls(
+                slot=slot,
+            ),
+            offset,
+        )
+
 
 class UpdateViewPositionResponse(InboundEvent):
     packet_id = 0x52
@@ -986,6 +1532,18 @@ class UpdateViewPositionResponse(InboundEvent):
             chunkz=await VarInt.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['UpdateViewPositionResponse', int]:
+        chunkx, offset = VarInt.decode(buffer, offset)
+        chunkz, offset = VarInt.decode(buffer, offset)
+        return (
+            cls(
+                chunkx=chunkx,
+                chunkz=chunkz,
+            ),
+            offset,
+        )
+
 
 class UpdateViewDistanceResponse(InboundEvent):
     packet_id = 0x53
@@ -1003,6 +1561,16 @@ class UpdateViewDistanceResponse(InboundEvent):
             view_distance=await VarInt.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['UpdateViewDistanceResponse', int]:
+        view_distance, offset = VarInt.decode(buffer, offset)
+        return (
+            cls(
+                view_distance=view_distance,
+            ),
+            offset,
+        )
+
 
 class ScoreboardDisplayObjectiveResponse(InboundEvent):
     packet_id = 0x55
@@ -1023,10 +1591,23 @@ class ScoreboardDisplayObjectiveResponse(InboundEvent):
             name=await String.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['ScoreboardDisplayObjectiveResponse', int]:
+        position, offset = VarInt.decode(buffer, offset)
+        name, offset = String.decode(buffer, offset)
+        return (
+            cls(
+                position=position,
+                name=name,
+            ),
+            offset,
+        )
+
 
 class AttachEntityResponse(InboundEvent):
     packet_id = 0x57
     state = ConnectionState.PLAY
+    _struct = Struct('>ii')
 
     def __init__(
         self,
@@ -1043,10 +1624,29 @@ class AttachEntityResponse(InboundEvent):
             vehicle_id=await Int.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['AttachEntityResponse', int]:
+        entity_id, vehicle_id = cls._struct.unpack_from(buffer, offset)
+        offset += cls._struct.size
+        return (
+            cls(
+                entity_id=Int(entity_id),
+                vehicle_id=Int(vehicle_id),
+            ),
+            offset,
+        )
+
 
 class EntityVelocityResponse(InboundEvent):
     packet_id = 0x58
     state = ConnectionState.PLAY
+    _struct = Struct('>hhh')
+    fields = (
+        ('entity_id', VarInt),
+        ('velocityx', Short),
+        ('velocityy', Short),
+        ('velocityz', Short),
+    )
 
     def __init__(
         self,
@@ -1069,6 +1669,21 @@ class EntityVelocityResponse(InboundEvent):
             velocityz=await Short.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['EntityVelocityResponse', int]:
+        entity_id, offset = VarInt.decode(buffer, offset)
+        velocityx, velocityy, velocityz = cls._struct.unpack_from(buffer, offset)
+        offset += cls._struct.size
+        return (
+            cls(
+                entity_id=entity_id,
+                velocityx=Short(velocityx),
+                velocityy=Short(velocityy),
+                velocityz=Short(velocityz),
+            ),
+            offset,
+        )
+
 
 class ExperienceResponse(InboundEvent):
     packet_id = 0x5A
@@ -1092,6 +1707,20 @@ class ExperienceResponse(InboundEvent):
             total_experience=await VarInt.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['ExperienceResponse', int]:
+        experience_bar, offset = Float.decode(buffer, offset)
+        level, offset = VarInt.decode(buffer, offset)
+        total_experience, offset = VarInt.decode(buffer, offset)
+        return (
+            cls(
+                experience_bar=experience_bar,
+                level=level,
+                total_experience=total_experience,
+            ),
+            offset,
+        )
+
 
 class UpdateHealthResponse(InboundEvent):
     packet_id = 0x5B
@@ -1115,10 +1744,25 @@ class UpdateHealthResponse(InboundEvent):
             food_saturation=await Float.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['UpdateHealthResponse', int]:
+        health, offset = Float.decode(buffer, offset)
+        food, offset = VarInt.decode(buffer, offset)
+        food_saturation, offset = Float.decode(buffer, offset)
+        return (
+            cls(
+                health=health,
+                food=food,
+                food_saturation=food_saturation,
+            ),
+            offset,
+        )
+
 
 class UpdateTimeResponse(InboundEvent):
     packet_id = 0x62
     state = ConnectionState.PLAY
+    _struct = Struct('>qq')
 
     def __init__(
         self,
@@ -1135,6 +1779,18 @@ class UpdateTimeResponse(InboundEvent):
             time=await Long.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['UpdateTimeResponse', int]:
+        age, time = cls._struct.unpack_from(buffer, offset)
+        offset += cls._struct.size
+        return (
+            cls(
+                age=Long(age),
+                time=Long(time),
+            ),
+            offset,
+        )
+
 
 class SetDefaultSpawnPositionResponse(InboundEvent):
     packet_id = 0x54
@@ -1155,6 +1811,18 @@ class SetDefaultSpawnPositionResponse(InboundEvent):
             angle=await Float.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['SetDefaultSpawnPositionResponse', int]:
+        location, offset = Position.decode(buffer, offset)
+        angle, offset = Float.decode(buffer, offset)
+        return (
+            cls(
+                location=location,
+                angle=angle,
+            ),
+            offset,
+        )
+
 
 class Slot(MCType):
 
@@ -1163,7 +1831,7 @@ class Slot(MCType):
         present: Boolean,
         item_id: VarInt | None = None,
         item_count: Byte | None = None,
-        nbt_data: nbt.Compound | None = None,
+        nbt_data: bytes | None = None,  # Raw NBT, decode it with nbt.NBT.decode_value when needed
     ) -> None:
         self.present = present
         self.item_id = item_id
@@ -1180,7 +1848,7 @@ class Slot(MCType):
             return cls(present)
         item_id = await VarInt.from_stream(reader)
         item_count = await Byte.from_stream(reader)
-        nbt_data = await nbt.NBT.from_stream(reader)
+        nbt_data = await nbt.NBT.read_raw_from_stream(reader)
         return cls(
             present=present,
             item_id=item_id,
@@ -1188,6 +1856,16 @@ class Slot(MCType):
             nbt_data=nbt_data,
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0, **kwargs) -> tuple['Slot', int]:
+        present, offset = Boolean.decode(buffer, offset)
+        if not present:
+            return cls(present), offset
+        item_id, offset = VarInt.decode(buffer, offset)
+        item_count, offset = Byte.decode(buffer, offset)
+        nbt_data, offset = nbt.NBT.read_raw(buffer, offset)
+        return cls(present=present, item_id=item_id, item_count=item_count, nbt_data=nbt_data), offset
+
 
 class SetContainerSlotResponse(InboundEvent):
     packet_id = 0x15
@@ -1217,6 +1895,14 @@ class SetContainerSlotResponse(InboundEvent):
             slot_data=await Slot.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['SetContainerSlotResponse', int]:
+        window_id, offset = Byte.decode(buffer, offset)
+        state_id, offset = VarInt.decode(buffer, offset)
+        slot, offset = Short.decode(buffer, offset)
+        slot_data, offset = Slot.decode(buffer, offset)
+        return cls(window_id=window_id, state_id=state_id, slot=slot, slot_data=slot_data), offset
+
 
 class SetContainerContentResponse(InboundEvent):
     packet_id = 0x13
@@ -1243,6 +1929,14 @@ class SetContainerContentResponse(InboundEvent):
             carried_item=await Slot.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['SetContainerContentResponse', int]:
+        window_id, offset = Byte.decode(buffer, offset)
+        state_id, offset = VarInt.decode(buffer, offset)
+        slots, offset = Array[Slot].decode(buffer, offset, length=None, mc_type=Slot)
+        carried_item, offset = Slot.decode(buffer, offset)
+        return cls(window_id=window_id, state_id=state_id, slots=slots, carried_item=carried_item), offset
+
 
 class CollectResponse(InboundEvent):
     packet_id = 0x6C
@@ -1266,10 +1960,34 @@ class CollectResponse(InboundEvent):
             pickup_item_count=await VarInt.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['CollectResponse', int]:
+        collected_entity_id, offset = VarInt.decode(buffer, offset)
+        collector_entity_id, offset = VarInt.decode(buffer, offset)
+        pickup_item_count, offset = VarInt.decode(buffer, offset)
+        return (
+            cls(
+                collected_entity_id=collected_entity_id,
+                collector_entity_id=collector_entity_id,
+                pickup_item_count=pickup_item_count,
+            ),
+            offset,
+        )
+
 
 class EntityTeleportResponse(InboundEvent):
     packet_id = 0x6D
     state = ConnectionState.PLAY
+    _struct = Struct('>dddbb?')
+    fields = (
+        ('entity_id', VarInt),
+        ('x', Double),
+        ('y', Double),
+        ('z', Double),
+        ('yaw', Byte),
+        ('pitch', Byte),
+        ('on_ground', Boolean),
+    )
 
     def __init__(
         self,
@@ -1301,6 +2019,24 @@ class EntityTeleportResponse(InboundEvent):
             on_ground=await Boolean.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['EntityTeleportResponse', int]:
+        entity_id, offset = VarInt.decode(buffer, offset)
+        x, y, z, yaw, pitch, on_ground = cls._struct.unpack_from(buffer, offset)
+        offset += cls._struct.size
+        return (
+            cls(
+                entity_id=entity_id,
+                x=Double(x),
+                y=Double(y),
+                z=Double(z),
+                yaw=Byte(yaw),
+                pitch=Byte(pitch),
+                on_ground=Boolean(on_ground),
+            ),
+            offset,
+        )
+
 
 class SelectAdvancementTabResponse(InboundEvent):
     packet_id = 0x48
@@ -1318,6 +2054,16 @@ class SelectAdvancementTabResponse(InboundEvent):
             id=await String.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['SelectAdvancementTabResponse', int]:
+        id, offset = String.decode(buffer, offset)
+        return (
+            cls(
+                id=id,
+            ),
+            offset,
+        )
+
 
 class AcknowledgePlayerDiggingResponse(InboundEvent):
     packet_id = 0x05
@@ -1335,6 +2081,16 @@ class AcknowledgePlayerDiggingResponse(InboundEvent):
             sequence_id=await VarInt.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['AcknowledgePlayerDiggingResponse', int]:
+        sequence_id, offset = VarInt.decode(buffer, offset)
+        return (
+            cls(
+                sequence_id=sequence_id,
+            ),
+            offset,
+        )
+
 
 class RemoveEntityResponse(InboundEvent):
     packet_id = 0x40
@@ -1356,6 +2112,12 @@ class RemoveEntityResponse(InboundEvent):
             entity_ids=await Array[VarInt].from_stream(reader, count.int, VarInt),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['RemoveEntityResponse', int]:
+        count, offset = VarInt.decode(buffer, offset)
+        entity_ids, offset = Array[VarInt].decode(buffer, offset, count.int, VarInt)
+        return cls(count=count, entity_ids=entity_ids), offset
+
 
 class ClearTitlesResponse(InboundEvent):
     packet_id = 0x0F
@@ -1373,10 +2135,21 @@ class ClearTitlesResponse(InboundEvent):
             reset=await Boolean.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['ClearTitlesResponse', int]:
+        reset, offset = Boolean.decode(buffer, offset)
+        return (
+            cls(
+                reset=reset,
+            ),
+            offset,
+        )
+
 
 class InitializeWorldBorderResponse(InboundEvent):
     packet_id = 0x23
     state = ConnectionState.PLAY
+    _struct = Struct('>dddd')
 
     def __init__(
         self,
@@ -1411,10 +2184,33 @@ class InitializeWorldBorderResponse(InboundEvent):
             warning_time=await VarInt.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['InitializeWorldBorderResponse', int]:
+        x, z, old_diameter, new_diameter = cls._struct.unpack_from(buffer, offset)
+        offset += cls._struct.size
+        speed, offset = VarInt.decode(buffer, offset)
+        portal_teleport_boundary, offset = VarInt.decode(buffer, offset)
+        warning_blocks, offset = VarInt.decode(buffer, offset)
+        warning_time, offset = VarInt.decode(buffer, offset)
+        return (
+            cls(
+                x=Double(x),
+                z=Double(z),
+                old_diameter=Double(old_diameter),
+                new_diameter=Double(new_diameter),
+                speed=speed,
+                portal_teleport_boundary=portal_teleport_boundary,
+                warning_blocks=warning_blocks,
+                warning_time=warning_time,
+            ),
+            offset,
+        )
+
 
 class WorldBorderCenterResponse(InboundEvent):
     packet_id = 0x4B
     state = ConnectionState.PLAY
+    _struct = Struct('>dd')
 
     def __init__(
         self,
@@ -1431,10 +2227,23 @@ class WorldBorderCenterResponse(InboundEvent):
             z=await Double.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['WorldBorderCenterResponse', int]:
+        x, z = cls._struct.unpack_from(buffer, offset)
+        offset += cls._struct.size
+        return (
+            cls(
+                x=Double(x),
+                z=Double(z),
+            ),
+            offset,
+        )
+
 
 class WorldBorderLerpSizeResponse(InboundEvent):
     packet_id = 0x4C
     state = ConnectionState.PLAY
+    _struct = Struct('>dd')
 
     def __init__(
         self,
@@ -1454,6 +2263,20 @@ class WorldBorderLerpSizeResponse(InboundEvent):
             speed=await VarInt.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['WorldBorderLerpSizeResponse', int]:
+        old_diameter, new_diameter = cls._struct.unpack_from(buffer, offset)
+        offset += cls._struct.size
+        speed, offset = VarInt.decode(buffer, offset)
+        return (
+            cls(
+                old_diameter=Double(old_diameter),
+                new_diameter=Double(new_diameter),
+                speed=speed,
+            ),
+            offset,
+        )
+
 
 class WorldBorderSizeResponse(InboundEvent):
     packet_id = 0x4D
@@ -1471,6 +2294,16 @@ class WorldBorderSizeResponse(InboundEvent):
             diameter=await Double.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['WorldBorderSizeResponse', int]:
+        diameter, offset = Double.decode(buffer, offset)
+        return (
+            cls(
+                diameter=diameter,
+            ),
+            offset,
+        )
+
 
 class WorldBorderWarningDelayResponse(InboundEvent):
     packet_id = 0x4E
@@ -1488,6 +2321,16 @@ class WorldBorderWarningDelayResponse(InboundEvent):
             warning_time=await VarInt.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['WorldBorderWarningDelayResponse', int]:
+        warning_time, offset = VarInt.decode(buffer, offset)
+        return (
+            cls(
+                warning_time=warning_time,
+            ),
+            offset,
+        )
+
 
 class WorldBorderWarningReachResponse(InboundEvent):
     packet_id = 0x4F
@@ -1505,6 +2348,16 @@ class WorldBorderWarningReachResponse(InboundEvent):
             warning_blocks=await VarInt.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['WorldBorderWarningReachResponse', int]:
+        warning_blocks, offset = VarInt.decode(buffer, offset)
+        return (
+            cls(
+                warning_blocks=warning_blocks,
+            ),
+            offset,
+        )
+
 
 class PingOldResponse(InboundEvent):
     packet_id = 0x33
@@ -1522,6 +2375,16 @@ class PingOldResponse(InboundEvent):
             id=await Int.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['PingOldResponse', int]:
+        id, offset = Int.decode(buffer, offset)
+        return (
+            cls(
+                id=id,
+            ),
+            offset,
+        )
+
 
 class PingResponse(InboundEvent):
     packet_id = 0x34
@@ -1539,10 +2402,21 @@ class PingResponse(InboundEvent):
             id=await Long.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['PingResponse', int]:
+        id, offset = Long.decode(buffer, offset)
+        return (
+            cls(
+                id=id,
+            ),
+            offset,
+        )
+
 
 class SetTitleTimeResponse(InboundEvent):
     packet_id = 0x64
     state = ConnectionState.PLAY
+    _struct = Struct('>iii')
 
     def __init__(
         self,
@@ -1562,6 +2436,19 @@ class SetTitleTimeResponse(InboundEvent):
             fade_out=await Int.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['SetTitleTimeResponse', int]:
+        fade_in, stay, fade_out = cls._struct.unpack_from(buffer, offset)
+        offset += cls._struct.size
+        return (
+            cls(
+                fade_in=Int(fade_in),
+                stay=Int(stay),
+                fade_out=Int(fade_out),
+            ),
+            offset,
+        )
+
 
 class SimulationDistanceResponse(InboundEvent):
     packet_id = 0x60
@@ -1579,6 +2466,16 @@ class SimulationDistanceResponse(InboundEvent):
             distance=await VarInt.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['SimulationDistanceResponse', int]:
+        distance, offset = VarInt.decode(buffer, offset)
+        return (
+            cls(
+                distance=distance,
+            ),
+            offset,
+        )
+
 
 class HurtAnimationResponse(InboundEvent):
     packet_id = 0x22
@@ -1599,6 +2496,18 @@ class HurtAnimationResponse(InboundEvent):
             yaw=await Float.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['HurtAnimationResponse', int]:
+        entity_id, offset = VarInt.decode(buffer, offset)
+        yaw, offset = Float.decode(buffer, offset)
+        return (
+            cls(
+                entity_id=entity_id,
+                yaw=yaw,
+            ),
+            offset,
+        )
+
 
 class StartConfigurationResponse(InboundEvent):
     packet_id = 0x67
@@ -1608,6 +2517,7 @@ class StartConfigurationResponse(InboundEvent):
 class SetTickingStateResponse(InboundEvent):
     packet_id = 0x6E
     state = ConnectionState.PLAY
+    _struct = Struct('>f?')
 
     def __init__(
         self,
@@ -1624,6 +2534,18 @@ class SetTickingStateResponse(InboundEvent):
             is_frozen=await Boolean.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['SetTickingStateResponse', int]:
+        tick_rate, is_frozen = cls._struct.unpack_from(buffer, offset)
+        offset += cls._struct.size
+        return (
+            cls(
+                tick_rate=Float(tick_rate),
+                is_frozen=Boolean(is_frozen),
+            ),
+            offset,
+        )
+
 
 class StepTickResponse(InboundEvent):
     packet_id = 0x6F
@@ -1641,6 +2563,16 @@ class StepTickResponse(InboundEvent):
             tick_steps=await VarInt.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['StepTickResponse', int]:
+        tick_steps, offset = VarInt.decode(buffer, offset)
+        return (
+            cls(
+                tick_steps=tick_steps,
+            ),
+            offset,
+        )
+
 
 class LengthPrefixedByteArray(MCType):
 
@@ -1660,6 +2592,12 @@ class LengthPrefixedByteArray(MCType):
             data=await reader.read(length.int),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0, **kwargs) -> tuple['LengthPrefixedByteArray', int]:
+        length, offset = VarInt.decode(buffer, offset)
+        end = offset + length.int
+        return cls(length=length, data=bytes(buffer[offset:end])), end
+
 
 class PackedXZ(MCType):
 
@@ -1675,10 +2613,16 @@ class PackedXZ(MCType):
             z=value.int & 15,
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0, **kwargs) -> tuple['PackedXZ', int]:
+        value = buffer[offset]
+        return cls(x=(value >> 4) & 15, z=value & 15), offset + 1
+
 
 class ChunkDataAndLightResponse(InboundEvent):
     packet_id = 0x25
     state = ConnectionState.PLAY
+    _struct = Struct('>ii')
 
     class BlockEntity(MCType):
 
@@ -1687,7 +2631,7 @@ class ChunkDataAndLightResponse(InboundEvent):
             packed_xz: PackedXZ,
             y: Short,
             block_type: VarInt,
-            data: nbt.Compound | None,
+            data: bytes | None,  # Raw NBT, decode it with nbt.NBT.decode_value when needed
         ):
             self.packed_xz = packed_xz
             self.y = y
@@ -1700,17 +2644,27 @@ class ChunkDataAndLightResponse(InboundEvent):
                 packed_xz=await PackedXZ.from_stream(reader),
                 y=await Short.from_stream(reader),
                 block_type=await VarInt.from_stream(reader),
-                data=await nbt.NBT.from_stream(
-                    reader,
-                    is_anonymous=True,
-                ),
+                data=await nbt.NBT.read_raw_from_stream(reader, is_anonymous=True),
             )
 
+        @classmethod
+        def decode(
+            cls,
+            buffer: Buffer,
+            offset: int = 0,
+            **kwargs,
+        ) -> tuple['ChunkDataAndLightResponse.BlockEntity', int]:
+            packed_xz, offset = PackedXZ.decode(buffer, offset)
+            y, offset = Short.decode(buffer, offset)
+            block_type, offset = VarInt.decode(buffer, offset)
+            data, offset = nbt.NBT.read_raw(buffer, offset, is_anonymous=True)
+            return cls(packed_xz=packed_xz, y=y, block_type=block_type, data=data), offset
+
     def __init__(
         self,
         chunk_x: Int,
         chunk_z: Int,
-        heightmaps: nbt.Compound,
+        heightmaps: dict[str, Any] | None,
         size: VarInt,
         data: bytes,
         number_of_block_entities: VarInt,
@@ -1744,10 +2698,7 @@ class ChunkDataAndLightResponse(InboundEvent):
     async def from_stream(cls, reader: SocketReader) -> 'ChunkDataAndLightResponse':
         chunk_x = await Int.from_stream(reader)
         chunk_z = await Int.from_stream(reader)
-        heightmaps = await nbt.NBT.from_stream(  # type: ignore[func-returns-value]
-            reader,
-            is_anonymous=True,
-        )
+        heightmaps = await nbt.NBT.value_from_stream(reader, is_anonymous=True)
         size = await VarInt.from_stream(reader)
         data = await reader.read(size.int)
         number_of_block_entities = await VarInt.from_stream(reader)
@@ -1775,7 +2726,7 @@ class ChunkDataAndLightResponse(InboundEvent):
         return cls(
             chunk_x=chunk_x,
             chunk_z=chunk_z,
-            heightmaps=heightmaps,  # type: ignore[arg-type]
+            heightmaps=heightmaps,
             size=size,
             data=data,
             number_of_block_entities=number_of_block_entities,
@@ -1790,6 +2741,60 @@ class ChunkDataAndLightResponse(InboundEvent):
             block_light=block_light,
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['ChunkDataAndLightResponse', int]:
+        chunk_x, chunk_z = cls._struct.unpack_from(buffer, offset)
+        offset += cls._struct.size
+        heightmaps, offset = nbt.NBT.decode_value(buffer, offset, is_anonymous=True)
+        size, offset = VarInt.decode(buffer, offset)
+        data = bytes(buffer[offset : offset + size.int])
+        offset += size.int
+        number_of_block_entities, offset = VarInt.decode(buffer, offset)
+        block_entities, offset = Array[ChunkDataAndLightResponse.BlockEntity].decode(
+            buffer,
+            offset,
+            number_of_block_entities.int,
+            ChunkDataAndLightResponse.BlockEntity,
+        )
+        sky_light_mask, offset = BitSet.decode(buffer, offset)
+        block_light_mask, offset = BitSet.decode(buffer, offset)
+        empty_sky_light_mask, offset = BitSet.decode(buffer, offset)
+        empty_block_light_mask, offset = BitSet.decode(buffer, offset)
+        skylight_count, offset = VarInt.decode(buffer, offset)
+        sky_light, offset = Array[LengthPrefixedByteArray].decode(
+            buffer,
+            offset,
+            skylight_count.int,
+            LengthPrefixedByteArray,
+        )
+        block_light_count, offset = VarInt.decode(buffer, offset)
+        block_light, offset = Array[LengthPrefixedByteArray].decode(
+            buffer,
+            offset,
+            block_light_count.int,
+            LengthPrefixedByteArray,
+        )
+        return (
+            cls(
+                chunk_x=Int(chunk_x),
+                chunk_z=Int(chunk_z),
+                heightmaps=heightmaps,
+                size=size,
+                data=data,
+                number_of_block_entities=number_of_block_entities,
+                block_entities=block_entities,
+                sky_light_mask=sky_light_mask,
+                block_light_mask=block_light_mask,
+                empty_sky_light_mask=empty_sky_light_mask,
+                empty_block_light_mask=empty_block_light_mask,
+                skylight_count=skylight_count,
+                sky_light=sky_light,
+                block_light_count=block_light_count,
+                block_light=block_light,
+            ),
+            offset,
+        )
+
 
 class PlayerAction(MCType):
     class AddPlayer(MCType):
@@ -1820,6 +2825,21 @@ class PlayerAction(MCType):
                     signature=signature,
                 )
 
+            @classmethod
+            def decode(
+                cls,
+                buffer: Buffer,
+                offset: int = 0,
+                **kwargs,
+            ) -> tuple['PlayerAction.AddPlayer.Property', int]:
+                name, offset = String.decode(buffer, offset)
+                value, offset = String.decode(buffer, offset)
+                is_signed, offset = Boolean.decode(buffer, offset)
+                signature = None
+                if is_signed:
+                    signature, offset = String.decode(buffer, offset)
+                return cls(name=name, value=value, is_signed=is_signed, signature=signature), offset
+
         def __init__(
             self,
             name: String,
@@ -1845,6 +2865,18 @@ class PlayerAction(MCType):
                 properties=properties,
             )
 
+        @classmethod
+        def decode(cls, buffer: Buffer, offset: int = 0, **kwargs) -> tuple['PlayerAction.AddPlayer', int]:
+            name, offset = String.decode(buffer, offset)
+            number_of_properties, offset = VarInt.decode(buffer, offset)
+            properties, offset = Array[PlayerAction.AddPlayer.Property].decode(
+                buffer,
+                offset,
+                number_of_properties.int,
+                PlayerAction.AddPlayer.Property,
+            )
+            return cls(name=name, number_of_properties=number_of_properties, properties=properties), offset
+
     class InitializeChat(MCType):
 
         def __init__(
@@ -1892,6 +2924,32 @@ class PlayerAction(MCType):
                 public_key_signature=public_key_signature,
             )
 
+        @classmethod
+        def decode(cls, buffer: Buffer, offset: int = 0, **kwargs) -> tuple['PlayerAction.InitializeChat', int]:
+            has_signature_data, offset = Boolean.decode(buffer, offset)
+            if not has_signature_data.bool:
+                return cls(has_signature_data=has_signature_data), offset
+            chat_session_id, offset = UUID.decode(buffer, offset)
+            public_key_expiry_time, offset = Long.decode(buffer, offset)
+            encoded_public_key_size, offset = VarInt.decode(buffer, offset)
+            encoded_public_key = bytes(buffer[offset : offset + encoded_public_key_size.int])
+            offset += encoded_public_key_size.int
+            public_key_signature_size, offset = VarInt.decode(buffer, offset)
+            public_key_signature = bytes(buffer[offset : offset + public_key_signature_size.int])
+            offset += public_key_signature_size.int
+            return (
+                cls(
+                    has_signature_data=has_signature_data,
+                    chat_session_id=chat_session_id,
+                    public_key_expiry_time=public_key_expiry_time,
+                    encoded_public_key_size=encoded_public_key_size,
+                    encoded_public_key=encoded_public_key,
+                    public_key_signature_size=public_key_signature_size,
+                    public_key_signature=public_key_signature,
+                ),
+                offset,
+            )
+
     class UpdateGameMode(MCType):
 
         def __init__(
@@ -1907,6 +2965,11 @@ class PlayerAction(MCType):
                 game_mode=game_mode,
             )
 
+        @classmethod
+        def decode(cls, buffer: Buffer, offset: int = 0, **kwargs) -> tuple['PlayerAction.UpdateGameMode', int]:
+            game_mode, offset = VarInt.decode(buffer, offset)
+            return cls(game_mode=game_mode), offset
+
     class UpdateListed(MCType):
 
         def __init__(
@@ -1922,6 +2985,11 @@ class PlayerAction(MCType):
                 listed=listed,
             )
 
+        @classmethod
+        def decode(cls, buffer: Buffer, offset: int = 0, **kwargs) -> tuple['PlayerAction.UpdateListed', int]:
+            listed, offset = Boolean.decode(buffer, offset)
+            return cls(listed=listed), offset
+
     class UpdateLatency(MCType):
 
         def __init__(
@@ -1937,6 +3005,11 @@ class PlayerAction(MCType):
                 latency=latency,
             )
 
+        @classmethod
+        def decode(cls, buffer: Buffer, offset: int = 0, **kwargs) -> tuple['PlayerAction.UpdateLatency', int]:
+            latency, offset = VarInt.decode(buffer, offset)
+            return cls(latency=latency), offset
+
     class UpdateDisplayName(MCType):
 
         def __init__(
@@ -1963,6 +3036,14 @@ class PlayerAction(MCType):
                 display_name=display_name,
             )
 
+        @classmethod
+        def decode(cls, buffer: Buffer, offset: int = 0, **kwargs) -> tuple['PlayerAction.UpdateDisplayName', int]:
+            has_display_name, offset = Boolean.decode(buffer, offset)
+            display_name = None
+            if has_display_name:
+                display_name, offset = nbt.NBT.decode(buffer, offset, is_anonymous=True)
+            return cls(has_display_name=has_display_name, display_name=display_name), offset
+
     class Action(int, Enum):
         ADD_PLAYER = 0x01
         INITIALIZE_CHAT = 0x02
@@ -1972,6 +3053,14 @@ class PlayerAction(MCType):
         UPDATE_DISPLAY_NAME = 0x20
 
     AVAILABLE_DATA_TYPE = AddPlayer | InitializeChat | UpdateGameMode | UpdateListed | UpdateLatency | UpdateDisplayName
+    ACTION_DATA_TYPES = {
+        Action.ADD_PLAYER: AddPlayer,
+        Action.INITIALIZE_CHAT: InitializeChat,
+        Action.UPDATE_GAME_MODE: UpdateGameMode,
+        Action.UPDATE_LISTED: UpdateListed,
+        Action.UPDATE_LATENCY: UpdateLatency,
+        Action.UPDATE_DISPLAY_NAME: UpdateDisplayName,
+    }
 
     def __init__(
         self,
@@ -2036,6 +3125,16 @@ class PlayerAction(MCType):
             data=data,
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0, **kwargs) -> tuple['PlayerAction', int]:
+        actions: Byte = kwargs['actions']
+        exclude: list[PlayerAction.Action] = kwargs['exclude']
+        for action in PlayerAction.Action:  # Same priority as in from_stream
+            if actions.int & action.value and action not in exclude:
+                data, offset = cls.ACTION_DATA_TYPES[action].decode(buffer, offset)
+                return cls(action=action, data=data), offset
+        raise ValueError("Unknown PlayerAction action")
+
     @classmethod
     def get_actions_count_from_byte(cls, action_byte: Byte) -> int:
         count = 0
@@ -2071,6 +3170,19 @@ class PlayerInArray(MCType):
             player_actions=player_actions,
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0, **kwargs) -> tuple['PlayerInArray', int]:
+        actions: Byte = kwargs['actions']
+        uuid, offset = UUID.decode(buffer, offset)
+        length = PlayerAction.get_actions_count_from_byte(actions)
+        player_actions = Array[PlayerAction]()
+        exclude_action: list[PlayerAction.Action] = []
+        for _ in range(length):
+            player_action, offset = PlayerAction.decode(buffer, offset, actions=actions, exclude=exclude_action)
+            exclude_action.append(player_action.action)
+            player_actions.append(player_action)
+        return cls(uuid=uuid, player_actions=player_actions), offset
+
 
 class UpdateSectionBlocksResponse(InboundEvent):
     packet_id = 0x47
@@ -2086,6 +3198,19 @@ class UpdateSectionBlocksResponse(InboundEvent):
         @classmethod
         async def from_stream(cls, reader: SocketReader, **kwargs) -> 'UpdateSectionBlocksResponse.ChunkPosition':
             raw_chunk_position = (await Long.from_stream(reader)).int
+            return cls.from_long(raw_chunk_position)
+
+        @classmethod
+        def decode(
+            cls,
+            buffer: Buffer,
+            offset: int = 0,
+            **kwargs,
+        ) -> tuple['UpdateSectionBlocksResponse.ChunkPosition', int]:
+            return cls.from_long(Long.struct.unpack_from(buffer, offset)[0]), offset + Long.size
+
+        @classmethod
+        def from_long(cls, raw_chunk_position: int) -> 'UpdateSectionBlocksResponse.ChunkPosition':
             """
             sectionX = long >> 42;
             sectionY = long << 44 >> 44;
@@ -2120,7 +3245,15 @@ class UpdateSectionBlocksResponse(InboundEvent):
         @classmethod
         async def from_stream(cls, reader: SocketReader, **kwargs):
             raw_block = (await VarLong.from_stream(reader)).int
+            return cls.from_long(raw_block)
+
+        @classmethod
+        def decode(cls, buffer: Buffer, offset: int = 0, **kwargs) -> tuple['UpdateSectionBlocksResponse.Block', int]:
+            raw_block, offset = VarLong.decode(buffer, offset)
+            return cls.from_long(raw_block.int), offset
 
+        @classmethod
+        def from_long(cls, raw_block: int) -> 'UpdateSectionBlocksResponse.Block':
             return cls(
                 state_id=raw_block >> 12,
                 x=(raw_block >> 8) & 0xF,
@@ -2153,6 +3286,14 @@ class UpdateSectionBlocksResponse(InboundEvent):
             blocks=blocks,
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['UpdateSectionBlocksResponse', int]:
+        chunk_position, offset = UpdateSectionBlocksResponse.ChunkPosition.decode(buffer, offset)
+        blocks_count, offset = VarInt.decode(buffer, offset)
+        raw_blocks, offset = VarLong.decode_many(buffer, blocks_count.int, offset)
+        blocks = Array[UpdateSectionBlocksResponse.Block](map(UpdateSectionBlocksResponse.Block.from_long, raw_blocks))
+        return cls(chunk_position=chunk_position, blocks_count=blocks_count, blocks=blocks), offset
+
 
 class PlayerInfoUpdateResponse(InboundEvent):
     packet_id = 0x3C
@@ -2184,6 +3325,19 @@ class PlayerInfoUpdateResponse(InboundEvent):
             players=players,
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['PlayerInfoUpdateResponse', int]:
+        actions, offset = Byte.decode(buffer, offset)
+        number_of_players, offset = VarInt.decode(buffer, offset)
+        players, offset = Array[PlayerInArray].decode(
+            buffer,
+            offset,
+            number_of_players.int,
+            PlayerInArray,
+            type_params={'actions': actions},
+        )
+        return cls(actions=actions, number_of_players=number_of_players, players=players), offset
+
 
 class UpdateBlockResponse(InboundEvent):
     packet_id = 0x09
@@ -2204,6 +3358,18 @@ class UpdateBlockResponse(InboundEvent):
             state_id=await VarInt.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['UpdateBlockResponse', int]:
+        location, offset = Position.decode(buffer, offset)
+        state_id, offset = VarInt.decode(buffer, offset)
+        return (
+            cls(
+                location=location,
+                state_id=state_id,
+            ),
+            offset,
+        )
+
 
 class PlayerInfoRemoveResponse(InboundEvent):
     packet_id = 0x3B
@@ -2225,3 +3391,9 @@ class PlayerInfoRemoveResponse(InboundEvent):
             number_of_players=number_of_players,
             players=players,
         )
+
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['PlayerInfoRemoveResponse', int]:
+        number_of_players, offset = VarInt.decode(buffer, offset)
+        players, offset = Array[UUID].decode(buffer, offset, number_of_players.int, UUID)
+        return cls(number_of_players=number_of_players, players=players), offset
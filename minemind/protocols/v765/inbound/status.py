@@ -1,5 +1,5 @@
 from minemind.mc_types import Long, String
-from minemind.mc_types.base import SocketReader
+from minemind.mc_types.base import Buffer, SocketReader
 from minemind.protocols.enums import ConnectionState
 from minemind.protocols.protocol_events import InboundEvent
 
@@ -20,6 +20,16 @@ class ServerInfoResponse(InboundEvent):
             response=await String.from_stream(reader),
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['ServerInfoResponse', int]:
+        response, offset = String.decode(buffer, offset)
+        return (
+            cls(
+                response=response,
+            ),
+            offset,
+        )
+
 
 class PingResponse(InboundEvent):
     packet_id = 0x01
@@ -36,3 +46,13 @@ class PingResponse(InboundEvent):
         return cls(
             time=await Long.from_stream(reader),
         )
+
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['PingResponse', int]:
+        time, offset = Long.decode(buffer, offset)
+        return (
+            cls(
+                time=time,
+            ),
+            offset,
+        )
@@ -1,18 +1,19 @@
 from minemind import DEBUG_PROTOCOL
 from minemind.client import Client
 from minemind.dispatcher import EventDispatcher
-from minemind.mc_types import nbt
 from minemind.protocols.base import InteractionModule
 from minemind.protocols.utils import get_logger
-from minemind.protocols.v765.constants import ITEMS
 from minemind.protocols.v765.inbound.play import SetContainerContentResponse, SetContainerSlotResponse
+from minemind.protocols.v765.registry import get_item
 
 
 class Slot:
 
-    def __init__(self, item_id: int, item_count: int, properties: nbt.NBT | None = None):
+    def __init__(self, item_id: int, item_count: int, properties: bytes | None = None):
         self.item_id = item_id
-        item = ITEMS.get(str(item_id), 'Unknown')
+        item = get_item(item_id)
+        if item is None:
+            raise ValueError(f'Unknown item {item_id}')
         self.item_name = item['name']
         self.stack_size = item['stackSize']
         self.item_count = item_count
@@ -1,3 +1,5 @@
+from struct import Struct
+
 from minemind.mc_types import UUID, Boolean, Byte, Int, Long, String, UByte, VarInt
 from minemind.protocols.enums import ConnectionState
 from minemind.protocols.protocol_events import OutboundEvent
@@ -6,6 +8,8 @@ from minemind.protocols.protocol_events import OutboundEvent
 class SettingsRequest(OutboundEvent):
     packet_id = 0x00
     state = ConnectionState.CONFIGURATION
+    _struct_1 = Struct('>?B')
+    _struct_2 = Struct('>??')
 
     def __init__(
         self,
@@ -33,11 +37,9 @@ class SettingsRequest(OutboundEvent):
             self.locale.bytes
             + self.view_distance.bytes
             + self.chat_flags.bytes
-            + self.chat_colors.bytes
-            + self.skin_parts.bytes
+            + self._struct_1.pack(self.chat_colors.bool, self.skin_parts.int)
             + self.main_hand.bytes
-            + self.enable_text_filtering.bytes
-            + self.enable_server_listing.bytes
+            + self._struct_2.pack(self.enable_text_filtering.bool, self.enable_server_listing.bool)
         )
 
 
@@ -1,8 +1,10 @@
 import math
 from enum import Enum
+from struct import Struct
 from typing import Optional
 
 from minemind.mc_types import UUID, Boolean, Byte, Double, Float, Int, Long, Short, String, UByte, VarInt
+from minemind.mc_types.base import pack_into
 from minemind.protocols.enums import ConnectionState
 from minemind.protocols.protocol_events import OutboundEvent
 
@@ -21,6 +23,9 @@ class TeleportConfirmRequest(OutboundEvent):
     def payload(self) -> bytes:
         return self.teleport_id.bytes
 
+    def encode(self, buffer: bytearray) -> None:
+        VarInt.write(buffer, self.teleport_id.int)
+
 
 class SetDifficultyRequest(OutboundEvent):
     packet_id = 0x02
@@ -221,6 +226,8 @@ class ClientCommandRequest(OutboundEvent):
 class SettingsRequest(OutboundEvent):
     packet_id = 0x09
     state = ConnectionState.PLAY
+    _struct_1 = Struct('>?B')
+    _struct_2 = Struct('>??')
 
     def __init__(
         self,
@@ -248,17 +255,16 @@ class SettingsRequest(OutboundEvent):
             self.locale.bytes
             + self.view_distance.bytes
             + self.chat_flags.bytes
-            + self.chat_colors.bytes
-            + self.skin_parts.bytes
+            + self._struct_1.pack(self.chat_colors.bool, self.skin_parts.int)
             + self.main_hand.bytes
-            + self.enable_text_filtering.bytes
-            + self.enable_server_listing.bytes
+            + self._struct_2.pack(self.enable_text_filtering.bool, self.enable_server_listing.bool)
         )
 
 
 class EnchantItemRequest(OutboundEvent):
     packet_id = 0x0C
     state = ConnectionState.PLAY
+    _struct = Struct('>bb')
 
     def __init__(
         self,
@@ -270,7 +276,7 @@ class EnchantItemRequest(OutboundEvent):
 
     @property
     def payload(self) -> bytes:
-        return self.window_id.bytes + self.enchantment.bytes
+        return self._struct.pack(self.window_id.int, self.enchantment.int)
 
 
 class CloseWindowRequest(OutboundEvent):
@@ -302,6 +308,9 @@ class KeepAliveRequest(OutboundEvent):
     def payload(self) -> bytes:
         return self.keep_alive_id.bytes
 
+    def encode(self, buffer: bytearray) -> None:
+        pack_into(buffer, Long.struct, self.keep_alive_id.int)
+
 
 class LockDifficultyRequest(OutboundEvent):
     packet_id = 0x16
@@ -321,6 +330,7 @@ class LockDifficultyRequest(OutboundEvent):
 class PositionRequest(OutboundEvent):
     packet_id = 0x17
     state = ConnectionState.PLAY
+    _struct = Struct('>ddd?')
 
     def __init__(
         self,
@@ -336,12 +346,16 @@ class PositionRequest(OutboundEvent):
 
     @property
     def payload(self) -> bytes:
-        return self.x.bytes + self.y.bytes + self.z.bytes + self.on_ground.bytes
+        return self._struct.pack(self.x.float, self.y.float, self.z.float, self.on_ground.bool)
+
+    def encode(self, buffer: bytearray) -> None:
+        pack_into(buffer, self._struct, self.x.float, self.y.float, self.z.float, self.on_ground.bool)
 
 
 class PositionLookRequest(OutboundEvent):
     packet_id = 0x18
     state = ConnectionState.PLAY
+    _struct = Struct('>dddff?')
 
     def __init__(
         self,
@@ -361,12 +375,32 @@ class PositionLookRequest(OutboundEvent):
 
     @property
     def payload(self) -> bytes:
-        return self.x.bytes + self.y.bytes + self.z.bytes + self.yaw.bytes + self.pitch.bytes + self.on_ground.bytes
+        return self._struct.pack(
+            self.x.float,
+            self.y.float,
+            self.z.float,
+            self.yaw.float,
+            self.pitch.float,
+            self.on_ground.bool,
+        )
+
+    def encode(self, buffer: bytearray) -> None:
+        pack_into(
+            buffer,
+            self._struct,
+            self.x.float,
+            self.y.float,
+            self.z.float,
+            self.yaw.float,
+            self.pitch.float,
+            self.on_ground.bool,
+        )
 
 
 class LookRequest(OutboundEvent):
     packet_id = 0x19
     state = ConnectionState.PLAY
+    _struct = Struct('>ff?')
 
     def __init__(
         self,
@@ -380,7 +414,10 @@ class LookRequest(OutboundEvent):
 
     @property
     def payload(self) -> bytes:
-        return self.yaw.bytes + self.pitch.bytes + self.on_ground.bytes
+        return self._struct.pack(self.yaw.float, self.pitch.float, self.on_ground.bool)
+
+    def encode(self, buffer: bytearray) -> None:
+        pack_into(buffer, self._struct, self.yaw.float, self.pitch.float, self.on_ground.bool)
 
 
 class FlyingRequest(OutboundEvent):
@@ -397,10 +434,14 @@ class FlyingRequest(OutboundEvent):
     def payload(self) -> bytes:
         return self.on_ground.bytes
 
+    def encode(self, buffer: bytearray) -> None:
+        buffer.append(self.on_ground.bool)
+
 
 class VehicleMoveRequest(OutboundEvent):
     packet_id = 0x1B
     state = ConnectionState.PLAY
+    _struct = Struct('>dddff')
 
     def __init__(
         self,
@@ -418,12 +459,13 @@ class VehicleMoveRequest(OutboundEvent):
 
     @property
     def payload(self) -> bytes:
-        return self.x.bytes + self.y.bytes + self.z.bytes + self.yaw.bytes + self.pitch.bytes
+        return self._struct.pack(self.x.float, self.y.float, self.z.float, self.yaw.float, self.pitch.float)
 
 
 class SteerBoatRequest(OutboundEvent):
     packet_id = 0x1C
     state = ConnectionState.PLAY
+    _struct = Struct('>??')
 
     def __init__(
         self,
@@ -435,7 +477,7 @@ class SteerBoatRequest(OutboundEvent):
 
     @property
     def payload(self) -> bytes:
-        return self.left_paddle.bytes + self.right_paddle.bytes
+        return self._struct.pack(self.left_paddle.bool, self.right_paddle.bool)
 
 
 class CraftRecipeRequest(OutboundEvent):
@@ -494,6 +536,7 @@ class EntityActionRequest(OutboundEvent):
 class SteerVehicleRequest(OutboundEvent):
     packet_id = 0x23
     state = ConnectionState.PLAY
+    _struct = Struct('>ffB')
 
     def __init__(
         self,
@@ -507,7 +550,7 @@ class SteerVehicleRequest(OutboundEvent):
 
     @property
     def payload(self) -> bytes:
-        return self.sideways.bytes + self.forward.bytes + self.jump.bytes
+        return self._struct.pack(self.sideways.float, self.forward.float, self.jump.int)
 
 
 class DisplayedRecipeRequest(OutboundEvent):
@@ -528,6 +571,7 @@ class DisplayedRecipeRequest(OutboundEvent):
 class RecipeBookRequest(OutboundEvent):
     packet_id = 0x25
     state = ConnectionState.PLAY
+    _struct = Struct('>??')
 
     def __init__(
         self,
@@ -541,7 +585,7 @@ class RecipeBookRequest(OutboundEvent):
 
     @property
     def payload(self) -> bytes:
-        return self.book_id.bytes + self.book_open.bytes + self.filter_active.bytes
+        return self.book_id.bytes + self._struct.pack(self.book_open.bool, self.filter_active.bool)
 
 
 class ResourcePackReceiveRequest(OutboundEvent):
@@ -596,6 +640,9 @@ class ArmAnimationRequest(OutboundEvent):
     def payload(self) -> bytes:
         return self.hand.bytes
 
+    def encode(self, buffer: bytearray) -> None:
+        VarInt.write(buffer, self.hand.int)
+
 
 class SpectateRequest(OutboundEvent):
     packet_id = 0x34
@@ -658,6 +705,9 @@ class ChunkBatchReceivedRequest(OutboundEvent):
     def payload(self) -> bytes:
         return self.chunks_per_tick.bytes
 
+    def encode(self, buffer: bytearray) -> None:
+        pack_into(buffer, Float.struct, self.chunks_per_tick.float)
+
 
 class InteractRequest(OutboundEvent):
     packet_id = 0x13
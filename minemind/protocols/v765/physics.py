@@ -2,6 +2,8 @@ import asyncio
 import math
 import time
 import typing
+import weakref
+from array import array
 
 from minemind import DEBUG_PROTOCOL
 from minemind.client import Client
@@ -21,7 +23,7 @@ from minemind.protocols.v765.constants import (
 )
 from minemind.protocols.v765.inbound.play import LoginResponse, PositionResponse
 from minemind.protocols.v765.outbound.play import PositionRequest
-from minemind.protocols.v765.world import Block, World
+from minemind.protocols.v765.world import Block, Chunk, World, get_collision_shapes
 
 if typing.TYPE_CHECKING:
     from minemind.protocols.v765.bot import Bot
@@ -148,6 +150,84 @@ class AABB:
         )
 
 
+# Collision kernels over flat box arrays (6 values per box, see PlayerPhysicsSimulation.get_surrounding_boxes).
+# Each of them gives the same result as calling the AABB method of every box in turn: clipping is a min/max
+# reduction, so only boxes that would clip the offset further are checked for overlap on the other axes.
+
+
+def clip_offset(boxes: array, bb: AABB, axis: int, offset: float) -> float:
+    """
+    Clip the offset so that bb moved along the axis stops at the first box in the way.
+    :param boxes: Flat array of boxes
+    :param bb: Moving bounding box
+    :param axis: 0 for x, 1 for y and 2 for z
+    :param offset: Wanted offset
+    :return: Clipped offset
+    """
+    if offset == 0:
+        return offset
+    bounds = (bb.min_x, bb.min_y, bb.min_z, bb.max_x, bb.max_y, bb.max_z)
+    u, v = (axis + 1) % 3, (axis + 2) % 3
+    bb_min, bb_max = bounds[axis], bounds[axis + 3]
+    bb_min_u, bb_max_u, bb_min_v, bb_max_v = bounds[u], bounds[u + 3], bounds[v], bounds[v + 3]
+    # Only the bounds on the moving axis are scanned, the other axes are read for boxes that would clip the offset
+    if offset > 0:
+        for start, min_ in enumerate(boxes[axis::6]):
+            if bb_max <= min_ and min_ - bb_max < offset:
+                start *= 6
+                if (
+                    bb_max_u > boxes[start + u]
+                    and bb_min_u < boxes[start + u + 3]
+                    and bb_max_v > boxes[start + v]
+                    and bb_min_v < boxes[start + v + 3]
+                ):
+                    offset = min_ - bb_max
+    else:
+        for start, max_ in enumerate(boxes[axis + 3 :: 6]):
+            if bb_min >= max_ and max_ - bb_min > offset:
+                start *= 6
+                if (
+                    bb_max_u > boxes[start + u]
+                    and bb_min_u < boxes[start + u + 3]
+                    and bb_max_v > boxes[start + v]
+                    and bb_min_v < boxes[start + v + 3]
+                ):
+                    offset = max_ - bb_min
+    return offset
+
+
+def get_offset_x(boxes: array, bb: AABB, offset_x: float) -> float:
+    return clip_offset(boxes, bb, 0, offset_x)
+
+
+def get_offset_y(boxes: array, bb: AABB, offset_y: float) -> float:
+    return clip_offset(boxes, bb, 1, offset_y)
+
+
+def get_offset_z(boxes: array, bb: AABB, offset_z: float) -> float:
+    return clip_offset(boxes, bb, 2, offset_z)
+
+
+def intersects_any(boxes: array, bb: AABB) -> bool:
+    bb_min_x, bb_min_y, bb_min_z, bb_max_x, bb_max_y, bb_max_z = (
+        bb.min_x,
+        bb.min_y,
+        bb.min_z,
+        bb.max_x,
+        bb.max_y,
+        bb.max_z,
+    )
+    return any(
+        bb_min_x < max_x
+        and bb_max_x > min_x
+        and bb_min_y < max_y
+        and bb_max_y > min_y
+        and bb_min_z < max_z
+        and bb_max_z > min_z
+        for min_x, min_y, min_z, max_x, max_y, max_z in zip(*[iter(boxes)] * 6)
+    )
+
+
 def time_ms() -> int:
     """
     Get current time in milliseconds
@@ -155,8 +235,86 @@ def time_ms() -> int:
     return time.perf_counter_ns() // 1_000_000
 
 
+class WorldCache:
+    """
+    Collision boxes and blocks of the world, shared by the simulations of one scheduler tick.
+
+    Every block is looked up once per tick, even when it is queried again to step up or by other bots. Blocks are keyed
+    by their chunk, so bots sharing chunks through a ChunkStore share the lookups, while each bot still only sees the
+    chunks loaded in its own world.
+    """
+
+    logger = get_logger('WorldCache')
+    NO_BOXES = array('d')
+
+    def __init__(self):
+        self.shapes = get_collision_shapes()
+        self.boxes: dict[Chunk, dict[int, array]] = {}
+        self.blocks: dict[Chunk, dict[int, Block | None]] = {}
+
+    def get_block_boxes(self, chunk: Chunk, x: int, y: int, z: int) -> array:
+        state_id = chunk.get_state_id_at(x, y, z)
+        if state_id is None:
+            self.logger.log(DEBUG_PROTOCOL, 'Block is not set')
+            return self.NO_BOXES
+        boxes, start, end = self.shapes.boxes, self.shapes.starts[state_id], self.shapes.ends[state_id]
+        if start == end:
+            return self.NO_BOXES
+        block_boxes = array('d', boxes[6 * start : 6 * end])
+        for i in range(0, len(block_boxes), 6):
+            block_boxes[i] += x
+            block_boxes[i + 1] += y
+            block_boxes[i + 2] += z
+            block_boxes[i + 3] += x
+            block_boxes[i + 4] += y
+            block_boxes[i + 5] += z
+        return block_boxes
+
+    def get_surrounding_boxes(self, world: World, query_bb: AABB) -> array:
+        """
+        Same boxes in the same order as PlayerPhysicsSimulation.get_surrounding_boxes.
+        """
+        chunks, cached_boxes = world.chunks, self.boxes
+        surrounding_boxes = array('d')
+        for y in range(math.floor(query_bb.min_y) - 1, math.floor(query_bb.max_y) + 1):
+            for z in range(math.floor(query_bb.min_z), math.floor(query_bb.max_z) + 1):
+                for x in range(math.floor(query_bb.min_x), math.floor(query_bb.max_x) + 1):
+                    chunk = chunks.get((x >> 4, z >> 4))
+                    if chunk is None:
+                        self.logger.log(DEBUG_PROTOCOL, 'Block is not set')
+                        continue
+                    chunk_boxes = cached_boxes.get(chunk)
+                    if chunk_boxes is None:
+                        chunk_boxes = cached_boxes[chunk] = {}
+                    key = (y << 8) | ((z & 15) << 4) | (x & 15)
+                    block_boxes = chunk_boxes.get(key)
+                    if block_boxes is None:
+                        block_boxes = chunk_boxes[key] = self.get_block_boxes(chunk, x, y, z)
+                    if block_boxes:
+                        surrounding_boxes += block_boxes
+        return surrounding_boxes
+
+    def get_block(self, world: World, x: int, y: int, z: int) -> Block | None:
+        """
+        Same block as World.get_block_at for the block coordinates. Blocks are shared, so they must not be modified.
+        """
+        chunk = world.chunks.get((x >> 4, z >> 4))
+        if chunk is None:
+            return None
+        chunk_blocks = self.blocks.get(chunk)
+        if chunk_blocks is None:
+            chunk_blocks = self.blocks[chunk] = {}
+        key = (y << 8) | ((z & 15) << 4) | (x & 15)
+        if key in chunk_blocks:
+            return chunk_blocks[key]
+        state_id = chunk.get_state_id_at(x, y, z)
+        block = chunk_blocks[key] = None if state_id is None else Block.from_state_id(state_id, Vector3(x, y, z))
+        return block
+
+
 class PlayerPhysicsSimulation:
     logger = get_logger('PlayerPhysicsSimulation')
+    world_cache: WorldCache | None = None
     GRAVITY = 0.08
     SLOW_FALLING = 0.125
     AIRDRAG = 0.9800000190734863  # math.fround(1 - 0.02)
@@ -203,8 +361,10 @@ class PlayerPhysicsSimulation:
         is_elytra_flying: bool,
         is_collided_horizontally: bool,
         is_collided_vertically: bool,
+        world_cache: WorldCache | None = None,
     ):
         self.world = world
+        self.world_cache = world_cache
         self.position = position
         self.velocity = velocity
         self.yaw = yaw
@@ -236,24 +396,50 @@ class PlayerPhysicsSimulation:
             position.z,
         )
 
-    def get_surrounding_bbs(self, query_bb: AABB):
-        surrounding_bbs = []
+    def get_surrounding_boxes(self, query_bb: AABB) -> array:
+        """
+        Collision boxes of the blocks around query_bb, looked up in the collision shape table by state id.
+        :param query_bb: Area to collect the boxes for
+        :return: Flat array of world space boxes, 6 values (min_x, min_y, min_z, max_x, max_y, max_z) per box
+        """
+        if self.world_cache is not None:
+            return self.world_cache.get_surrounding_boxes(self.world, query_bb)
+        shapes = get_collision_shapes()
+        boxes, starts, ends = shapes.boxes, shapes.starts, shapes.ends
+        get_state_id_at = self.world.get_state_id_at
+        surrounding_boxes = array('d')
 
         for y in range(math.floor(query_bb.min_y) - 1, math.floor(query_bb.max_y) + 1):
             for z in range(math.floor(query_bb.min_z), math.floor(query_bb.max_z) + 1):
                 for x in range(math.floor(query_bb.min_x), math.floor(query_bb.max_x) + 1):
-                    block = self.world.get_block_at(Vector3(x, y, z))
-                    if block is None:
+                    state_id = get_state_id_at(x, y, z)
+                    if state_id is None:
                         self.logger.log(DEBUG_PROTOCOL, 'Block is not set')
                         continue
-                    if block.position is None:
-                        self.logger.log(DEBUG_PROTOCOL, 'Block position is not set')
-                        continue
-                    for shape in block.get_shapes():
-                        surrounding_bbs.append(
-                            AABB(*shape).offset(block.position.x, block.position.y, block.position.z),
+                    for i in range(6 * starts[state_id], 6 * ends[state_id], 6):
+                        surrounding_boxes.extend(
+                            (
+                                boxes[i] + x,
+                                boxes[i + 1] + y,
+                                boxes[i + 2] + z,
+                                boxes[i + 3] + x,
+                                boxes[i + 4] + y,
+                                boxes[i + 5] + z,
+                            ),
                         )
-        return surrounding_bbs
+        return surrounding_boxes
+
+    def get_block(self, x: int, y: int, z: int) -> Block | None:
+        """
+        Block at the block coordinates, looked up through the world cache of the tick if there is one.
+        """
+        if self.world_cache is not None:
+            return self.world_cache.get_block(self.world, x, y, z)
+        return self.world.get_block_at(Vector3(x, y, z))
+
+    def get_surrounding_bbs(self, query_bb: AABB) -> list[AABB]:
+        boxes = self.get_surrounding_boxes(query_bb)
+        return [AABB(*boxes[i : i + 6]) for i in range(0, len(boxes), 6)]
 
     # -------- [START] WATER --------
 
@@ -263,7 +449,7 @@ class PlayerPhysicsSimulation:
             return -1
         if block.block_id in WATER_LIKE_BLOCK_IDS:
             return 0
-        if bool(block.get_state('waterlogged')):
+        if block.waterlogged:
             return 0
         if block.block_id != WATER_BLOCK_ID:
             return -1
@@ -280,11 +466,11 @@ class PlayerPhysicsSimulation:
         for y in range(math.floor(water_bb.min_y), math.floor(water_bb.max_y) + 1):
             for z in range(math.floor(water_bb.min_z), math.floor(water_bb.max_z) + 1):
                 for x in range(math.floor(water_bb.min_x), math.floor(water_bb.max_x) + 1):
-                    block = self.world.get_block_at(Vector3(x, y, z))
+                    block = self.get_block(x, y, z)
                     if block is not None and (
                         WATER_BLOCK_ID == block.block_id
                         or block.block_id in WATER_LIKE_BLOCK_IDS
-                        or bool(block.get_state('waterlogged'))
+                        or block.waterlogged
                     ):
                         water_level = y + 1 - self.get_liquid_height_percentage(block)
                         if math.ceil(water_bb.max_y) >= water_level:
@@ -296,14 +482,13 @@ class PlayerPhysicsSimulation:
         flow = Vector3(0, 0, 0)
         if block.position is None:
             raise ValueError('Block position is not set')
+        x, y, z = int(block.position.x), int(block.position.y), int(block.position.z)
         for dx, dz in [[0, 1], [-1, 0], [0, -1], [1, 0]]:
-            adjust_block = self.world.get_block_at(block.position.offset(dx, 0, dz))
+            adjust_block = self.get_block(x + dx, y, z + dz)
             adjust_level = self.get_rendered_depth(adjust_block)
             if adjust_level < 0:
                 if adjust_block is not None and adjust_block.bounding_box != 'empty':
-                    adjust_level = self.get_rendered_depth(
-                        self.world.get_block_at(block.position.offset(dx, -1, dz)),
-                    )
+                    adjust_level = self.get_rendered_depth(self.get_block(x + dx, y - 1, z + dz))
                     if adjust_level >= 0:
                         flow_multiplier = adjust_level - (current_level - 8)
                         flow.x += dx * flow_multiplier
@@ -316,8 +501,8 @@ class PlayerPhysicsSimulation:
         level = block.state_id - block.min_state_id
         if level >= 8:
             for dx, dz in [[0, 1], [-1, 0], [0, -1], [1, 0]]:
-                adjust_block = self.world.get_block_at(block.position.offset(dx, 0, dz))
-                adjust_above_block = self.world.get_block_at(block.position.offset(dx, 1, dz))
+                adjust_block = self.get_block(x + dx, y, z + dz)
+                adjust_above_block = self.get_block(x + dx, y + 1, z + dz)
                 if (adjust_block is not None and adjust_block.bounding_box != 'empty') or (
                     adjust_above_block is not None and adjust_above_block.bounding_box != 'empty'
                 ):
@@ -348,7 +533,7 @@ class PlayerPhysicsSimulation:
         for y in range(math.floor(lava_bb.min_y), math.floor(lava_bb.max_y) + 1):
             for z in range(math.floor(lava_bb.min_z), math.floor(lava_bb.max_z) + 1):
                 for x in range(math.floor(lava_bb.min_x), math.floor(lava_bb.max_x) + 1):
-                    block = self.world.get_block_at(Vector3(x, y, z))
+                    block = self.get_block(x, y, z)
                     if block is not None and block.block_id == LAVA_BLOCK_ID:
                         return True
         return False
@@ -380,19 +565,16 @@ class PlayerPhysicsSimulation:
         # TODO: Implement if sneaking and on_ground
         player_bb = self.get_player_bb(self.position)
         query_bb = player_bb.copy().extend(dx, dy, dz)
-        surrounding_bbs = self.get_surrounding_bbs(query_bb)
+        surrounding_boxes = self.get_surrounding_boxes(query_bb)
         old_player_bb = player_bb.copy()
 
-        for block_bb in surrounding_bbs:
-            dy = block_bb.get_offset_y(player_bb, dy)
+        dy = get_offset_y(surrounding_boxes, player_bb, dy)
         player_bb.offset(0, dy, 0)
 
-        for block_bb in surrounding_bbs:
-            dx = block_bb.get_offset_x(player_bb, dx)
+        dx = get_offset_x(surrounding_boxes, player_bb, dx)
         player_bb.offset(dx, 0, 0)
 
-        for block_bb in surrounding_bbs:
-            dz = block_bb.get_offset_z(player_bb, dz)
+        dz = get_offset_z(surrounding_boxes, player_bb, dz)
         player_bb.offset(0, 0, dz)
 
         if (
@@ -407,34 +589,24 @@ class PlayerPhysicsSimulation:
 
             dy = self.STEP_HEIGHT
             query_bb = old_player_bb.copy().extend(old_vel_x, dy, old_vel_z)
-            surrounding_bbs = self.get_surrounding_bbs(query_bb)
+            surrounding_boxes = self.get_surrounding_boxes(query_bb)
 
             bb1 = old_player_bb.copy()
             bb2 = old_player_bb.copy()
             bb_xz = bb1.copy().extend(dx, 0, dz)
 
-            dy1 = dy
-            dy2 = dy
-
-            for block_bb in surrounding_bbs:
-                dy1 = block_bb.get_offset_y(bb_xz, dy1)
-                dy2 = block_bb.get_offset_y(bb2, dy2)
+            dy1 = get_offset_y(surrounding_boxes, bb_xz, dy)
+            dy2 = get_offset_y(surrounding_boxes, bb2, dy)
             bb1.offset(0, dy1, 0)
             bb2.offset(0, dy2, 0)
 
-            dx1 = old_vel_x
-            dx2 = old_vel_x
-            for block_bb in surrounding_bbs:
-                dx1 = block_bb.get_offset_x(bb1, dx1)
-                dx2 = block_bb.get_offset_x(bb2, dx2)
+            dx1 = get_offset_x(surrounding_boxes, bb1, old_vel_x)
+            dx2 = get_offset_x(surrounding_boxes, bb2, old_vel_x)
             bb1.offset(dx1, 0, 0)
             bb2.offset(dx2, 0, 0)
 
-            dz1 = old_vel_z
-            dz2 = old_vel_z
-            for block_bb in surrounding_bbs:
-                dz1 = block_bb.get_offset_z(bb1, dz1)
-                dz2 = block_bb.get_offset_z(bb2, dz2)
+            dz1 = get_offset_z(surrounding_boxes, bb1, old_vel_z)
+            dz2 = get_offset_z(surrounding_boxes, bb2, old_vel_z)
             bb1.offset(0, 0, dz1)
             bb2.offset(0, 0, dz2)
 
@@ -452,8 +624,7 @@ class PlayerPhysicsSimulation:
                 dz = dz2
                 player_bb = bb2
 
-            for block_bb in surrounding_bbs:
-                dy = block_bb.get_offset_y(player_bb, dy)
+            dy = get_offset_y(surrounding_boxes, player_bb, dy)
             player_bb.offset(0, dy, 0)
 
             if old_vel_x_col**2 + old_vel_z_col**2 >= dx**2 + dz**2:
@@ -483,14 +654,14 @@ class PlayerPhysicsSimulation:
         for y in range(math.floor(player_bb.min_y), math.floor(player_bb.max_y) + 1):
             for z in range(math.floor(player_bb.min_z), math.floor(player_bb.max_z) + 1):
                 for x in range(math.floor(player_bb.min_x), math.floor(player_bb.max_x) + 1):
-                    block = self.world.get_block_at(Vector3(x, y, z))
+                    block = self.get_block(x, y, z)
                     if not block:
                         continue
                     if block.block_id == COB_WEB_ID:
                         self.is_in_web = True
                     if block.block_id == BUBBLE_COLUMN_ID:
                         down = not (block.state_id - block.min_state_id)
-                        above_block = self.world.get_block_at(Vector3(x, y + 1, z))
+                        above_block = self.get_block(x, y + 1, z)
                         bubble_drag = (
                             self.BUBBLE_COLUMN_SURFACE_DRAG
                             if above_block is not None and above_block.block_id == AIR_BLOCK_ID
@@ -521,7 +692,7 @@ class PlayerPhysicsSimulation:
     def does_not_collide(self, position: Vector3) -> bool:
         p_bb = self.get_player_bb(position)
         return (
-            not any(p_bb.intersects(x) for x in self.get_surrounding_bbs(p_bb))
+            not intersects_any(self.get_surrounding_boxes(p_bb), p_bb)
             and len(self.get_water_blocks(p_bb)) == 0
         )
 
@@ -615,6 +786,96 @@ class PlayerPhysicsSimulation:
         self.move_entity_with_heading(strafe, forward)
 
 
+class PhysicsScheduler:
+    """
+    Runs the physics of all bots of an event loop from a single timer.
+
+    Every tick the simulations of all registered bots are stepped one after another in the same loop, and only then
+    their positions are sent to the server. This avoids one timer task per bot waking up and awaiting its own socket
+    write in between simulations. Collision boxes and blocks are looked up through a WorldCache shared by all
+    simulations of the tick, so blocks around bots close to each other are looked up once.
+    """
+
+    logger = get_logger('PhysicsScheduler')
+    _schedulers: dict[asyncio.AbstractEventLoop, 'PhysicsScheduler'] = {}
+
+    def __init__(self, max_catchup_ticks: int = 4):
+        self.physics: weakref.WeakSet[Physics] = weakref.WeakSet()
+        self.time_accumulator = 0.0
+        self.max_catchup_ticks = max_catchup_ticks
+        self.last_frame_time = time_ms()
+        self.timer_task: asyncio.Task | None = None
+
+    @classmethod
+    def get(cls) -> 'PhysicsScheduler':
+        """
+        Get the scheduler of the running event loop, create it if needed.
+        """
+        loop = asyncio.get_running_loop()
+        scheduler = cls._schedulers.get(loop)
+        if scheduler is None:
+            scheduler = cls._schedulers[loop] = cls()
+        return scheduler
+
+    def register(self, physics: 'Physics') -> None:
+        self.physics.add(physics)
+        if self.timer_task is None:
+            self.last_frame_time = time_ms()
+            self.time_accumulator = 0.0
+            self.timer_task = asyncio.create_task(self.timer())
+
+    def unregister(self, physics: 'Physics') -> None:
+        self.physics.discard(physics)
+        if not self.physics and self.timer_task is not None:
+            self.timer_task.cancel()
+            self.timer_task = None
+            for loop, scheduler in list(self._schedulers.items()):
+                if scheduler is self:
+                    del self._schedulers[loop]
+
+    def step(self) -> list[tuple['Physics', PositionRequest]]:
+        """
+        Simulate one tick of all registered bots.
+        :return: Position packets of the simulated bots
+        """
+        positions = []
+        world_cache = WorldCache()
+        for physics in list(self.physics):
+            if not physics.use_physics:
+                continue
+            try:
+                position = physics.step(world_cache)
+            except Exception as e:
+                self.logger.error(f'Error in physics of {physics.bot.username}: {e}')
+                continue
+            if position is not None:
+                positions.append((physics, position))
+        return positions
+
+    async def tick(self) -> None:
+        # Packets are only buffered, writing them fails in the flush task of the client which logs the error
+        for physics, position in self.step():
+            await physics.client.send_packet(position)
+
+    async def timer(self):
+        while True:
+            try:
+                now = time_ms()
+                delta_seconds = (now - self.last_frame_time) / 1000
+                self.last_frame_time = now
+                self.time_accumulator += delta_seconds
+                catchup_ticks = 0
+                while self.time_accumulator >= Physics.PHYSICS_TIME_STEP:
+                    await self.tick()
+                    self.time_accumulator -= Physics.PHYSICS_TIME_STEP
+                    catchup_ticks += 1
+                    if catchup_ticks >= self.max_catchup_ticks:
+                        break
+                await asyncio.sleep(Physics.PHYSICS_INTERVAL_MS / 1000)
+            except Exception as e:
+                self.logger.error(f'Error in physics timer: {e}')
+
+
 class Physics(InteractionModule):
     logger = get_logger('Physics')
     PHYSICS_INTERVAL_MS = 50
@@ -624,11 +885,7 @@ class Physics(InteractionModule):
         self.client = client
         self.bot = bot
         self.use_physics = False
-        self.time_accumulator = 0
-        self.catchup_ticks = 0
-        self.max_catchup_ticks = 4
-        self.last_frame_time = time_ms()
-        self.timer_task: asyncio.Task | None = None
+        self.scheduler: PhysicsScheduler | None = None
 
         self.jump_ticks = 0
         self.is_in_web = False
@@ -637,16 +894,33 @@ class Physics(InteractionModule):
         self.is_collided_vertically = False
 
     def __del__(self):
-        if self.timer_task is not None:
-            self.timer_task.cancel()
+        self.stop()
+
+    def stop(self) -> None:
+        """
+        Stop simulating the bot, e.g. after it's disconnected.
+        """
+        if self.scheduler is not None:
+            self.scheduler.unregister(self)
+            self.scheduler = None
 
     async def on_tick(self, now: int):
+        position = self.step()
+        if position is not None:
+            await self.client.send_packet(position)
+
+    def step(self, world_cache: WorldCache | None = None) -> PositionRequest | None:
+        """
+        Simulate one tick and update the bot entity.
+        :param world_cache: World lookups shared with the other bots simulated in this tick
+        :return: Position packet to send or None if the bot wasn't simulated
+        """
         if self.bot.entity is None:
             self.logger.log(DEBUG_PROTOCOL, 'Player entity is not set')
-            return
+            return None
         if self.bot.world.get_block_at(self.bot.entity.position) is None:
             self.logger.log(DEBUG_PROTOCOL, 'Waiting for chunk to load')
-            return
+            return None
         simulation = PlayerPhysicsSimulation(
             world=self.bot.world,
             position=self.bot.entity.position.copy(),
@@ -660,9 +934,11 @@ class Physics(InteractionModule):
             is_elytra_flying=self.is_elytra_flying,
             is_collided_horizontally=self.is_collided_horizontally,
             is_collided_vertically=self.is_collided_vertically,
+            world_cache=world_cache,
         )
         simulation.simulate()
         self.bot.entity.position = simulation.position
+        self.bot.entities.index.update(self.bot.entity)
         self.bot.entity.velocity = simulation.velocity
         self.bot.entity.yaw = simulation.yaw
         self.bot.entity.pitch = simulation.pitch
@@ -672,41 +948,20 @@ class Physics(InteractionModule):
         self.is_elytra_flying = simulation.is_elytra_flying
         self.is_collided_horizontally = simulation.is_collided_horizontally
         self.is_collided_vertically = simulation.is_collided_vertically
-        await self.client.send_packet(
-            PositionRequest(
-                x=Double(simulation.position.x),
-                y=Double(simulation.position.y),
-                z=Double(simulation.position.z),
-                on_ground=Boolean(simulation.on_ground),
-            ),
-        )
         # self.logger.log(DEBUG_GAME_EVENTS, f'Physics moved player to {simulation.position=}')
-
-    async def timer(self):
-        while True:
-            try:
-                now = time_ms()
-                delta_seconds = (now - self.last_frame_time) / 1000
-                self.last_frame_time = now
-                self.time_accumulator += delta_seconds
-                self.catchup_ticks = 0
-                while self.time_accumulator >= self.PHYSICS_TIME_STEP:
-                    if self.use_physics:
-                        await self.on_tick(now)
-                    self.time_accumulator -= self.PHYSICS_TIME_STEP
-                    self.catchup_ticks += 1
-                    if self.catchup_ticks >= self.max_catchup_ticks:
-                        break
-                await asyncio.sleep(self.PHYSICS_INTERVAL_MS / 1000)
-            except Exception as e:
-                self.logger.error(f'Error in physics timer: {e}')
+        return PositionRequest(
+            x=Double(simulation.position.x),
+            y=Double(simulation.position.y),
+            z=Double(simulation.position.z),
+            on_ground=Boolean(simulation.on_ground),
+        )
 
     @EventDispatcher.subscribe(LoginResponse)
     async def _start_playing(self, data: LoginResponse):
         self.use_physics = False
-        if self.timer_task is None:
-            self.last_frame_time = time_ms()
-            self.timer_task = asyncio.create_task(self.timer())
+        if self.scheduler is None:
+            self.scheduler = PhysicsScheduler.get()
+            self.scheduler.register(self)
 
     @EventDispatcher.subscribe(PositionResponse)
     async def _synchronize_player_position(self, data: PositionResponse):
@@ -0,0 +1,351 @@
+import json
+import mmap
+import os
+from array import array
+from collections.abc import Sequence
+from pathlib import Path
+from struct import Struct
+from struct import error as StructError
+from typing import Any
+
+from minemind.protocols.utils import get_logger
+from minemind.protocols.v765 import constants
+from minemind.protocols.v765.world import (
+    BlockStateInfo,
+    BlockType,
+    CollisionShapes,
+    get_block_state_info,
+    get_block_type,
+    load_collision_shapes,
+)
+
+REGISTRY_MAGIC = b'MMREG\x00v1'
+REGISTRY_PATH = constants.CACHE_DIR / 'registry.bin'
+REGISTRY_SOURCES = ('blocks.json', 'blockCollisionShapes.json', 'items.json', 'biomes.json')
+SECTION_ALIGNMENT = 8
+NO_BLOCK = 0xFFFF
+NO_STRING = 0xFFFFFFFF
+
+_HEADER = Struct('<8sI')  # Magic, JSON header size
+_ITEM = Struct('<III')  # Name, display name, stack size
+_ENTITY = Struct('<IIIIdd')  # Name, display name, type, category, width, height
+_BIOME = Struct('<IIIIId?')  # Name, display name, category, dimension, color, temperature, has precipitation
+
+logger = get_logger('Registry')
+
+
+def align(offset: int) -> int:
+    return -(-offset // SECTION_ALIGNMENT) * SECTION_ALIGNMENT
+
+
+class StringTable:
+    """
+    Strings stored back to back as UTF-8, string `i` spans `offsets[i]` up to `offsets[i + 1]`.
+    """
+
+    def __init__(self, offsets: memoryview, data: memoryview):
+        self.offsets = offsets
+        self.data = data
+
+    def __getitem__(self, index: int) -> str:
+        return str(self.data[self.offsets[index] : self.offsets[index + 1]], 'utf-8')
+
+
+class RegistryBlockStates(Sequence):
+    """
+    Block states indexed by state id, built from the registry tables when a state is seen for the first time.
+
+    A process only keeps the states of blocks it came across, instead of the whole block state table.
+    """
+
+    def __init__(self, registry: 'Registry'):
+        self.registry = registry
+        self._states: list[BlockStateInfo | None] = [None] * len(registry.state_blocks)
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def __getitem__(self, state_id: int) -> BlockStateInfo | None:  # type: ignore[override]
+        info = self._states[state_id]
+        if info is None:
+            block_id = self.registry.state_blocks[state_id]
+            if block_id == NO_BLOCK:
+                return None
+            info = self._states[state_id] = get_block_state_info(
+                self.registry.get_block_type(block_id),
+                state_id,
+                self.registry.get_state_shapes(state_id),
+            )
+        return info
+
+
+class Registry:
+    """
+    Game data compiled into fixed-layout tables of a single file, memory-mapped read-only.
+
+    Processes mapping the same file share its pages through the OS page cache, so bots running in separate processes
+    don't each keep a copy of the block, collision shape, item, entity and biome tables.
+    """
+
+    def __init__(self, path: Path):
+        with open(path, 'rb') as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._mmap)
+        magic, header_size = _HEADER.unpack_from(view)
+        if magic != REGISTRY_MAGIC:
+            raise ValueError(f'{path} is not a registry file')
+        header_end = _HEADER.size + header_size
+        header = json.loads(bytes(view[_HEADER.size : header_end]))
+        self.key: list[Any] = header['key']
+        start = align(header_end)
+        sections = {}
+        for name, (offset, size, format) in header['sections'].items():
+            if start + offset + size > len(view):
+                raise ValueError(f'{path} is truncated')
+            sections[name] = view[start + offset : start + offset + size].cast(format)
+        self.state_blocks: memoryview = sections['state_blocks']
+        self.blocks: memoryview = sections['blocks']
+        self.items: memoryview = sections['items']
+        self.entities: memoryview = sections['entities']
+        self.biomes: memoryview = sections['biomes']
+        self.strings = StringTable(sections['string_offsets'], sections['strings'])
+        self.collision_shapes = CollisionShapes(
+            boxes=sections['boxes'],
+            starts=sections['shape_starts'],
+            ends=sections['shape_ends'],
+        )
+        self.block_states = RegistryBlockStates(self)
+        self._block_types: dict[int, BlockType] = {}
+
+    def get_block_type(self, block_id: int) -> BlockType:
+        block_type = self._block_types.get(block_id)
+        if block_type is None:
+            block = json.loads(self.strings[self.blocks[block_id]])
+            block_type = self._block_types[block_id] = get_block_type(block)
+        return block_type
+
+    def get_state_shapes(self, state_id: int) -> list[list[float]]:
+        boxes = self.collision_shapes.boxes
+        return [
+            boxes[6 * box : 6 * box + 6].tolist()
+            for box in range(self.collision_shapes.starts[state_id], self.collision_shapes.ends[state_id])
+        ]
+
+    def get_item(self, item_id: int) -> dict[str, Any] | None:
+        if not 0 <= item_id < len(self.items) // _ITEM.size:
+            return None
+        name, display_name, stack_size = _ITEM.unpack_from(self.items, item_id * _ITEM.size)
+        if name == NO_STRING:
+            return None
+        return {'name': self.strings[name], 'displayName': self.strings[display_name], 'stackSize': stack_size}
+
+    def get_entity(self, entity_type_id: int) -> dict[str, Any] | None:
+        if not 0 <= entity_type_id < len(self.entities) // _ENTITY.size:
+            return None
+        name, display_name, kind, category, width, height = _ENTITY.unpack_from(
+            self.entities,
+            entity_type_id * _ENTITY.size,
+        )
+        if name == NO_STRING:
+            return None
+        return {
+            'name': self.strings[name],
+            'displayName': self.strings[display_name],
+            'width': width,
+            'height': height,
+            'type': self.strings[kind],
+            'category': self.strings[category],
+        }
+
+    @property
+    def biome_count(self) -> int:
+        return len(self.biomes) // _BIOME.size
+
+    def get_biome(self, biome_id: int) -> dict[str, Any] | None:
+        if not 0 <= biome_id < self.biome_count:
+            return None
+        name, display_name, category, dimension, color, temperature, has_precipitation = _BIOME.unpack_from(
+            self.biomes,
+            biome_id * _BIOME.size,
+        )
+        if name == NO_STRING:
+            return None
+        return {
+            'id': biome_id,
+            'name': self.strings[name],
+            'category': self.strings[category],
+            'temperature': temperature,
+            'has_precipitation': has_precipitation,
+            'dimension': self.strings[dimension],
+            'displayName': self.strings[display_name],
+            'color': color,
+        }
+
+
+def get_registry_key() -> list[Any]:
+    # Entities are defined in constants.py, so it invalidates the registry like the game data files do
+    stat = os.stat(constants.__file__)
+    key = [*constants.get_cache_key(REGISTRY_SOURCES), stat.st_mtime_ns, stat.st_size]
+    return json.loads(json.dumps(key))
+
+
+def compile_registry(path: Path = REGISTRY_PATH) -> None:
+    """
+    Compile the game data into a registry file.
+
+    The file is replaced atomically, processes that mapped the previous file keep reading it.
+    """
+    key = get_registry_key()
+    strings: dict[str, int] = {}
+    string_data = bytearray()
+    string_offsets = array('I', [0])
+
+    def add_string(value: str) -> int:
+        index = strings.get(value)
+        if index is None:
+            index = strings[value] = len(string_offsets) - 1
+            string_data.extend(value.encode('utf-8'))
+            string_offsets.append(len(string_data))
+        return index
+
+    blocks = constants.BLOCKS
+    state_blocks = array('H', [NO_BLOCK]) * (max(block['maxStateId'] for block in blocks) + 1)
+    block_data = array('I', [NO_STRING]) * (max(block['id'] for block in blocks) + 1)
+    for block in blocks:
+        # Block types are only decoded for blocks a process comes across, so they are kept as JSON
+        block_data[block['id']] = add_string(json.dumps(block, separators=(',', ':')))
+        for state_id in range(block['minStateId'], block['maxStateId'] + 1):
+            state_blocks[state_id] = block['id']
+
+    item_data = bytearray(_ITEM.pack(NO_STRING, 0, 0) * (max(map(int, constants.ITEMS)) + 1))
+    for item_id, item in constants.ITEMS.items():
+        _ITEM.pack_into(
+            item_data,
+            int(item_id) * _ITEM.size,
+            add_string(item['name']),
+            add_string(item['displayName']),
+            item['stackSize'],
+        )
+
+    entity_data = bytearray(_ENTITY.pack(NO_STRING, 0, 0, 0, 0, 0) * (max(constants.ENTITIES) + 1))
+    for entity_type_id, entity in constants.ENTITIES.items():
+        _ENTITY.pack_into(
+            entity_data,
+            entity_type_id * _ENTITY.size,
+            add_string(entity['name']),
+            add_string(entity['displayName']),
+            add_string(entity['type']),
+            add_string(entity['category']),
+            entity['width'],
+            entity['height'],
+        )
+
+    biome_count = max(biome['id'] for biome in constants.BIOMES) + 1
+    biome_data = bytearray(_BIOME.pack(NO_STRING, 0, 0, 0, 0, 0, False) * biome_count)
+    for biome in constants.BIOMES:
+        _BIOME.pack_into(
+            biome_data,
+            biome['id'] * _BIOME.size,
+            add_string(biome['name']),
+            add_string(biome['displayName']),
+            add_string(biome['category']),
+            add_string(biome['dimension']),
+            biome['color'],
+            biome['temperature'],
+            biome['has_precipitation'],
+        )
+
+    shapes = load_collision_shapes()
+    sections: dict[str, tuple[bytes, str]] = {
+        'state_blocks': (state_blocks.tobytes(), 'H'),
+        'blocks': (block_data.tobytes(), 'I'),
+        'items': (bytes(item_data), 'B'),
+        'entities': (bytes(entity_data), 'B'),
+        'biomes': (bytes(biome_data), 'B'),
+        'boxes': (shapes.boxes.tobytes(), 'd'),
+        'shape_starts': (shapes.starts.tobytes(), 'I'),
+        'shape_ends': (shapes.ends.tobytes(), 'I'),
+        'string_offsets': (string_offsets.tobytes(), 'I'),
+        'strings': (bytes(string_data), 'B'),
+    }
+
+    # Section offsets are relative to the end of the header, so they don't depend on the header size
+    layout: dict[str, tuple[int, int, str]] = {}
+    offset = 0
+    for name, (data, format) in sections.items():
+        layout[name] = (offset, len(data), format)
+        offset = align(offset + len(data))
+    header = json.dumps({'key': key, 'sections': layout}).encode('utf-8')
+    header_end = _HEADER.size + len(header)
+
+    temporary_path = path.with_name(f'{path.name}.{os.getpid()}')
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        with open(temporary_path, 'wb') as file:
+            file.write(_HEADER.pack(REGISTRY_MAGIC, len(header)))
+            file.write(header)
+            file.write(bytes(align(header_end) - header_end))
+            for data, _ in sections.values():
+                file.write(data)
+                file.write(bytes(align(len(data)) - len(data)))
+        os.replace(temporary_path, path)
+    except OSError:
+        temporary_path.unlink(missing_ok=True)
+        raise
+
+
+def open_registry(path: Path = REGISTRY_PATH) -> Registry:
+    """
+    Map the registry file, compiling it first if it is missing, unreadable or the game data changed.
+    """
+    key = get_registry_key()
+    try:
+        registry = Registry(path)
+        if registry.key == key:
+            return registry
+    except (OSError, ValueError, KeyError, TypeError, StructError):  # Truncated file or a registry of another layout
+        pass
+    compile_registry(path)
+    return Registry(path)
+
+
+def use_shared_registry(path: Path = REGISTRY_PATH) -> Registry | None:
+    """
+    Read block, collision shape, item, entity and biome lookups of this process from the shared registry.
+
+    Call it in the parent process before starting bot processes, so the registry is compiled only once. The game data
+    is used as before if the registry can't be written, e.g. when the cache directory is read-only.
+    """
+    if constants.shared_registry is None:
+        try:
+            constants.shared_registry = open_registry(path)
+        except OSError as e:
+            logger.warning(f'Shared registry is not available: {e}')
+    return constants.shared_registry
+
+
+def get_item(item_id: int) -> dict[str, Any] | None:
+    registry = constants.shared_registry
+    if registry is not None:
+        return registry.get_item(item_id)
+    return constants.ITEMS.get(str(item_id))
+
+
+def get_entity(entity_type_id: int) -> dict[str, Any] | None:
+    registry = constants.shared_registry
+    if registry is not None:
+        return registry.get_entity(entity_type_id)
+    return constants.ENTITIES.get(entity_type_id)
+
+
+def get_biome(biome_id: int) -> dict[str, Any] | None:
+    registry = constants.shared_registry
+    if registry is not None:
+        return registry.get_biome(biome_id)
+    return next((biome for biome in constants.BIOMES if biome['id'] == biome_id), None)
+
+
+if __name__ == '__main__':
+    # Precompile the registry, e.g. when building a container image
+    compile_registry()
+    print(f'Registry written to {REGISTRY_PATH}')
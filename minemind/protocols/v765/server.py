@@ -17,6 +17,6 @@ class Server(InteractionModule):
         await handshake(self.client, HandshakingNextState.STATUS)
         await self.client.send_packet(PingStartRequest())
 
-        packet_id, raw_data = await self.client.unpack_packet(self.client.reader)
+        packet_id, raw_data = await self.client.unpack_packet()
 
-        return await ServerInfoResponse.from_stream(raw_data)
+        return ServerInfoResponse.decode(raw_data)[0]
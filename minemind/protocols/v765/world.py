@@ -1,22 +1,36 @@
+import asyncio
 import functools
+import hashlib
 import math
+import sys
 import time
+from array import array
+from concurrent.futures import Executor
 from enum import Enum
-from typing import NamedTuple
+from typing import Any, Callable, NamedTuple, Sequence
 
 from minemind import DEBUG_PROTOCOL
 from minemind.client import Client
 from minemind.dispatcher import EventDispatcher
-from minemind.mc_types import Array, Float, Long, Short, UByte, UInt, VarInt
-from minemind.mc_types.base import AsyncBytesIO, MCType, SocketReader, Vector3
+from minemind.mc_types import Array, Float, Short, UByte, VarInt
+from minemind.mc_types.array import BitSet
+from minemind.mc_types.base import Buffer, MCType, SocketReader, Vector3
 from minemind.protocols.base import InteractionModule
 from minemind.protocols.utils import get_logger
-from minemind.protocols.v765.constants import BIOMES, BLOCK_COLLISION_SHAPES, BLOCKS, DIMENSIONS
+from minemind.protocols.v765 import constants
+from minemind.protocols.v765.constants import (
+    AIR_LIKE_BLOCK_IDS,
+    DIMENSIONS,
+    LAVA_BLOCK_ID,
+    WATER_BLOCK_ID,
+    WATER_LIKE_BLOCK_IDS,
+)
 from minemind.protocols.v765.inbound.play import (
     BlockEntityDataResponse,
     ChunkBatchFinishedResponse,
     ChunkBatchStartResponse,
     ChunkDataAndLightResponse,
+    LengthPrefixedByteArray,
     LoginResponse,
     RespawnResponse,
     UnloadChunkResponse,
@@ -26,11 +40,34 @@ from minemind.protocols.v765.inbound.play import (
 from minemind.protocols.v765.outbound.play import ChunkBatchReceivedRequest
 
 
+@functools.lru_cache
+def _byte_translation_tables(bits_per_entry: int) -> tuple[bytes, ...]:
+    # i-th table maps a byte to its i-th entry of `bits_per_entry` bits
+    mask = (1 << bits_per_entry) - 1
+    return tuple(bytes((value >> shift) & mask for value in range(256)) for shift in range(0, 8, bits_per_entry))
+
+
+class GameDataConstant:
+    """
+    Class attribute computed on first access, so importing the module doesn't load the game data it depends on.
+    """
+
+    def __init__(self, compute: Callable[[Any], Any]):
+        self.compute = compute
+
+    def __set_name__(self, owner: type, name: str):
+        self.name = name
+
+    def __get__(self, instance: Any, owner: type) -> Any:
+        value = self.compute(owner)
+        setattr(owner, self.name, value)  # Replaces the descriptor
+        return value
+
+
 class PalettedContainer(MCType):
-    MAX_BITS_PER_BLOCK = int(
-        functools.reduce(lambda high, block: max(high, block["maxStateId"]), BLOCKS, 0),
-    ).bit_length()
-    MAX_BITS_PER_BIOME = len(BIOMES).bit_length()
+    # Highest state id, the block state table is read from the shared registry instead of the blocks game data
+    MAX_BITS_PER_BLOCK = GameDataConstant(lambda cls: (len(get_block_state_table()) - 1).bit_length())
+    MAX_BITS_PER_BIOME = GameDataConstant(lambda cls: get_biome_count().bit_length())
 
     MAX_INDIRECT_PALETTED_BPE_FOR_BLOCK = 8
     MAX_INDIRECT_PALETTED_BPE_FOR_BIOME = 3
@@ -38,11 +75,11 @@ class PalettedContainer(MCType):
     BLOCK_SECTION_VOLUME = 16 * 16 * 16  # SECTION_HEIGHT * SECTION_WIDTH * SECTION_WIDTH
     BIOME_SECTION_VOLUME = int(BLOCK_SECTION_VOLUME / (4 * 4 * 4))
 
-    VALUES_PER_LONG_PER_BLOCK = math.floor(64 / MAX_BITS_PER_BLOCK)
-    VALUES_PER_LONG_PER_BIOME = math.floor(64 / MAX_BITS_PER_BIOME)
+    VALUES_PER_LONG_PER_BLOCK = GameDataConstant(lambda cls: math.floor(64 / cls.MAX_BITS_PER_BLOCK))
+    VALUES_PER_LONG_PER_BIOME = GameDataConstant(lambda cls: math.floor(64 / cls.MAX_BITS_PER_BIOME))
 
-    VALUE_MASK_FOR_BLOCK = (1 << MAX_BITS_PER_BLOCK) - 1
-    VALUE_MASK_FOR_BIOME = (1 << MAX_BITS_PER_BIOME) - 1
+    VALUE_MASK_FOR_BLOCK = GameDataConstant(lambda cls: (1 << cls.MAX_BITS_PER_BLOCK) - 1)
+    VALUE_MASK_FOR_BIOME = GameDataConstant(lambda cls: (1 << cls.MAX_BITS_PER_BIOME) - 1)
 
     class PaletteType(str, Enum):
         SINGLE_VALUED = 'single_valued'
@@ -58,20 +95,38 @@ class PalettedContainer(MCType):
         palette_type: 'PalettedContainer.PaletteType',
         palette_category: 'PalettedContainer.PaletteCategory',
         bits_per_entry: int,
-        palette: Array[Long | VarInt] | None = None,
-        bitset_mask: dict[int, int] | None = None,
+        palette: array | None = None,
+        data: array | None = None,
+        longs: array | None = None,
     ):
-        if bitset_mask is None:
-            bitset_mask = {}
+        """
+        :param palette: State ids of the palette, array('q') as decoded by `VarInt.decode_many`.
+        :param data: Unpacked entries, one per block (or biome) of the section.
+            Palette indices for an indirect palette, state ids for a direct one, empty for a single valued one.
+        :param longs: Packed data array as received from the server, unpacked into `data` on first access.
+        """
+        if data is None and longs is None:
+            data = array('H')
         if palette is None:
-            palette = Array()
+            palette = array('q')
         self.palette_type = palette_type
         self.palette_category = palette_category
         self.bits_per_entry = bits_per_entry
         self.palette = palette
-        self.bitset_mask = bitset_mask
-        self.values_per_long = math.floor(64 / bits_per_entry) if bits_per_entry != 0 else 0
-        self.value_mask = (1 << bits_per_entry) - 1 if bits_per_entry != 0 else 0
+        self.longs = longs
+        self._data = data
+
+    @property
+    def data(self) -> array:
+        if self._data is None:
+            self._data = self.unpack_entries(self.longs, self.bits_per_entry, self.volume)  # type: ignore[arg-type]
+            self.longs = None
+        return self._data
+
+    @data.setter
+    def data(self, value: array):
+        self._data = value
+        self.longs = None
 
     @property
     def max_bits_per_entry(self) -> int:
@@ -79,78 +134,105 @@ class PalettedContainer(MCType):
             return self.MAX_BITS_PER_BLOCK
         return self.MAX_BITS_PER_BIOME
 
+    @property
+    def volume(self) -> int:
+        if self.palette_category == self.PaletteCategory.BLOCK:
+            return self.BLOCK_SECTION_VOLUME
+        return self.BIOME_SECTION_VOLUME
+
     def set_masked_value(self, block_index: int, palette_index: int):
-        if self.palette_type == self.PaletteType.DIRECT:
-            self.bitset_mask[block_index] = palette_index
-            return
-        start_long_index = math.floor(block_index / self.values_per_long)
-        index_in_long = (block_index - start_long_index * self.values_per_long) * self.bits_per_entry
-        if index_in_long >= 32:
-            index_in_start_long = index_in_long - 32
-            self.bitset_mask[start_long_index * 2 + 1] = (
-                (self.bitset_mask[start_long_index * 2 + 1] & ~(self.value_mask << index_in_start_long))
-                | ((palette_index & self.value_mask) << index_in_start_long)
-            ) >> 0
-            return
-        index_in_start_long = index_in_long
-        self.bitset_mask[start_long_index * 2] = (
-            (self.bitset_mask[start_long_index * 2] & ~(self.value_mask << index_in_start_long))
-            | ((palette_index & self.value_mask) << index_in_start_long)
-        ) >> 0
-        bit_offset_end = index_in_start_long + self.bits_per_entry
-        if bit_offset_end > 32:
-            self.bitset_mask[start_long_index * 2 + 1] = (
-                (self.bitset_mask[start_long_index * 2 + 1] & ~((1 << (bit_offset_end - 32)) - 1))
-                | (palette_index >> (32 - index_in_start_long))
-            ) >> 0
-
-    def get_unmasked_palette_index(self, index: int):
-        start_long_index = math.floor(index / self.values_per_long)
-        index_in_long = (index - start_long_index * self.values_per_long) * self.bits_per_entry
-        if index_in_long >= 32:
-            index_in_start_long = index_in_long - 32
-            start_long = self.bitset_mask[start_long_index * 2 + 1]
-            return (start_long >> index_in_start_long) & self.value_mask
-        start_long = self.bitset_mask[start_long_index * 2]
-        index_in_start_long = index_in_long
-        result = start_long >> index_in_start_long
-        bit_offset_end = index_in_start_long + self.bits_per_entry
-        if bit_offset_end > 32:
-            end_long = self.bitset_mask[start_long_index * 2 + 1]
-            result |= end_long << (32 - index_in_start_long)
-        return result & self.value_mask
+        if self.palette_type == self.PaletteType.SINGLE_VALUED:
+            # Every entry points to the only palette value until a different one is set
+            self.data = array('H', bytes(2 * self.volume))
+            self.palette_type = self.PaletteType.INDIRECT
+        self.data[block_index] = palette_index
 
     def get_state_id(self, index: int) -> int | None:
         try:
             if self.palette_type == self.PaletteType.SINGLE_VALUED:
-                return self.palette[0].int
+                return self.palette[0]
             if self.palette_type == self.PaletteType.DIRECT:
-                return self.bitset_mask[index]
-            return self.palette[self.get_unmasked_palette_index(index)].int
+                return self.data[index]
+            return self.palette[self.data[index]]
         except IndexError:
             return None
 
+    def get_state_ids(self) -> array:
+        """
+        Resolves the state ids of all entries of the section at once.
+
+        :return: State ids in block index order, `(y << 8) | (z << 4) | x`.
+        """
+        if self.palette_type == self.PaletteType.SINGLE_VALUED:
+            return array('I', [self.palette[0]]) * self.volume
+        if self.palette_type == self.PaletteType.DIRECT:
+            return array('I', self.data)
+        return array('I', map(self.palette.__getitem__, self.data))
+
     def convert_to_direct_palette(self) -> 'PalettedContainer':
         if self.palette_type == self.PaletteType.DIRECT:
             return self
-        new_bitset_mask = {}
-        for i in self.bitset_mask:
-            new_bitset_mask[i] = self.get_unmasked_palette_index(i)
-
-        self.palette = Array()
-        self.bitset_mask = new_bitset_mask
+        self.data = array('H', self.get_state_ids())
+        self.palette = array('q')
         self.palette_type = self.PaletteType.DIRECT
         return self
 
     @classmethod
-    async def read_bitset_mask(cls, reader: SocketReader) -> dict[int, int]:
-        bitset_len = (await VarInt.from_stream(reader)).int * 2
-        bitset_mask = {}
+    def unpack_entries(cls, longs: array, bits_per_entry: int, volume: int) -> array:
+        """
+        Unpacks `volume` entries of `bits_per_entry` bits from the packed data array.
 
-        for i in range(0, bitset_len, 2):
-            bitset_mask[i + 1] = (await UInt.from_stream(reader)).int
-            bitset_mask[i] = (await UInt.from_stream(reader)).int
-        return bitset_mask
+        Entries don't span across longs and are packed starting from the least significant bits. Entries that divide
+        a byte are extracted from the bytes of all longs at once with translation tables. Otherwise every distinct
+        long is unpacked once, which is cheap for real terrain where the same longs repeat a lot.
+        """
+        if 8 % bits_per_entry == 0:
+            if sys.byteorder == 'big':
+                longs = array('Q', longs)
+                longs.byteswap()
+            raw = longs.tobytes()  # Least significant byte first, i.e. in entry order
+            values_per_byte = 8 // bits_per_entry
+            unpacked = bytearray(len(raw) * values_per_byte)
+            for i, table in enumerate(_byte_translation_tables(bits_per_entry)):
+                unpacked[i::values_per_byte] = raw.translate(table)
+            # Widen to uint16 by placing every entry into the low byte of a zeroed buffer
+            wide = bytearray(2 * volume)
+            wide[0 if sys.byteorder == 'little' else 1 :: 2] = unpacked[:volume]
+            entries = array('H')
+            entries.frombytes(wide)
+            return entries
+
+        mask = (1 << bits_per_entry) - 1
+        shifts = range(0, 64 // bits_per_entry * bits_per_entry, bits_per_entry)
+        unpacked_longs: dict[int, list[int]] = {}
+        entries: list[int] = []
+        for value in longs:
+            values = unpacked_longs.get(value)
+            if values is None:
+                values = unpacked_longs[value] = [(value >> shift) & mask for shift in shifts]
+            entries.extend(values)
+        return array('H' if bits_per_entry <= 16 else 'I', entries[:volume])
+
+    @classmethod
+    def read_longs(cls, data: Buffer) -> array:
+        longs = array('Q')
+        longs.frombytes(data)
+        if sys.byteorder == 'little':
+            longs.byteswap()
+        return longs
+
+    @classmethod
+    async def read_data_array(cls, reader: SocketReader) -> array:
+        length = (await VarInt.from_stream(reader)).int
+        return cls.read_longs(await reader.read(length * 8))
+
+    @classmethod
+    def decode_data_array(cls, buffer: Buffer, offset: int) -> tuple[array, int]:
+        length, offset = VarInt.decode(buffer, offset)
+        end = offset + length.int * 8
+        if end > len(buffer):
+            raise IndexError('Data array is out of buffer bounds')
+        return cls.read_longs(buffer[offset:end]), end
 
     @classmethod
     async def from_stream(cls, reader: SocketReader, **kwargs):
@@ -169,7 +251,7 @@ class PalettedContainer(MCType):
                 cls.PaletteType.SINGLE_VALUED,
                 palette_category,
                 bits_per_entry,
-                Array([single_value]),
+                array('q', [single_value.int]),
             )
 
         if bits_per_entry > max_indirect_paletted_bpe:
@@ -177,7 +259,7 @@ class PalettedContainer(MCType):
                 cls.PaletteType.DIRECT,
                 palette_category,
                 bits_per_entry,
-                bitset_mask=await cls.read_bitset_mask(reader),
+                longs=await cls.read_data_array(reader),
             )
 
         palette_length = await VarInt.from_stream(reader)
@@ -186,111 +268,345 @@ class PalettedContainer(MCType):
             cls.PaletteType.INDIRECT,
             palette_category,
             bits_per_entry,
-            pallete,
-            await cls.read_bitset_mask(reader),
+            array('q', [value.int for value in pallete]),
+            longs=await cls.read_data_array(reader),
+        )
+
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0, **kwargs) -> tuple['PalettedContainer', int]:
+        palette_category = kwargs.get('palette_category', cls.PaletteCategory.BLOCK)
+        max_indirect_paletted_bpe = (
+            cls.MAX_INDIRECT_PALETTED_BPE_FOR_BLOCK
+            if palette_category == cls.PaletteCategory.BLOCK
+            else cls.MAX_INDIRECT_PALETTED_BPE_FOR_BIOME
         )
+        bits_per_entry = buffer[offset]
+        offset += 1
+
+        if bits_per_entry == 0:
+            single_value, offset = VarInt.decode(buffer, offset)
+            offset += 1  # Empty data array length
+            return (
+                cls(cls.PaletteType.SINGLE_VALUED, palette_category, bits_per_entry, array('q', [single_value.int])),
+                offset,
+            )
+
+        if bits_per_entry > max_indirect_paletted_bpe:
+            longs, offset = cls.decode_data_array(buffer, offset)
+            return cls(cls.PaletteType.DIRECT, palette_category, bits_per_entry, longs=longs), offset
+
+        palette_length, offset = VarInt.decode(buffer, offset)
+        pallete, offset = VarInt.decode_many(buffer, palette_length.int, offset)
+        longs, offset = cls.decode_data_array(buffer, offset)
+        return cls(cls.PaletteType.INDIRECT, palette_category, bits_per_entry, pallete, longs=longs), offset
+
+
+BlockState = NamedTuple('BlockState', [('name', str), ('type', str), ('num_values', int), ('values', list[str])])
+
+
+class BlockType(NamedTuple):
+    """
+    Properties shared by all states of a block.
+    """
+
+    block_id: int
+    name: str
+    display_name: str
+    hardness: float | None
+    resistance: float
+    stack_size: int
+    diggable: bool
+    material: str
+    transparent: bool
+    emit_light: int
+    filter_light: int
+    default_state: int
+    min_state_id: int
+    max_state_id: int
+    states: tuple[BlockState, ...]
+    drops: tuple[int, ...]
+    harvest_tools: tuple[str, ...]
+    bounding_box: str
+
+
+class BlockStateInfo(NamedTuple):
+    """
+    Flyweight describing a single state id, shared by every block in the world with that state.
+    """
+
+    state_id: int
+    block_type: BlockType
+    properties: dict[str, str | int | bool]
+    waterlogged: bool
+    level: int | None
+    shapes: list[list[float]]
+
+
+def get_state_properties(block_type: BlockType, state_id: int) -> dict[str, str | int | bool]:
+    """
+    Decodes property values of a state. The last property changes the fastest with the state id.
+    """
+    values: list[str | int | bool] = []
+    index = state_id - block_type.min_state_id
+    for state in reversed(block_type.states):
+        index, value_index = divmod(index, state.num_values)
+        if state.type == 'bool':
+            values.append(value_index == 0)  # Values go in (true, false) order
+        elif state.type == 'int':
+            values.append(int(state.values[value_index]))
+        else:
+            values.append(state.values[value_index])
+    return {state.name: value for state, value in zip(block_type.states, reversed(values))}
+
+
+def get_state_shapes(block_type: BlockType, state_id: int) -> list[list[float]]:
+    collision_shapes = constants.BLOCK_COLLISION_SHAPES
+    shape_ids = collision_shapes['blocks'].get(block_type.name)
+    if shape_ids is None:
+        # if no shapes are present for this block (for example, some chemistry stuff we don't have BBs for), assume it's stone
+        return collision_shapes['shapes'][str(collision_shapes['blocks']['stone'])]
+    if not isinstance(shape_ids, list):
+        return collision_shapes['shapes'][str(shape_ids)]
+    return collision_shapes['shapes'][str(shape_ids[state_id - block_type.min_state_id])]
+
+
+@functools.lru_cache
+def get_block_states() -> list[BlockStateInfo | None]:
+    """
+    Dense table of all block states indexed by state id, built once and loaded from the game data cache afterwards.
+    """
+    return constants.load_cached('block_states', ('blocks.json', 'blockCollisionShapes.json'), build_block_states)
+
+
+def get_block_state_table() -> Sequence[BlockStateInfo | None]:
+    """
+    Block states indexed by state id, read from the shared registry if the process uses one.
+    """
+    registry = constants.shared_registry
+    if registry is not None:
+        return registry.block_states
+    return get_block_states()
+
+
+def get_block_type(block: dict[str, Any]) -> BlockType:
+    """
+    Build a block type from its entry in the blocks game data.
+    """
+    return BlockType(
+        block_id=block['id'],
+        name=block['name'],
+        display_name=block['displayName'],
+        hardness=block['hardness'],
+        resistance=block['resistance'],
+        stack_size=block['stackSize'],
+        diggable=block['diggable'],
+        material=block['material'],
+        transparent=block['transparent'],
+        emit_light=block['emitLight'],
+        filter_light=block['filterLight'],
+        default_state=block['defaultState'],
+        min_state_id=block['minStateId'],
+        max_state_id=block['maxStateId'],
+        states=tuple(
+            BlockState(
+                name=state['name'],
+                type=state['type'],
+                num_values=state['num_values'],
+                values=state.get('values', []),
+            )
+            for state in block['states']
+        ),
+        drops=tuple(block['drops']),
+        harvest_tools=tuple(block.get('harvestTools', {}).keys()),
+        bounding_box=block['boundingBox'],
+    )
+
+
+def get_block_state_info(block_type: BlockType, state_id: int, shapes: list[list[float]]) -> BlockStateInfo:
+    properties = get_state_properties(block_type, state_id)
+    level = properties.get('level')
+    return BlockStateInfo(
+        state_id=state_id,
+        block_type=block_type,
+        properties=properties,
+        waterlogged=properties.get('waterlogged') is True,
+        level=level if isinstance(level, int) else None,
+        shapes=shapes,
+    )
+
+
+def build_block_states() -> list[BlockStateInfo | None]:
+    blocks = constants.BLOCKS
+    block_states: list[BlockStateInfo | None] = [None] * (max(block['maxStateId'] for block in blocks) + 1)
+    for block in blocks:
+        block_type = get_block_type(block)
+        for state_id in range(block_type.min_state_id, block_type.max_state_id + 1):
+            block_states[state_id] = get_block_state_info(
+                block_type,
+                state_id,
+                get_state_shapes(block_type, state_id),
+            )
+    return block_states
+
+
+class CollisionShapes(NamedTuple):
+    """
+    Collision boxes of all block states in flat arrays.
+
+    Box `i` is `boxes[6 * i : 6 * i + 6]` as (min_x, min_y, min_z, max_x, max_y, max_z) relative to the block position.
+    Boxes of state `s` are the boxes `starts[s]` up to `ends[s]`, states with the same shape share their boxes.
+    """
+
+    boxes: array | memoryview
+    starts: array | memoryview
+    ends: array | memoryview
+
+
+def get_collision_shapes() -> CollisionShapes:
+    """
+    Collision shape table indexed by state id, read from the shared registry if the process uses one.
+    """
+    registry = constants.shared_registry
+    if registry is not None:
+        return registry.collision_shapes
+    return load_collision_shapes()
+
+
+def get_biome_count() -> int:
+    """
+    Number of biome ids, read from the shared registry if the process uses one.
+    """
+    registry = constants.shared_registry
+    if registry is not None:
+        return registry.biome_count
+    return len(constants.BIOMES)
+
+
+@functools.lru_cache
+def load_collision_shapes() -> CollisionShapes:
+    """
+    Collision shape table built once and loaded from the game data cache afterwards.
+
+    The cached table is much smaller than the block states, so physics doesn't need to load them.
+    """
+    return constants.load_cached(
+        'collision_shapes',
+        ('blocks.json', 'blockCollisionShapes.json'),
+        build_collision_shapes,
+    )
+
+
+def build_collision_shapes() -> CollisionShapes:
+    block_states = get_block_states()
+    boxes = array('d')
+    starts = array('I', bytes(4 * len(block_states)))
+    ends = array('I', bytes(4 * len(block_states)))
+    shape_ranges: dict[tuple[float, ...], tuple[int, int]] = {}
+    for state_id, info in enumerate(block_states):
+        if info is None or not info.shapes:
+            continue
+        shape = tuple(value for box in info.shapes for value in box)
+        box_range = shape_ranges.get(shape)
+        if box_range is None:
+            start = len(boxes) // 6
+            boxes.extend(shape)
+            box_range = shape_ranges[shape] = (start, len(boxes) // 6)
+        starts[state_id], ends[state_id] = box_range
+    return CollisionShapes(boxes=boxes, starts=starts, ends=ends)
+
+
+# Heightmaps kept for chunks, with the flag of blocks that count for them
+HEIGHTMAPS = {'WORLD_SURFACE': 1, 'MOTION_BLOCKING': 2}
+UNKNOWN_HEIGHT = -0x8000
+
+
+@functools.lru_cache
+def get_heightmap_flags() -> bytes:
+    """
+    Heightmap flags of all block states indexed by state id, built once and loaded from the game data cache afterwards.
+    """
+    return constants.load_cached(
+        'heightmap_flags',
+        ('blocks.json', 'blockCollisionShapes.json'),
+        build_heightmap_flags,
+    )
+
+
+def build_heightmap_flags() -> bytes:
+    block_states = get_block_states()
+    flags = bytearray(len(block_states))
+    for state_id, info in enumerate(block_states):
+        if info is None or info.block_type.block_id in AIR_LIKE_BLOCK_IDS:
+            continue
+        block_id = info.block_type.block_id
+        has_fluid = info.waterlogged or block_id in (WATER_BLOCK_ID, LAVA_BLOCK_ID) or block_id in WATER_LIKE_BLOCK_IDS
+        flags[state_id] = HEIGHTMAPS['WORLD_SURFACE']
+        if info.shapes or has_fluid:
+            flags[state_id] |= HEIGHTMAPS['MOTION_BLOCKING']
+    return bytes(flags)
 
 
 class Block:
-    BlockState = NamedTuple('BlockState', [('name', str), ('type', str), ('num_values', int), ('values', list[str])])
+    """
+    Block at a position.
 
-    def __init__(
-        self,
-        state_id: int,
-        block_id: int,
-        name: str,
-        display_name: str,
-        hardness: float,
-        resistance: float,
-        stack_size: int,
-        diggable: bool,
-        material: str,
-        transparent: bool,
-        emit_light: int,
-        filter_light: int,
-        default_state: int,
-        min_state_id: int,
-        max_state_id: int,
-        states: list['Block.BlockState'],
-        drops: list[int],
-        harvest_tools: list[str],
-        bounding_box: str,
-    ):
-        self.state_id = state_id
-        self.block_id = block_id
-        self.name = name
-        self.display_name = display_name
-        self.hardness = hardness
-        self.resistance = resistance
-        self.stack_size = stack_size
-        self.diggable = diggable
-        self.material = material
-        self.transparent = transparent
-        self.emit_light = emit_light
-        self.filter_light = filter_light
-        self.default_state = default_state
-        self.min_state_id = min_state_id
-        self.max_state_id = max_state_id
-        self.states = states
-        self.drops = drops
-        self.harvest_tools = harvest_tools
-        self.bounding_box = bounding_box
-        self.position: Vector3 | None = None
-
-    def get_shapes(self) -> list[list[int]]:
-        shape_ids = BLOCK_COLLISION_SHAPES['blocks'].get(self.name)
-        if shape_ids is None:
-            # if no shapes are present for this block (for example, some chemistry stuff we don't have BBs for), assume it's stone
-            return BLOCK_COLLISION_SHAPES['shapes'][str(BLOCK_COLLISION_SHAPES['blocks']['stone'])]
-        if not isinstance(shape_ids, list):
-            return BLOCK_COLLISION_SHAPES['shapes'][str(shape_ids)]
-
-        shape_id = self.state_id - self.min_state_id
-        return BLOCK_COLLISION_SHAPES['shapes'][str(shape_ids[shape_id])]
+    Only pairs a position with the shared `BlockStateInfo` of its state, block type properties
+    (`block_id`, `name`, `bounding_box`, ...) are read through to the `BlockType`.
+    """
+
+    BlockState = BlockState
+
+    __slots__ = ('info', 'position')
+
+    def __init__(self, info: BlockStateInfo, position: Vector3 | None = None):
+        self.info = info
+        self.position = position
+
+    def __getattr__(self, name: str):
+        # Only called for attributes that are not defined on the block itself
+        return getattr(self.info.block_type, name)
+
+    @property
+    def state_id(self) -> int:
+        return self.info.state_id
+
+    @property
+    def block_type(self) -> BlockType:
+        return self.info.block_type
+
+    @property
+    def properties(self) -> dict[str, str | int | bool]:
+        return self.info.properties
+
+    @property
+    def waterlogged(self) -> bool:
+        return self.info.waterlogged
+
+    @property
+    def level(self) -> int | None:
+        return self.info.level
+
+    def get_shapes(self) -> list[list[float]]:
+        return self.info.shapes
 
     @classmethod
-    def from_state_id(cls, state_id: int) -> 'Block | None':
-        for block in BLOCKS:
-            if block['minStateId'] <= state_id <= block['maxStateId']:
-                states = []
-                for state in block['states']:
-                    values = state.get('values', [])
-                    states.append(
-                        cls.BlockState(
-                            name=state['name'],
-                            type=state['type'],
-                            num_values=state['num_values'],
-                            values=values,
-                        ),
-                    )
-                return cls(
-                    state_id=state_id,
-                    block_id=block['id'],
-                    name=block['name'],
-                    display_name=block['displayName'],
-                    hardness=block['hardness'],
-                    resistance=block['resistance'],
-                    stack_size=block['stackSize'],
-                    diggable=block['diggable'],
-                    material=block['material'],
-                    transparent=block['transparent'],
-                    emit_light=block['emitLight'],
-                    filter_light=block['filterLight'],
-                    default_state=block['defaultState'],
-                    min_state_id=block['minStateId'],
-                    max_state_id=block['maxStateId'],
-                    states=states,
-                    drops=block['drops'],
-                    harvest_tools=block.get('harvestTools', {}).keys(),
-                    bounding_box=block['boundingBox'],
-                )
-        return None
+    def from_state_id(cls, state_id: int, position: Vector3 | None = None) -> 'Block | None':
+        block_states = get_block_state_table()
+        if not 0 <= state_id < len(block_states):
+            return None
+        info = block_states[state_id]
+        if info is None:
+            return None
+        return cls(info, position)
 
     def __repr__(self):
         return f'<Block {self.name} {self.state_id=}>'
 
     def get_state(self, name: str) -> BlockState | None:
-        return next(iter([state for state in self.states if state.name == name]), None)
+        return next(iter([state for state in self.info.block_type.states if state.name == name]), None)
+
+    def get_property(self, name: str) -> str | int | bool | None:
+        return self.info.properties.get(name)
 
 
 class ChunkSection(MCType):
@@ -313,6 +629,88 @@ class ChunkSection(MCType):
         )
         return cls(solid_block_count.int, block_states, biomes)
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0, **kwargs) -> tuple['ChunkSection', int]:
+        solid_block_count, offset = Short.decode(buffer, offset)
+        block_states, offset = PalettedContainer.decode(
+            buffer,
+            offset,
+            palette_category=PalettedContainer.PaletteCategory.BLOCK,
+        )
+        biomes, offset = PalettedContainer.decode(
+            buffer,
+            offset,
+            palette_category=PalettedContainer.PaletteCategory.BIOME,
+        )
+        return cls(solid_block_count.int, block_states, biomes), offset
+
+
+def decode_chunk_sections(data: Buffer, section_count: int, unpack: bool = False) -> Array[ChunkSection]:
+    """
+    Decode sections of chunk data. Defined on module level, so it can be run in a process pool.
+    :param data: Raw chunk data
+    :param section_count: Number of sections in the world height
+    :param unpack: Unpack the entries of the sections right away instead of on first access, e.g. in an executor so
+        the first block lookups of the chunk don't unpack them on the event loop
+    :return: Chunk sections
+    """
+    sections, _ = Array[ChunkSection].decode(data, length=section_count, mc_type=ChunkSection)
+    if unpack:
+        for section in sections:
+            section.block_states.data
+            section.biomes.data
+    return sections
+
+
+LIGHT_SECTION_SIZE = 2048  # 4096 light levels packed in nibbles
+EMPTY_LIGHT = bytes(LIGHT_SECTION_SIZE)
+FULL_LIGHT = b'\xff' * LIGHT_SECTION_SIZE
+_LOW_NIBBLES = bytes(value & 0xF for value in range(256))
+_HIGH_NIBBLES = bytes(value >> 4 for value in range(256))
+
+
+class LightLevel(NamedTuple):
+    sky: int
+    block: int
+
+
+def decode_light(
+    section_count: int,
+    mask: BitSet,
+    empty_mask: BitSet,
+    arrays: Array[LengthPrefixedByteArray],
+) -> list[bytes | None]:
+    """
+    Assign received light arrays to sections. Empty and fully lit sections share the same object.
+    :param section_count: Number of light sections, one more below and above the world than chunk sections
+    :param mask: Sections which have a light array
+    :param empty_mask: Sections without any light
+    :param arrays: Light arrays in the order of the set bits of `mask`
+    :return: Nibble packed light levels of each section, None if the server didn't send them
+    """
+    light: list[bytes | None] = [None] * section_count
+    received = iter(arrays)
+    for index in range(section_count):
+        if mask.is_set(index):
+            data = next(received).data
+            if len(data) != LIGHT_SECTION_SIZE:
+                continue
+            light[index] = FULL_LIGHT if data == FULL_LIGHT else EMPTY_LIGHT if data == EMPTY_LIGHT else data
+        elif empty_mask.is_set(index):
+            light[index] = EMPTY_LIGHT
+    return light
+
+
+def unpack_light(data: bytes | None) -> array:
+    """
+    Unpack nibble packed light levels of a section, one byte per block in block index order.
+    """
+    levels = array('B', bytes(2 * LIGHT_SECTION_SIZE))
+    if data is not None and data is not EMPTY_LIGHT:
+        levels[0::2] = array('B', data.translate(_LOW_NIBBLES))
+        levels[1::2] = array('B', data.translate(_HIGH_NIBBLES))
+    return levels
+
 
 class Chunk:
     logger = get_logger('Chunk')
@@ -323,13 +721,102 @@ class Chunk:
         self.chunk_x = chunk_x
         self.chunk_z = chunk_z
         self.chunk_sections: Array[ChunkSection] = Array()
+        # Light sections start one section below min_y
+        self.sky_light: list[bytes | None] = []
+        self.block_light: list[bytes | None] = []
+        # Y of the first block above the highest block that counts for the heightmap, indexed by (z << 4) | x
+        self.heightmaps: dict[str, array] = {}
 
-    async def set_chunk_sections(self, raw_chunk_sections: bytes):
-        reader = AsyncBytesIO(raw_chunk_sections)
-        self.chunk_sections = await Array[ChunkSection].from_stream(
-            reader,
-            length=self.chunk_section_count,
-            mc_type=ChunkSection,
+    def set_chunk_sections(self, raw_chunk_sections: Buffer):
+        self.chunk_sections = decode_chunk_sections(raw_chunk_sections, self.chunk_section_count)
+
+    def set_light(self, data: ChunkDataAndLightResponse):
+        section_count = self.chunk_section_count + 2
+        self.sky_light = decode_light(section_count, data.sky_light_mask, data.empty_sky_light_mask, data.sky_light)
+        self.block_light = decode_light(
+            section_count,
+            data.block_light_mask,
+            data.empty_block_light_mask,
+            data.block_light,
+        )
+
+    def release_light(self):
+        self.sky_light = []
+        self.block_light = []
+
+    def set_heightmaps(self, data: ChunkDataAndLightResponse):
+        """
+        Unpack heightmaps sent with the chunk. The server sends heights relative to the bottom of the world.
+        """
+        heightmaps = data.heightmaps or {}
+        bits_per_entry = (self.chunk_section_count << 4).bit_length()
+        self.heightmaps = {}
+        for name in HEIGHTMAPS:
+            longs = heightmaps.get(name)
+            if longs is None:
+                continue
+            heights = PalettedContainer.unpack_entries(longs, bits_per_entry, 256)
+            if len(heights) == 256:
+                self.heightmaps[name] = array('h', [self.min_y + height for height in heights])
+
+    def update_heightmaps(self, x: int, y: int, z: int, state_id: int):
+        """
+        Update heightmaps for a block change. Only removing the highest block of a column looks at the blocks below it.
+        """
+        flags = get_heightmap_flags()
+        index = ((z & 15) << 4) | (x & 15)
+        state_flags = flags[state_id] if 0 <= state_id < len(flags) else 0
+        for name, flag in HEIGHTMAPS.items():
+            heights = self.heightmaps.get(name)
+            if heights is None:
+                continue
+            if state_flags & flag:
+                if y >= heights[index]:
+                    heights[index] = y + 1
+                continue
+            if y != heights[index] - 1:
+                continue
+            below = y - 1
+            while below >= self.min_y:
+                below_state_id = self.get_state_id_at(x, below, z)
+                if below_state_id is not None and below_state_id < len(flags) and flags[below_state_id] & flag:
+                    break
+                below -= 1
+            heights[index] = below + 1
+
+    def get_surface_y(self, x: int, z: int, heightmap: str = 'MOTION_BLOCKING') -> int | None:
+        """
+        Get the Y of the first block above the highest block of the column that counts for the heightmap.
+        :param x: Block x, only the position inside the chunk is used
+        :param z: Block z, only the position inside the chunk is used
+        :param heightmap: WORLD_SURFACE counts all blocks except air, MOTION_BLOCKING only solid blocks and fluids
+        :return: Surface Y or None if the server didn't send the heightmap
+        """
+        heights = self.heightmaps.get(heightmap)
+        if heights is None:
+            return None
+        return heights[((z & 15) << 4) | (x & 15)]
+
+    def get_light_at(self, x: int, y: int, z: int) -> LightLevel | None:
+        """
+        Get sky and block light at the given block coordinates.
+        :param x: Block x, only the position inside the chunk is used
+        :param y: Block y
+        :param z: Block z, only the position inside the chunk is used
+        :return: Light levels or None if the server didn't send light for the section
+        """
+        section_index = ((y - self.min_y) >> 4) + 1
+        if not 0 <= section_index < len(self.sky_light):
+            return None
+        sky_light = self.sky_light[section_index]
+        block_light = self.block_light[section_index]
+        if sky_light is None or block_light is None:
+            return None
+        block_index = (((y - self.min_y) & 0xF) << 8) | ((z & 15) << 4) | (x & 15)
+        shift = (block_index & 1) << 2
+        return LightLevel(
+            (sky_light[block_index >> 1] >> shift) & 0xF,
+            (block_light[block_index >> 1] >> shift) & 0xF,
         )
 
     @classmethod
@@ -352,6 +839,14 @@ class Chunk:
             )
             return
 
+        if self.heightmaps:
+            self.update_heightmaps(
+                int(position_in_chunk.x),
+                int(position_in_chunk.y),
+                int(position_in_chunk.z),
+                state_id,
+            )
+
         section_y = (int(position_in_chunk.y) - self.min_y) & 0xF
         block_index = (section_y << 8) | (int(position_in_chunk.z) << 4) | int(position_in_chunk.x)
         if old_block is not None and old_block.state_id == 0 and state_id != 0:
@@ -359,50 +854,131 @@ class Chunk:
         elif old_block is not None and old_block.state_id != 0 and state_id == 0:
             section.solid_block_count -= 1
 
+        if section.block_states.palette_type == PalettedContainer.PaletteType.DIRECT:
+            section.block_states.set_masked_value(block_index, state_id)
+            return
+
         palette = section.block_states.palette
-        palette_index = next(iter([idx for idx, palette in enumerate(palette) if palette.int == state_id]), None)
+        palette_index = palette.index(state_id) if state_id in palette else None
         if palette_index is None:
             self.logger.log(DEBUG_PROTOCOL, f'State ID {state_id} not found in the palette. Adding it')
             palette_index = len(palette)
-            palette.append(VarInt(state_id))
+            palette.append(state_id)
             new_palette_index = len(palette) - 1
             bits_per_entry = new_palette_index.bit_length()
             if (
                 bits_per_entry > section.block_states.bits_per_entry
                 and bits_per_entry > section.block_states.max_bits_per_entry
             ):
-                section.block_states.convert_to_direct_palette().set_masked_value(block_index, new_palette_index)
+                section.block_states.convert_to_direct_palette().set_masked_value(block_index, state_id)
                 return
         section.block_states.set_masked_value(block_index, palette_index)
 
-    def get_block_at(self, position: Vector3) -> Block | None:
-        chunk_section_position = self.get_position_in_chunk(position)
-        chunk_section_index = (int(chunk_section_position.y) - self.min_y) >> 4
-        try:
-            section: ChunkSection = self.chunk_sections[chunk_section_index]
-        except IndexError:
+    def get_state_id_at(self, x: int, y: int, z: int) -> int | None:
+        """
+        Get the block state id at the given block coordinates without creating a Block.
+        :param x: Block x, only the position inside the chunk is used
+        :param y: Block y
+        :param z: Block z, only the position inside the chunk is used
+        :return: State id or None if the position is outside the loaded sections
+        """
+        section_index = (y - self.min_y) >> 4
+        if not 0 <= section_index < len(self.chunk_sections):
             return None
+        section: ChunkSection = self.chunk_sections[section_index]
+        block_index = (((y - self.min_y) & 0xF) << 8) | ((z & 15) << 4) | (x & 15)
+        return section.block_states.get_state_id(block_index)
 
-        section_y = (int(chunk_section_position.y) - self.min_y) & 0xF
-        block_index = (section_y << 8) | (int(chunk_section_position.z) << 4) | int(chunk_section_position.x)
-        block_state_id = section.block_states.get_state_id(block_index)
+    def get_block_at(self, position: Vector3) -> Block | None:
+        block_position = position.floored()
+        block_state_id = self.get_state_id_at(int(block_position.x), int(block_position.y), int(block_position.z))
 
         if block_state_id is None:
             return None
 
-        # # TODO: Stupid way to get block at position, need to refactor this
-        block = Block.from_state_id(block_state_id)
-        if block is None:
-            return None
-        block.position = position.floored()
-        return block
+        return Block.from_state_id(block_state_id, block_position)
+
+
+class ChunkStore:
+    """
+    Chunks shared between the worlds of bots connected to the same server.
+
+    Chunks are keyed by dimension and chunk position and counted by the number of worlds which loaded them, a chunk is
+    dropped when the last world unloads it. Chunk data identical to the data the shared chunk was decoded from isn't
+    decoded again, and block updates received by any bot are applied to the shared chunk.
+    """
+
+    logger = get_logger('ChunkStore')
+
+    def __init__(self):
+        self.chunks: dict[tuple[str, int, int], Chunk] = {}
+        self.references: dict[tuple[str, int, int], int] = {}
+        self.digests: dict[tuple[str, int, int], bytes] = {}
+
+    def __len__(self) -> int:
+        return len(self.chunks)
+
+    def is_current(self, dimension: str, chunk_x: int, chunk_z: int, data: Buffer) -> bool:
+        """
+        Check if the shared chunk was decoded from the same data, so it doesn't need to be decoded again.
+        """
+        return self.digests.get((dimension, chunk_x, chunk_z)) == hashlib.blake2b(data, digest_size=16).digest()
+
+    def load(
+        self,
+        dimension: str,
+        chunk_x: int,
+        chunk_z: int,
+        min_y: int,
+        world_height: int,
+        data: Buffer,
+        acquire: bool = True,
+        sections: Array[ChunkSection] | None = None,
+    ) -> Chunk:
+        """
+        Get the shared chunk for received chunk data, decoding it only if it differs from the shared copy.
+        :param acquire: Count a new reference, False if the world already holds this chunk
+        :param sections: Sections already decoded from the data
+        :return: Shared chunk
+        """
+        key = (dimension, chunk_x, chunk_z)
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        chunk = self.chunks.get(key)
+        if chunk is None or self.digests.get(key) != digest:
+            if chunk is None:
+                chunk = self.chunks[key] = Chunk(min_y, world_height, chunk_x, chunk_z)
+            if sections is None:
+                chunk.set_chunk_sections(data)
+            else:
+                chunk.chunk_sections = sections
+            self.digests[key] = digest
+        else:
+            self.logger.log(DEBUG_PROTOCOL, f'Reusing shared chunk x={chunk_x} z={chunk_z} in {dimension}')
+        if acquire:
+            self.references[key] = self.references.get(key, 0) + 1
+        return chunk
+
+    def release(self, dimension: str, chunk_x: int, chunk_z: int) -> None:
+        key = (dimension, chunk_x, chunk_z)
+        references = self.references.get(key, 0) - 1
+        if references > 0:
+            self.references[key] = references
+            return
+        self.references.pop(key, None)
+        chunk = self.chunks.pop(key, None)
+        if chunk is not None:
+            chunk.release_light()
+        self.digests.pop(key, None)
 
 
 class World(InteractionModule):
     logger = get_logger('World')
 
-    def __init__(self, client: Client):
+    def __init__(self, client: Client, chunk_store: ChunkStore | None = None, executor: Executor | None = None):
         self.client = client
+        self.chunk_store = chunk_store
+        self.executor = executor
+        self.pending_decodes: set[asyncio.Future[Array[ChunkSection]]] = set()
 
         self.chunk_batch_start_time = time.time()
         self.weighted_average = 2.0
@@ -420,13 +996,126 @@ class World(InteractionModule):
             return None
         return chunk.get_block_at(position)
 
+    def get_state_id_at(self, x: int, y: int, z: int) -> int | None:
+        chunk = self.chunks.get((x >> 4, z >> 4))
+        if chunk is None:
+            return None
+        return chunk.get_state_id_at(x, y, z)
+
+    def get_light_at(self, x: int, y: int, z: int) -> LightLevel | None:
+        chunk = self.chunks.get((x >> 4, z >> 4))
+        if chunk is None:
+            return None
+        return chunk.get_light_at(x, y, z)
+
+    def get_light_region(self, x1: int, y1: int, z1: int, x2: int, y2: int, z2: int, sky: bool = False) -> array:
+        """
+        Get light levels of all blocks in the box between two corners, both corners included.
+
+        The light of every section in the box is unpacked once and copied row by row, instead of looking up each block.
+        :param sky: Return sky light instead of block light
+        :return: array('B') of light levels in y, z, x order, 0 where no light is loaded
+        """
+        x1, x2 = min(x1, x2), max(x1, x2)
+        y1, y2 = min(y1, y2), max(y1, y2)
+        z1, z2 = min(z1, z2), max(z1, z2)
+        size_x, size_z = x2 - x1 + 1, z2 - z1 + 1
+        levels = array('B', bytes(size_x * (y2 - y1 + 1) * size_z))
+        for chunk_x in range(x1 >> 4, (x2 >> 4) + 1):
+            start_x, end_x = max(x1, chunk_x << 4), min(x2, (chunk_x << 4) + 15) + 1
+            width = end_x - start_x
+            for chunk_z in range(z1 >> 4, (z2 >> 4) + 1):
+                chunk = self.chunks.get((chunk_x, chunk_z))
+                if chunk is None:
+                    continue
+                light = chunk.sky_light if sky else chunk.block_light
+                start_z, end_z = max(z1, chunk_z << 4), min(z2, (chunk_z << 4) + 15) + 1
+                section_index, section = None, None
+                for y in range(y1, y2 + 1):
+                    index = ((y - chunk.min_y) >> 4) + 1
+                    if index != section_index:
+                        section_index = index
+                        data = light[index] if 0 <= index < len(light) else None
+                        section = None if data is None or data is EMPTY_LIGHT else unpack_light(data)
+                    if section is None:
+                        continue
+                    row = ((y - chunk.min_y) & 0xF) << 8
+                    for z in range(start_z, end_z):
+                        source = row | ((z & 15) << 4) | (start_x & 15)
+                        target = ((y - y1) * size_z + z - z1) * size_x + start_x - x1
+                        levels[target : target + width] = section[source : source + width]
+        return levels
+
+    def get_surface_y(self, x: int, z: int, heightmap: str = 'MOTION_BLOCKING') -> int | None:
+        chunk = self.chunks.get((x >> 4, z >> 4))
+        if chunk is None:
+            return None
+        return chunk.get_surface_y(x, z, heightmap)
+
+    def get_heightmap_region(self, x1: int, z1: int, x2: int, z2: int, heightmap: str = 'MOTION_BLOCKING') -> array:
+        """
+        Get surface heights of all columns in the area between two corners, both corners included.
+
+        Heights are copied from the chunk heightmaps row by row, instead of searching each column for its top block.
+        :return: array('h') of surface Y in z, x order, UNKNOWN_HEIGHT where the heightmap isn't loaded
+        """
+        x1, x2 = min(x1, x2), max(x1, x2)
+        z1, z2 = min(z1, z2), max(z1, z2)
+        size_x = x2 - x1 + 1
+        heights = array('h', [UNKNOWN_HEIGHT]) * (size_x * (z2 - z1 + 1))
+        for chunk_x in range(x1 >> 4, (x2 >> 4) + 1):
+            start_x, end_x = max(x1, chunk_x << 4), min(x2, (chunk_x << 4) + 15) + 1
+            width = end_x - start_x
+            for chunk_z in range(z1 >> 4, (z2 >> 4) + 1):
+                chunk = self.chunks.get((chunk_x, chunk_z))
+                chunk_heights = None if chunk is None else chunk.heightmaps.get(heightmap)
+                if chunk_heights is None:
+                    continue
+                for z in range(max(z1, chunk_z << 4), min(z2, (chunk_z << 4) + 15) + 1):
+                    source = ((z & 15) << 4) | (start_x & 15)
+                    target = (z - z1) * size_x + start_x - x1
+                    heights[target : target + width] = chunk_heights[source : source + width]
+        return heights
+
     def get_chunk_at(self, x: float, z: float) -> Chunk | None:
         chunk_key = math.floor(x / 16), math.floor(z / 16)
         return self.chunks.get(chunk_key)
 
+    async def decode_chunk_sections(self, data: Buffer) -> Array[ChunkSection]:
+        """
+        Decode chunk sections in the executor, so the event loop isn't blocked. Without executor decode them in place.
+        """
+        section_count = self.height >> 4
+        if self.executor is None:
+            return decode_chunk_sections(data, section_count)
+        future = asyncio.get_running_loop().run_in_executor(
+            self.executor,
+            decode_chunk_sections,
+            bytes(data),
+            section_count,
+            True,
+        )
+        self.pending_decodes.add(future)
+        try:
+            return await future
+        finally:
+            self.pending_decodes.discard(future)
+
+    def release_chunks(self) -> None:
+        """
+        Unload all chunks, shared chunks are dropped from the store if no other world uses them.
+        """
+        if self.chunk_store is not None:
+            for chunk_x, chunk_z in self.chunks:
+                self.chunk_store.release(self.dimension, chunk_x, chunk_z)
+        self.chunks.clear()
+
     @EventDispatcher.subscribe(LoginResponse, RespawnResponse)
     async def set_world_parameters(self, event: LoginResponse | RespawnResponse):
-        self.dimension = event.dimension_type.str.split(':')[1]
+        dimension = event.dimension_type.str.split(':')[1]
+        if self.chunk_store is not None and dimension != self.dimension:
+            self.release_chunks()
+        self.dimension = dimension
         self.min_y = int(DIMENSIONS[self.dimension]['minY'])  # type: ignore[call-overload]
         self.height = int(DIMENSIONS[self.dimension]['height'])  # type: ignore[call-overload]
         self.logger.log(
@@ -440,6 +1129,8 @@ class World(InteractionModule):
 
     @EventDispatcher.subscribe(ChunkBatchFinishedResponse)
     async def on_chunk_batch_finish(self, data: ChunkBatchFinishedResponse):
+        if self.pending_decodes:  # The batch is received once its chunks are decoded
+            await asyncio.gather(*self.pending_decodes, return_exceptions=True)
         ms_per_chunk = (time.time() - self.chunk_batch_start_time) * 1000 / data.batch_size.int
         clamped_ms_per_chunk = min(max(ms_per_chunk, self.weighted_average / 3.0), self.weighted_average * 3.0)
         self.weighted_average = ((self.weighted_average * self.old_sample_weight) + clamped_ms_per_chunk) / (
@@ -456,20 +1147,36 @@ class World(InteractionModule):
             f'Chunk data and light received. Chunk position: x={data.chunk_x} z={data.chunk_z}',
         )
         chunk_key = (data.chunk_x.int, data.chunk_z.int)
-        chunk = self.chunks.get(chunk_key)
-        if chunk is None:
-            chunk = Chunk(self.min_y, self.height, data.chunk_x.int, data.chunk_z.int)
-            await chunk.set_chunk_sections(data.data)
-            self.chunks[chunk_key] = chunk
-        else:  # update chunk data
-            await chunk.set_chunk_sections(data.data)
+        if self.chunk_store is not None:
+            sections = None
+            if self.executor is not None and not self.chunk_store.is_current(self.dimension, *chunk_key, data.data):
+                sections = await self.decode_chunk_sections(data.data)
+            self.chunks[chunk_key] = self.chunk_store.load(
+                self.dimension,
+                data.chunk_x.int,
+                data.chunk_z.int,
+                self.min_y,
+                self.height,
+                data.data,
+                acquire=chunk_key not in self.chunks,
+                sections=sections,
+            )
+        else:
+            sections = await self.decode_chunk_sections(data.data)
+            chunk = self.chunks.get(chunk_key)
+            if chunk is None:
+                chunk = Chunk(self.min_y, self.height, data.chunk_x.int, data.chunk_z.int)
+                self.chunks[chunk_key] = chunk
+            chunk.chunk_sections = sections  # update chunk data
+        self.chunks[chunk_key].set_light(data)
+        self.chunks[chunk_key].set_heightmaps(data)
 
-        if data.block_entities:
+        if data.block_entities and self.logger.isEnabledFor(DEBUG_PROTOCOL):
             # TODO: Need to finish this.
             for block in data.block_entities:
                 self.logger.log(
                     DEBUG_PROTOCOL,
-                    f'Received block entity: {BLOCKS[block.block_type.int]["name"]} | '
+                    f'Received block entity of type {block.block_type.int} | '
                     f'Position: x={block.packed_xz.x}, y={block.y.int}, z={block.packed_xz.z}',
                 )
 
@@ -505,6 +1212,10 @@ class World(InteractionModule):
     @EventDispatcher.subscribe(UnloadChunkResponse)
     async def _unload_chunk(self, data: UnloadChunkResponse):
         removed_chunk = self.chunks.pop((data.chunk_x.int, data.chunk_z.int), None)
+        if removed_chunk and self.chunk_store is not None:
+            self.chunk_store.release(self.dimension, data.chunk_x.int, data.chunk_z.int)
+        elif removed_chunk:
+            removed_chunk.release_light()
         if removed_chunk:
             self.logger.log(
                 DEBUG_PROTOCOL,
@@ -45,6 +45,37 @@ type_mapping = {
     'string': 'String',
 }
 
+# Fixed-width protocol types and their struct format characters. Consecutive fields of these types are packed and
+# unpacked with a single precompiled Struct instead of one call per field.
+struct_formats = {
+    'u8': 'B',
+    'u16': 'H',
+    'u32': 'I',
+    'u64': 'Q',
+    'i8': 'b',
+    'i16': 'h',
+    'i32': 'i',
+    'i64': 'q',
+    'bool': '?',
+    'f32': 'f',
+    'f64': 'd',
+}
+
+# Attribute holding the python value of a fixed-width MCType, used to feed Struct.pack
+value_attributes = {
+    'UByte': 'int',
+    'UShort': 'int',
+    'UInt': 'int',
+    'ULong': 'int',
+    'Byte': 'int',
+    'Short': 'int',
+    'Int': 'int',
+    'Long': 'int',
+    'Boolean': 'bool',
+    'Float': 'float',
+    'Double': 'float',
+}
+
 
 def get_protocol() -> list[dict]:
     packets = []
@@ -81,11 +112,70 @@ def camel_to_snake(class_name: str) -> str:
     return re.sub(r'(?<!^)(?=[A-Z][a-z])', '_', re.sub(r'([A-Z]+)([A-Z][a-z])', r'\1_\2', class_name)).lower()
 
 
+def parse_fields(packet: dict) -> list[tuple[str, str, str]] | None:
+    """
+    Resolves packet fields to (snake_case_name, protocol_type, mc_type) tuples.
+
+    :return: None if any of the fields has a type that cannot be mapped
+    """
+    fields = []
+    for field in packet['fields']:
+        try:
+            field_type = field['type']
+            if isinstance(field_type, list):
+                field_type = next(iter([t for t in field_type if isinstance(t, str) and t in type_mapping.keys()]))
+            mapped_type = type_mapping[field_type]
+        except Exception:
+            print(f'Cannot parse field {field} in packet {packet["name"]}')
+            return None
+        field_name = field['name']
+        if field_name == 'payload':
+            field_name = 'data'
+        fields.append((camel_to_snake(field_name), field_type, mapped_type))
+    return fields
+
+
+def group_fields(fields: list[tuple[str, str, str]]) -> list[tuple[str | None, list[tuple[str, str, str]]]]:
+    """
+    Splits fields into runs that are encoded together.
+
+    Every run of two or more consecutive fixed-width fields gets a Struct attribute name (`_struct` when the packet
+    has a single run, `_struct_1`, `_struct_2`, ... otherwise), every other field is encoded by its own MCType.
+    """
+    runs: list[list[tuple[str, str, str]]] = []
+    for field in fields:
+        if field[1] in struct_formats and runs and runs[-1][-1][1] in struct_formats:
+            runs[-1].append(field)
+        else:
+            runs.append([field])
+
+    struct_runs = [run for run in runs if len(run) > 1]
+    groups: list[tuple[str | None, list[tuple[str, str, str]]]] = []
+    for run in runs:
+        if len(run) == 1:
+            groups.append((None, run))
+        elif len(struct_runs) == 1:
+            groups.append(('_struct', run))
+        else:
+            groups.append((f'_struct_{struct_runs.index(run) + 1}', run))
+    return groups
+
+
+def struct_attributes(groups: list[tuple[str | None, list[tuple[str, str, str]]]]) -> str:
+    return ''.join(
+        f"\n    {name} = Struct('>{''.join(struct_formats[field[1]] for field in run)}')"
+        for name, run in groups
+        if name is not None
+    )
+
+
 def generate_outbound_schema(parsed_protocol: list[dict]):
     def module_factory() -> str:
-        return """from minemind.states.enums import ConnectionState
-from minemind.states.events import OutboundEvent
+        return """from struct import Struct
+
 from minemind.mc_types import *
+from minemind.protocols.enums import ConnectionState
+from minemind.protocols.protocol_events import OutboundEvent
 
         """
 
@@ -93,37 +183,31 @@ from minemind.mc_types import *
     for packet in parsed_protocol:
         if packet['direction'] == 'toClient':
             continue
-        init_params = []
-        init_attributes = []
-        payload = []
         class_name = underscore_to_class_name(packet['name'])
         if not class_name.endswith('Request'):
             class_name += 'Request'
-        cannot_parse = False
-        for field in packet['fields']:
-            try:
-                field_type = field['type']
-                if isinstance(field_type, list):
-                    field_type = next(iter([t for t in field_type if isinstance(t, str) and t in type_mapping.keys()]))
-                mapped_type = type_mapping[field_type]
-            except Exception:
-                print(f'Cannot parse field {field} in packet {packet["name"]}')
-                cannot_parse = True
-                break
-            field_name = field['name']
-            if field_name == 'payload':
-                field_name = 'data'
+        fields = parse_fields(packet)
+        if fields is None:
+            continue
+        init_params = []
+        init_attributes = []
+        for field_name, _, mapped_type in fields:
             init_params.append(
-                f'{camel_to_snake(field_name)}: {mapped_type},',
+                f'{field_name}: {mapped_type},',
             )
             init_attributes.append(
-                f'        self.{camel_to_snake(field_name)} = {camel_to_snake(field_name)}',
+                f'        self.{field_name} = {field_name}',
             )
-            payload.append(
-                f'self.{camel_to_snake(field_name)}.bytes',
+        groups = group_fields(fields)
+        payload = []
+        for struct_name, run in groups:
+            if struct_name is None:
+                payload.append(f'self.{run[0][0]}.bytes')
+                continue
+            values = ', '.join(
+                f'self.{field_name}.{value_attributes[mapped_type]}' for field_name, _, mapped_type in run
             )
-        if cannot_parse:
-            continue
+            payload.append(f'self.{struct_name}.pack({values})')
         if not packet['fields']:
             modules[
                 packet['state']
@@ -143,7 +227,7 @@ class {class_name}(OutboundEvent):
         ] += f"""
 class {class_name}(OutboundEvent):
     packet_id = {packet['id']}
-    state = ConnectionState.{packet['state'].upper()}
+    state = ConnectionState.{packet['state'].upper()}{struct_attributes(groups)}
 
     def __init__(
         self,
@@ -161,9 +245,12 @@ class {class_name}(OutboundEvent):
 
 def generate_inbound_schema(parsed_protocol: list[dict]):
     def module_factory():
-        return """from minemind.states.enums import ConnectionState
-from minemind.states.events import InboundEvent
+        return """from struct import Struct
+
 from minemind.mc_types import *
+from minemind.mc_types.base import Buffer, SocketReader
+from minemind.protocols.enums import ConnectionState
+from minemind.protocols.protocol_events import InboundEvent
 
             """
 
@@ -171,38 +258,39 @@ from minemind.mc_types import *
     for packet in parsed_protocol:
         if packet['direction'] == 'toServer':
             continue
-        init_params = []
-        init_attributes = []
-        from_stream = []
         class_name = underscore_to_class_name(packet['name'])
         if not class_name.endswith('Response'):
             class_name += 'Response'
-        cannot_parse = False
-        for field in packet['fields']:
-            try:
-                field_type = field['type']
-                if isinstance(field_type, list):
-                    field_type = next(iter([t for t in field_type if isinstance(t, str) and t in type_mapping.keys()]))
-                mapped_type = type_mapping[field_type]
-            except Exception:
-                print(f'Cannot parse field {field} in packet {packet["name"]}')
-                cannot_parse = True
-                break
-            field_name = field['name']
-            if field_name == 'payload':
-                field_name = 'data'
-            snake_case_field = camel_to_snake(field_name)
+        fields = parse_fields(packet)
+        if fields is None:
+            continue
+        init_params = []
+        init_attributes = []
+        from_stream = []
+        for field_name, _, mapped_type in fields:
             init_params.append(
-                f'{snake_case_field}: {mapped_type},',
+                f'{field_name}: {mapped_type},',
             )
             init_attributes.append(
-                f'        self.{snake_case_field} = {snake_case_field}',
+                f'        self.{field_name} = {field_name}',
             )
             from_stream.append(
-                f'{snake_case_field}=await {mapped_type}.from_stream(reader)',
+                f'{field_name}=await {mapped_type}.from_stream(reader)',
             )
-        if cannot_parse:
-            continue
+        groups = group_fields(fields)
+        decode = []
+        decoded_fields = []
+        for struct_name, run in groups:
+            if struct_name is None:
+                field_name, _, mapped_type = run[0]
+                decode.append(f'        {field_name}, offset = {mapped_type}.decode(buffer, offset)')
+                decoded_fields.append(f'{field_name}={field_name}')
+                continue
+            decode.append(
+                f'        {", ".join(field[0] for field in run)} = cls.{struct_name}.unpack_from(buffer, offset)',
+            )
+            decode.append(f'        offset += cls.{struct_name}.size')
+            decoded_fields.extend(f'{field_name}={mapped_type}({field_name})' for field_name, _, mapped_type in run)
         if not packet['fields']:
             modules[
                 packet['state']
@@ -216,13 +304,15 @@ class {class_name}(InboundEvent):
         init_params_str = ' '.join(init_params)
         init_attributes_str = '\n'.join(init_attributes)
         from_stream_str = ','.join(from_stream)
+        decode_str = '\n'.join(decode)
+        decoded_fields_str = ', '.join(decoded_fields)
 
         modules[
             packet['state']
         ] += f"""
 class {class_name}(InboundEvent):
     packet_id = {packet['id']}
-    state = ConnectionState.{packet['state'].upper()}
+    state = ConnectionState.{packet['state'].upper()}{struct_attributes(groups)}
 
     def __init__(
         self,
@@ -236,6 +326,11 @@ class {class_name}(InboundEvent):
             {from_stream_str}
         )
 
+    @classmethod
+    def decode(cls, buffer: Buffer, offset: int = 0) -> tuple['{class_name}', int]:
+{decode_str}
+        return cls({decoded_fields_str}), offset
+
         """
     return modules
 
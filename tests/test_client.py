@@ -0,0 +1,80 @@
+import asyncio
+import zlib
+from random import Random
+
+from minemind.client import Client, CompressionSettings
+from minemind.mc_types import Long
+from minemind.protocols.v765.outbound.play import KeepAliveRequest
+
+
+class SlowWriter:
+    """Writer whose drain waits until it is released, like a socket under backpressure."""
+
+    def __init__(self):
+        self.data = bytearray()
+        self.released = asyncio.Event()
+        self.error: Exception | None = None
+
+    def write(self, data: bytes) -> None:
+        self.data += data
+
+    async def drain(self) -> None:
+        await self.released.wait()
+        if self.error is not None:
+            raise self.error
+
+
+async def settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_packets_sent_while_draining_are_flushed():
+    async def run():
+        client = Client()
+        client.writer = writer = SlowWriter()
+        await client.send_packet(KeepAliveRequest(Long(1)))
+        await asyncio.sleep(0)  # The scheduled flush now waits in drain
+        await client.send_packet(KeepAliveRequest(Long(2)))
+        writer.released.set()
+        await settle()
+        return client, writer
+
+    client, writer = asyncio.run(run())
+    assert client.write_buffer == bytearray()
+    assert client._flush_task is None
+    assert len(writer.data) == 20  # Two keep alive frames of 10 bytes
+
+
+def test_failed_scheduled_flush_is_cleared():
+    async def run():
+        client = Client()
+        client.writer = writer = SlowWriter()
+        writer.error = ConnectionResetError('Connection reset')
+        await client.send_packet(KeepAliveRequest(Long(1)))
+        writer.released.set()
+        await settle()
+        return client
+
+    assert asyncio.run(run())._flush_task is None
+
+
+def test_stored_packet_type_is_sampled_again():
+    client = Client(compression=CompressionSettings(sample_packets=4, resample_packets=8))
+    event = KeepAliveRequest(Long(1))
+    random = Random(0)
+    for _ in range(4):
+        client.compress(event, random.randbytes(512))
+    for _ in range(8):
+        data = bytes(512)
+        assert zlib.decompress(client.compress(event, data)) == data
+    stats = client.compression_stats[KeepAliveRequest]
+    assert stats.stored == 8
+    assert stats.ratio > 1  # Stored packets don't count
+
+    # Payloads compress well now, the type is compressed again after the next sample
+    for _ in range(4):
+        client.compress(event, bytes(512))
+    stats = client.compression_stats[KeepAliveRequest]
+    assert stats.stored == 0
+    assert len(client.compress(event, bytes(512))) < 64
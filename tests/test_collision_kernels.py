@@ -0,0 +1,85 @@
+from array import array
+from functools import reduce
+from random import Random
+from types import SimpleNamespace
+
+import pytest
+
+from minemind.mc_types.base import Vector3
+from minemind.protocols.v765 import physics
+from minemind.protocols.v765.physics import AABB, PlayerPhysicsSimulation
+
+
+def random_boxes(rng: Random, count: int) -> array:
+    # Block aligned boxes of full blocks, slabs and fences, so the player touches their faces exactly
+    boxes = array('d')
+    for _ in range(count):
+        x, y, z = rng.randint(-3, 3), rng.randint(-3, 3), rng.randint(-3, 3)
+        boxes.extend([x, y, z, x + 1, y + rng.choice([0.5, 1, 1.5]), z + 1])
+    return boxes
+
+
+def random_bb(rng: Random) -> AABB:
+    position = Vector3(rng.choice([-1, 0, 0.5, rng.uniform(-2, 2)]), rng.choice([0, 0.5, rng.uniform(-2, 2)]), 0.3)
+    return PlayerPhysicsSimulation.get_player_bb(position)
+
+
+def to_aabbs(boxes: array) -> list[AABB]:
+    return [AABB(*boxes[start : start + 6]) for start in range(0, len(boxes), 6)]
+
+
+def reference_offset(method: str):
+    def get_offset(boxes: array, bb: AABB, offset: float) -> float:
+        return reduce(lambda offset, box: getattr(box, method)(bb, offset), to_aabbs(boxes), offset)
+
+    return get_offset
+
+
+@pytest.mark.parametrize('axis', ['x', 'y', 'z'])
+def test_get_offset_matches_aabb(axis: str):
+    rng = Random(axis)
+    kernel, reference = getattr(physics, f'get_offset_{axis}'), reference_offset(f'get_offset_{axis}')
+    for _ in range(2_000):
+        boxes, bb = random_boxes(rng, rng.randint(0, 40)), random_bb(rng)
+        offset = rng.choice([0, 0.5, -0.5, 1.5, -1.5, rng.uniform(-3, 3)])
+        assert kernel(boxes, bb, offset) == reference(boxes, bb, offset)
+
+
+def test_intersects_any_matches_aabb():
+    rng = Random(0)
+    for _ in range(2_000):
+        boxes, bb = random_boxes(rng, rng.randint(0, 40)), random_bb(rng)
+        assert physics.intersects_any(boxes, bb) == any(box.intersects(bb) for box in to_aabbs(boxes))
+
+
+def move(boxes: array, position: Vector3, velocity: Vector3, on_ground: bool) -> tuple:
+    simulation = PlayerPhysicsSimulation.__new__(PlayerPhysicsSimulation)
+    simulation.world = SimpleNamespace(get_block_at=lambda position: None)
+    simulation.get_surrounding_boxes = lambda query_bb: boxes  # type: ignore[method-assign]
+    simulation.position, simulation.velocity = position.copy(), velocity.copy()
+    simulation.on_ground, simulation.is_in_web = on_ground, False
+    simulation.move_entity()
+    return (
+        simulation.position.x,
+        simulation.position.y,
+        simulation.position.z,
+        simulation.velocity.x,
+        simulation.velocity.y,
+        simulation.velocity.z,
+        simulation.on_ground,
+        simulation.is_collided_horizontally,
+    )
+
+
+def test_move_entity_matches_aabb(monkeypatch: pytest.MonkeyPatch):
+    rng = Random(0)
+    cases = []
+    for _ in range(1_000):
+        bb = random_bb(rng)
+        position = Vector3((bb.min_x + bb.max_x) / 2, bb.min_y, (bb.min_z + bb.max_z) / 2)
+        velocity = Vector3(rng.uniform(-1, 1), rng.uniform(-1.5, 1), rng.uniform(-1, 1))
+        cases.append((random_boxes(rng, rng.randint(0, 40)), position, velocity, rng.random() < 0.5))
+    moved = [move(*case) for case in cases]
+    for axis in 'xyz':
+        monkeypatch.setattr(physics, f'get_offset_{axis}', reference_offset(f'get_offset_{axis}'))
+    assert moved == [move(*case) for case in cases]
@@ -0,0 +1,49 @@
+import pickle
+from pathlib import Path
+
+import pytest
+
+from minemind.protocols.v765 import constants
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setattr(constants, 'CACHE_DIR', tmp_path)
+    return tmp_path
+
+
+class Builder:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self) -> dict[str, int]:
+        self.calls += 1
+        return {'calls': self.calls}
+
+
+def write_cache(path: Path, key: object, value: bytes) -> None:
+    with open(path, 'wb') as file:
+        pickle.dump(key, file, pickle.HIGHEST_PROTOCOL)
+        file.write(value)
+
+
+def test_cached_value_is_reused(cache_dir: Path):
+    build = Builder()
+    assert constants.load_cached('items', ('items.json',), build) == {'calls': 1}
+    assert constants.load_cached('items', ('items.json',), build) == {'calls': 1}
+    assert build.calls == 1
+
+
+def test_value_of_removed_class_is_built_again(cache_dir: Path):
+    build = Builder()
+    key = (*constants.get_cache_key(('items.json',)), constants.get_source_hash(Builder.__module__))
+    write_cache(cache_dir / 'items.pickle', key, pickle.dumps(build).replace(b'Builder', b'Removed'))
+    assert constants.load_cached('items', ('items.json',), build) == {'calls': 1}
+    assert constants.load_cached('items', ('items.json',), build) == {'calls': 1}
+
+
+def test_value_of_changed_builder_is_built_again(cache_dir: Path):
+    build = Builder()
+    key = (*constants.get_cache_key(('items.json',)), 'hash of another builder')
+    write_cache(cache_dir / 'items.pickle', key, pickle.dumps({'calls': 0}))
+    assert constants.load_cached('items', ('items.json',), build) == {'calls': 1}
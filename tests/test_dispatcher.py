@@ -0,0 +1,60 @@
+import asyncio
+
+from minemind.dispatcher import EventDispatcher, OverflowPolicy, PacketQueue, WorkerSettings
+from minemind.mc_types import VarInt
+
+TELEPORT = 0x6D  # Absolute entity position
+MOVE = 0x2C  # Relative entity move
+
+SETTINGS = WorkerSettings(
+    workers=1,
+    queue_size=3,
+    overflow=OverflowPolicy.DROP,
+    ordering_keys={TELEPORT: lambda raw_data: raw_data[0], MOVE: lambda raw_data: raw_data[0]},
+    coalesced=frozenset({TELEPORT}),
+)
+
+
+def queued(dispatcher: EventDispatcher) -> list[tuple[int, bytes]]:
+    return [
+        (packet.packet_id.int, bytes(packet.raw_data)) for packet in dispatcher.queues[0]._queue if not packet.stale
+    ]
+
+
+def run_enqueue(packets: list[tuple[int, bytes]]) -> EventDispatcher:
+    async def run():
+        dispatcher = EventDispatcher(None, SETTINGS)  # type: ignore[arg-type]
+        dispatcher.queues = [PacketQueue(SETTINGS.queue_size)]
+        for packet_id, raw_data in packets:
+            await dispatcher.enqueue(VarInt(packet_id), memoryview(raw_data))
+        return dispatcher
+
+    return asyncio.run(run())
+
+
+def test_dropped_absolute_update_stays_after_earlier_moves():
+    dispatcher = run_enqueue([(TELEPORT, b'\x01old'), (MOVE, b'\x01a'), (MOVE, b'\x01b'), (TELEPORT, b'\x01new')])
+    assert queued(dispatcher) == [(MOVE, b'\x01a'), (MOVE, b'\x01b'), (TELEPORT, b'\x01new')]
+    assert dispatcher.dropped == 1
+    assert dispatcher.pending[(TELEPORT, 1)].raw_data == b'\x01new'
+
+
+def test_absolute_update_waits_when_nothing_is_stale():
+    dispatcher = EventDispatcher(None, SETTINGS)  # type: ignore[arg-type]
+
+    async def run():
+        queue = PacketQueue(SETTINGS.queue_size)
+        dispatcher.queues = [queue]
+        for packet_id, raw_data in [(MOVE, b'\x02a'), (TELEPORT, b'\x03only'), (MOVE, b'\x02b')]:
+            await dispatcher.enqueue(VarInt(packet_id), memoryview(raw_data))
+        task = asyncio.create_task(dispatcher.enqueue(VarInt(TELEPORT), memoryview(b'\x01new')))
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert not task.done()  # Neither the moves nor the only teleport of entity 3 are dropped
+        queue.get_nowait()
+        queue.task_done()
+        await task
+
+    asyncio.run(run())
+    assert queued(dispatcher) == [(TELEPORT, b'\x03only'), (MOVE, b'\x02b'), (TELEPORT, b'\x01new')]
+    assert dispatcher.dropped == 0
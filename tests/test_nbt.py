@@ -0,0 +1,87 @@
+import asyncio
+from array import array
+from struct import pack
+from typing import Any
+
+import pytest
+
+from minemind.mc_types import nbt
+from minemind.mc_types.base import AsyncBytesIO
+
+
+def named(tag_type: int, name: str, payload: bytes) -> bytes:
+    return bytes([tag_type]) + pack('>H', len(name)) + name.encode() + payload
+
+
+def compound(*tags: bytes) -> bytes:
+    return b'\x0a' + b''.join(tags) + b'\x00'
+
+
+LINE = named(nbt.TAG_BYTE, 'glow', b'\x01') + b'\x00'  # Compound payload, list elements have no tag type and name
+
+SAMPLE = compound(
+    named(nbt.TAG_STRING, 'id', pack('>H', 4) + b'sign'),
+    named(nbt.TAG_LIST, 'pos', bytes([nbt.TAG_DOUBLE]) + pack('>i3d', 3, 1.5, 64, -2.5)),
+    named(nbt.TAG_LIST, 'lines', bytes([nbt.TAG_COMPOUND]) + pack('>i', 1) + LINE),
+    named(nbt.TAG_BYTE_ARRAY, 'bytes', pack('>i', 2) + b'ab'),
+    named(nbt.TAG_INT_ARRAY, 'ints', pack('>i2i', 2, 1, -1)),
+    named(nbt.TAG_LONG_ARRAY, 'longs', pack('>i1q', 1, 1 << 40)),
+)
+
+
+def test_decode_value():
+    value, offset = nbt.NBT.decode_value(SAMPLE)
+    assert value == {
+        'id': 'sign',
+        'pos': [1.5, 64.0, -2.5],
+        'lines': [{'glow': 1}],
+        'bytes': b'ab',
+        'ints': array('i', [1, -1]),
+        'longs': array('q', [1 << 40]),
+    }
+    assert offset == len(SAMPLE) == nbt.NBT.skip(SAMPLE)
+
+
+@pytest.mark.parametrize(
+    'data',
+    [
+        compound(named(nbt.TAG_BYTE_ARRAY, '', pack('>i', -7))),
+        compound(named(nbt.TAG_INT_ARRAY, '', pack('>i', -1))),
+        compound(named(nbt.TAG_LONG_ARRAY, '', pack('>i', -1))),
+        compound(named(nbt.TAG_LIST, '', bytes([nbt.TAG_INT]) + pack('>i', -1))),
+        compound(named(nbt.TAG_LIST, '', bytes([nbt.TAG_COMPOUND]) + pack('>i', -1))),
+    ],
+    ids=['byte array', 'int array', 'long array', 'number list', 'compound list'],
+)
+def test_negative_length_is_rejected(data: bytes):
+    with pytest.raises(ValueError):
+        nbt.NBT.decode_value(data)
+    with pytest.raises(ValueError):
+        nbt.NBT.skip(data)
+
+
+def test_negative_byte_array_length_does_not_loop():
+    data = bytes.fromhex('0a 07 0000 fffffff9 00')
+    with pytest.raises(ValueError):
+        nbt.NBT.skip(data)
+    with pytest.raises(ValueError):
+        nbt.NBT.decode_value(data)
+
+
+@pytest.mark.parametrize(
+    'data, is_anonymous',
+    [(SAMPLE, True), (b'\x00', True), (named(nbt.TAG_COMPOUND, 'root', LINE), False)],
+    ids=['compound', 'empty', 'named'],
+)
+def test_stream_matches_buffer(data: bytes, is_anonymous: bool):
+    buffer = data + b'rest'
+
+    async def read() -> tuple[bytes | None, Any]:
+        raw = await nbt.NBT.read_raw_from_stream(AsyncBytesIO(buffer), is_anonymous)
+        value = await nbt.NBT.value_from_stream(AsyncBytesIO(buffer), is_anonymous)
+        return raw, value
+
+    assert asyncio.run(read()) == (
+        nbt.NBT.read_raw(buffer, 0, is_anonymous)[0],
+        nbt.NBT.decode_value(buffer, 0, is_anonymous)[0],
+    )
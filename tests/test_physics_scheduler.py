@@ -0,0 +1,99 @@
+import asyncio
+from array import array
+from random import Random
+from types import SimpleNamespace
+
+from minemind.mc_types import Array
+from minemind.mc_types.base import Vector3
+from minemind.protocols.v765.physics import PhysicsScheduler, PlayerPhysicsSimulation, WorldCache
+from minemind.protocols.v765.world import Chunk, ChunkSection, PalettedContainer, World
+
+# Air, stone, bottom oak slab, oak fence, water source and falling water
+PALETTE = array('q', [0, 1, 11165, 5848, 80, 88])
+
+
+class FakePhysics:
+    def __init__(self, username: str, use_physics: bool = True):
+        self.bot = SimpleNamespace(username=username)
+        self.client = SimpleNamespace(send_packet=self.send_packet)
+        self.use_physics = use_physics
+        self.world_caches: list[WorldCache | None] = []
+        self.sent: list[object] = []
+
+    def step(self, world_cache: WorldCache | None = None) -> object:
+        self.world_caches.append(world_cache)
+        return object()
+
+    async def send_packet(self, packet: object) -> None:
+        self.sent.append(packet)
+
+
+def test_tick_shares_world_cache_and_sends_positions():
+    scheduler = PhysicsScheduler()
+    bots = [FakePhysics('Alex'), FakePhysics('Steve'), FakePhysics('Idle', use_physics=False)]
+    for physics in bots:
+        scheduler.physics.add(physics)  # type: ignore[arg-type]
+    asyncio.run(scheduler.tick())
+    alex, steve, idle = bots
+    assert len(alex.sent) == len(steve.sent) == 1 and not idle.sent
+    assert alex.world_caches[0] is steve.world_caches[0] is not None
+    asyncio.run(scheduler.tick())
+    assert alex.world_caches[1] is not alex.world_caches[0]  # Blocks may change between ticks
+
+
+def build_world(rng: Random) -> World:
+    world = World(None)  # type: ignore[arg-type]
+    world.min_y, world.height = 0, 16
+    for chunk_x in range(-1, 1):
+        for chunk_z in range(-1, 1):
+            data = array('H', bytes(2 * 4096))
+            for index in range(4096):
+                y = index >> 8
+                if y < 4:
+                    data[index] = 1
+                elif y < 8:
+                    data[index] = rng.choice([0, 0, 0, 1, 2, 3, 4, 5])
+            block_states = PalettedContainer(
+                PalettedContainer.PaletteType.INDIRECT,
+                PalettedContainer.PaletteCategory.BLOCK,
+                4,
+                PALETTE,
+                data,
+            )
+            chunk = Chunk(0, 16, chunk_x, chunk_z)
+            chunk.chunk_sections = Array([ChunkSection(4096, block_states, None)])  # type: ignore[arg-type]
+            world.chunks[(chunk_x, chunk_z)] = chunk
+    return world
+
+
+def simulate(world: World, world_cache: WorldCache | None, position: Vector3, velocity: Vector3):
+    simulation = PlayerPhysicsSimulation(
+        world=world,
+        position=position,
+        velocity=velocity,
+        yaw=0,
+        pitch=0,
+        on_ground=False,
+        jump_ticks=0,
+        is_in_web=False,
+        is_elytra_flying=False,
+        is_collided_horizontally=False,
+        is_collided_vertically=False,
+        world_cache=world_cache,
+    )
+    simulation.simulate()
+    return simulation.position, simulation.velocity, simulation.on_ground, simulation.is_in_water
+
+
+def test_world_cache_matches_world_lookups():
+    rng = Random(0)
+    world = build_world(rng)
+    bots = [(Vector3(rng.uniform(-6, 6), 9, rng.uniform(-6, 6)), Vector3(rng.uniform(-1, 1), 0, 0)) for _ in range(8)]
+    cached = [(position.copy(), velocity.copy()) for position, velocity in bots]
+    for _ in range(20):
+        world_cache = WorldCache()
+        for i in range(len(bots)):
+            result = simulate(world, None, *bots[i])
+            cached_result = simulate(world, world_cache, *cached[i])
+            assert repr(result) == repr(cached_result)
+            bots[i], cached[i] = result[:2], cached_result[:2]
@@ -0,0 +1,56 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from minemind.protocols.v765 import constants, registry
+from minemind.protocols.v765.world import PalettedContainer
+
+
+@pytest.fixture(scope='module')
+def registry_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    path = tmp_path_factory.mktemp('registry') / 'registry.bin'
+    registry.compile_registry(path)
+    return path
+
+
+def test_biomes_match_game_data(registry_path: Path):
+    compiled = registry.Registry(registry_path)
+    assert compiled.biome_count == len(constants.BIOMES)
+    for biome in constants.BIOMES:
+        assert compiled.get_biome(biome['id']) == biome
+    assert compiled.get_biome(compiled.biome_count) is None and compiled.get_biome(-1) is None
+
+
+@pytest.mark.parametrize('damage', ['truncated', 'empty', 'missing section', 'foreign'])
+def test_damaged_registry_is_compiled_again(registry_path: Path, tmp_path: Path, damage: str):
+    path = tmp_path / 'registry.bin'
+    data = registry_path.read_bytes()
+    if damage == 'truncated':
+        data = data[: len(data) // 2]
+    elif damage == 'empty':
+        data = b''
+    elif damage == 'missing section':
+        header_size = registry._HEADER.unpack_from(data)[1]
+        header = json.loads(data[registry._HEADER.size : registry._HEADER.size + header_size])
+        del header['sections']['biomes']
+        encoded = json.dumps(header).encode('utf-8').ljust(header_size)
+        data = data[: registry._HEADER.size] + encoded + data[registry._HEADER.size + header_size :]
+    else:
+        data = b'\x00' * len(data)
+    path.write_bytes(data)
+    assert registry.open_registry(path).get_biome(0) == constants.BIOMES[0]
+
+
+def test_shared_registry_does_not_load_blocks(registry_path: Path):
+    code = f'''
+from pathlib import Path
+from minemind.protocols.v765 import constants, registry
+from minemind.protocols.v765.world import PalettedContainer
+registry.use_shared_registry(Path({str(registry_path)!r}))
+assert PalettedContainer.MAX_BITS_PER_BLOCK == {PalettedContainer.MAX_BITS_PER_BLOCK}
+assert 'BLOCKS' not in vars(constants)
+'''
+    subprocess.run([sys.executable, '-c', code], check=True)
@@ -0,0 +1,29 @@
+import pickle
+import struct
+from random import Random
+
+from minemind.mc_types import VarInt
+from minemind.protocols.v765.world import decode_chunk_sections
+
+
+def raw_section(rng: Random) -> bytes:
+    # Indirect block palette of 4 bits per entry, single valued biomes
+    entries = [rng.randrange(16) for _ in range(4096)]
+    longs = [
+        sum(entry << (4 * i) for i, entry in enumerate(entries[start : start + 16])) for start in range(0, 4096, 16)
+    ]
+    block_states = bytes([4]) + bytes(VarInt(16)) + b''.join(bytes(VarInt(state_id)) for state_id in range(1, 17))
+    block_states += bytes(VarInt(len(longs))) + struct.pack(f'>{len(longs)}Q', *longs)
+    return struct.pack('>h', 4096) + block_states + bytes([0]) + bytes(VarInt(1)) + bytes(VarInt(0))
+
+
+def test_unpacked_sections_match_lazy_sections():
+    rng = Random(0)
+    data = b''.join(raw_section(rng) for _ in range(4))
+    # Unpacked sections are sent back from the executor, so they are pickled
+    unpacked = pickle.loads(pickle.dumps(decode_chunk_sections(data, 4, unpack=True)))
+    lazy = decode_chunk_sections(data, 4)
+    for section, lazy_section in zip(unpacked, lazy):
+        assert section.block_states.longs is None and section.biomes.longs is None
+        assert section.block_states.data == lazy_section.block_states.data
+        assert list(section.block_states.get_state_ids()) == list(lazy_section.block_states.get_state_ids())